@@ -622,7 +622,7 @@ export const deleteSuggestion = async (
         credentials: credentials,
       }),
     });
-    return response.status === 200;
+    return response.status === 204;
   } catch (error) {
     console.error("Error deleting suggestion", error);
     return false;
@@ -312,7 +312,7 @@ const ChatInterface: React.FC<ChatInterfaceProps> = ({
         conversation: filteredMessages,
         rag_config: RAGConfig,
       });
-      socket.send(data);
+      socket.send(new TextEncoder().encode(data));
     } else {
       console.error("WebSocket is not open. ReadyState:", socket?.readyState);
     }
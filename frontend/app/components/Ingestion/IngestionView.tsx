@@ -203,7 +203,8 @@ const IngestionView: React.FC<IngestionViewProps> = ({
   const sendDataBatches = (data: string, fileID: string) => {
     if (socket?.readyState === WebSocket.OPEN) {
       setInitialStatus(fileID);
-      const chunkSize = 2000; // Define chunk size (in bytes)
+      // Large chunks keep the number of WebSocket messages (and per-message overhead) low
+      const chunkSize = 256 * 1024; // Define chunk size (in characters)
       const batches = [];
       let offset = 0;
 
@@ -216,17 +217,20 @@ const IngestionView: React.FC<IngestionViewProps> = ({
 
       const totalBatches = batches.length;
 
-      // Send the batches
+      // Send the batches as binary frames so the server can skip UTF-8 validation
+      const encoder = new TextEncoder();
       batches.forEach((chunk, order) => {
         socket.send(
-          JSON.stringify({
-            chunk: chunk,
-            isLastChunk: order === totalBatches - 1,
-            total: totalBatches,
-            order: order,
-            fileID: fileID,
-            credentials: credentials,
-          })
+          encoder.encode(
+            JSON.stringify({
+              chunk: chunk,
+              isLastChunk: order === totalBatches - 1,
+              total: totalBatches,
+              order: order,
+              fileID: fileID,
+              credentials: credentials,
+            })
+          )
         );
       });
     } else {
@@ -2,14 +2,31 @@
 ConversationManager module for managing conversation context during resume generation.
 
 This module provides functionality to store, retrieve, and manage conversation
-history for iterative resume refinement sessions.
+history for iterative resume refinement sessions. Sessions live in a
+SessionStore: in process memory by default, or in Redis when
+VERBA_SESSION_REDIS_URL is set so that several workers share them.
 """
 
+import os
+import time
+import orjson
 from wasabi import msg
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
+from collections import OrderedDict
 import uuid
+from abc import ABC, abstractmethod
+
+# Optional import, only needed for the Redis session store
+try:
+    import redis.asyncio as redis_asyncio
+    from redis.exceptions import WatchError
+except ImportError:
+    redis_asyncio = None
+
+# Sessions idle for this long are dropped by either store
+SESSION_TTL_SECONDS = 24 * 3600
 
 
 @dataclass
@@ -28,6 +45,16 @@ class ConversationMessage:
             "timestamp": self.timestamp.isoformat(),
             "metadata": self.metadata
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConversationMessage":
+        """Create a message from the dictionary produced by to_dict."""
+        return cls(
+            role=data["role"],
+            content=data["content"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            metadata=data.get("metadata") or {}
+        )
 
 
 @dataclass
@@ -52,6 +79,475 @@ class ConversationSession:
         }
 
 
+class SessionStore(ABC):
+    """
+    Storage backend for conversation sessions.
+    
+    ConversationManager keeps the session rules (roles, pruning, output
+    formats) and delegates persistence to a store, so the backend can be
+    swapped without touching the API endpoints.
+    """
+    
+    @abstractmethod
+    async def create(self, session: ConversationSession) -> bool:
+        """
+        Store a new session.
+        
+        Args:
+            session: The session to store
+            
+        Returns:
+            bool: True if created, False if the session ID already exists
+        """
+    
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[ConversationSession]:
+        """
+        Load a session with its messages.
+        
+        Args:
+            session_id: The session ID
+            
+        Returns:
+            ConversationSession or None if not found
+        """
+    
+    @abstractmethod
+    async def append(
+        self,
+        session_id: str,
+        message: ConversationMessage,
+        max_messages: int
+    ) -> Optional[int]:
+        """
+        Append a message and keep only the newest max_messages.
+        
+        Args:
+            session_id: The session ID
+            message: The message to append
+            max_messages: Number of most recent messages to keep
+            
+        Returns:
+            Number of messages kept, or None if the session was not found
+        """
+    
+    @abstractmethod
+    async def reset(self, session_id: str) -> Optional[int]:
+        """
+        Remove all messages from a session.
+        
+        Args:
+            session_id: The session ID
+            
+        Returns:
+            Number of messages removed, or None if the session was not found
+        """
+    
+    @abstractmethod
+    async def update_metadata(self, session_id: str, metadata: Dict[str, Any]) -> bool:
+        """
+        Merge metadata into a session.
+        
+        Args:
+            session_id: The session ID
+            metadata: Metadata to merge with the existing metadata
+            
+        Returns:
+            bool: True if successful, False if session not found
+        """
+    
+    @abstractmethod
+    async def delete(self, session_id: str) -> bool:
+        """
+        Delete a session and its messages.
+        
+        Args:
+            session_id: The session ID
+            
+        Returns:
+            bool: True if deleted, False if session not found
+        """
+    
+    @abstractmethod
+    async def session_ids(self) -> List[str]:
+        """
+        List the IDs of all stored sessions.
+        
+        Returns:
+            List[str]: Session IDs
+        """
+    
+    @abstractmethod
+    async def cleanup(self, max_age_hours: int) -> int:
+        """
+        Remove sessions that haven't been updated in a specified time.
+        
+        Args:
+            max_age_hours: Maximum age in hours before cleanup
+            
+        Returns:
+            int: Number of sessions cleaned up
+        """
+    
+    @abstractmethod
+    async def stats(self) -> Dict[str, Any]:
+        """
+        Report store size and lookup counters for tuning.
+        
+        Returns:
+            Dict with the backend name, session count, hits and misses
+        """
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Keeps sessions in this process, bounded by count and idle time.
+    
+    Sessions are ordered by last access, so the least recently used session
+    is evicted once max_sessions is reached, and sessions idle for longer
+    than ttl_seconds are dropped from the front of the order.
+    """
+    
+    def __init__(
+        self,
+        max_sessions: int = 10_000,
+        ttl_seconds: int = SESSION_TTL_SECONDS
+    ):
+        """
+        Initialize InMemorySessionStore.
+        
+        Args:
+            max_sessions: Maximum number of sessions kept (default: 10,000)
+            ttl_seconds: Idle time after which a session expires (default: 24 hours)
+        """
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.sessions: OrderedDict[str, ConversationSession] = OrderedDict()
+        self._last_access: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def _expire(self):
+        """Drop sessions idle for longer than the TTL, oldest first."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self.sessions:
+            session_id = next(iter(self.sessions))
+            if self._last_access[session_id] > cutoff:
+                break
+            self._remove(session_id)
+    
+    def _remove(self, session_id: str) -> bool:
+        self._last_access.pop(session_id, None)
+        return self.sessions.pop(session_id, None) is not None
+    
+    def _lookup(self, session_id: str) -> Optional[ConversationSession]:
+        """Return a live session and mark it most recently used."""
+        self._expire()
+        session = self.sessions.get(session_id)
+        if session is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self.sessions.move_to_end(session_id)
+        self._last_access[session_id] = time.monotonic()
+        return session
+    
+    async def create(self, session: ConversationSession) -> bool:
+        self._expire()
+        if session.session_id in self.sessions:
+            return False
+        
+        while len(self.sessions) >= self.max_sessions:
+            evicted_id = next(iter(self.sessions))
+            self._remove(evicted_id)
+            msg.info(f"Evicted least recently used session {evicted_id}")
+        
+        self.sessions[session.session_id] = session
+        self._last_access[session.session_id] = time.monotonic()
+        return True
+    
+    async def get(self, session_id: str) -> Optional[ConversationSession]:
+        return self._lookup(session_id)
+    
+    async def append(
+        self,
+        session_id: str,
+        message: ConversationMessage,
+        max_messages: int
+    ) -> Optional[int]:
+        session = self._lookup(session_id)
+        if session is None:
+            return None
+        
+        session.messages.append(message)
+        session.updated_at = datetime.now()
+        
+        if len(session.messages) > max_messages:
+            removed_count = len(session.messages) - max_messages
+            session.messages = session.messages[-max_messages:]
+            msg.info(f"Pruned {removed_count} old messages from session {session_id}")
+        
+        return len(session.messages)
+    
+    async def reset(self, session_id: str) -> Optional[int]:
+        session = self._lookup(session_id)
+        if session is None:
+            return None
+        
+        message_count = len(session.messages)
+        session.messages = []
+        session.updated_at = datetime.now()
+        return message_count
+    
+    async def update_metadata(self, session_id: str, metadata: Dict[str, Any]) -> bool:
+        session = self._lookup(session_id)
+        if session is None:
+            return False
+        
+        session.metadata.update(metadata)
+        session.updated_at = datetime.now()
+        return True
+    
+    async def delete(self, session_id: str) -> bool:
+        return self._remove(session_id)
+    
+    async def session_ids(self) -> List[str]:
+        self._expire()
+        return list(self.sessions.keys())
+    
+    async def cleanup(self, max_age_hours: int) -> int:
+        now = datetime.now()
+        sessions_to_delete = [
+            session_id
+            for session_id, session in self.sessions.items()
+            if (now - session.updated_at).total_seconds() / 3600 > max_age_hours
+        ]
+        
+        for session_id in sessions_to_delete:
+            self._remove(session_id)
+        
+        return len(sessions_to_delete)
+    
+    async def stats(self) -> Dict[str, Any]:
+        self._expire()
+        return {
+            "backend": "memory",
+            "size": len(self.sessions),
+            "max_sessions": self.max_sessions,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Keeps sessions in Redis so every worker process sees the same sessions.
+    
+    Each session is a hash holding its fields and metadata, plus a list of
+    orjson-encoded messages. Both keys expire after ttl_seconds without an
+    update, which replaces the in-memory age-based cleanup.
+    """
+    
+    REQUIRED_FIELDS = (b"created_at", b"updated_at", b"metadata", b"max_exchanges")
+    
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: int = SESSION_TTL_SECONDS,
+        key_prefix: str = "verba:session"
+    ):
+        """
+        Initialize RedisSessionStore.
+        
+        Args:
+            url: Redis connection URL, e.g. redis://localhost:6379/0
+            ttl_seconds: Idle time after which a session expires (default: 24 hours)
+            key_prefix: Prefix for the Redis keys
+            
+        Raises:
+            Exception: If the redis package is not installed
+        """
+        if redis_asyncio is None:
+            raise Exception(
+                "The redis package is required for VERBA_SESSION_REDIS_URL, "
+                "install it with: pip install goldenverba[redis]"
+            )
+        self.redis = redis_asyncio.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+    
+    def _meta_key(self, session_id: str) -> str:
+        return f"{self.key_prefix}:meta:{session_id}"
+    
+    def _messages_key(self, session_id: str) -> str:
+        return f"{self.key_prefix}:messages:{session_id}"
+    
+    async def _transaction(self, session_id: str, queue) -> Optional[list]:
+        """
+        Run queued commands in one MULTI only if the session still exists.
+        
+        The meta key is WATCHed, so if it is changed, deleted or expires
+        before EXEC the transaction is retried, and a vanished session is
+        never recreated by the queued writes.
+        
+        Args:
+            session_id: The session ID
+            queue: Called with the pipeline and the stored metadata to queue commands
+            
+        Returns:
+            The EXEC results, or None if the session was not found
+        """
+        meta_key = self._meta_key(session_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(meta_key)
+                    # Every complete session has metadata, so this also checks existence
+                    metadata = await pipe.hget(meta_key, "metadata")
+                    if metadata is None:
+                        return None
+                    pipe.multi()
+                    queue(pipe, metadata)
+                    return await pipe.execute()
+                except WatchError:
+                    continue
+    
+    def _touch(self, pipe, session_id: str):
+        """Queue an updated_at bump and TTL refresh for both session keys."""
+        pipe.hset(self._meta_key(session_id), "updated_at", datetime.now().isoformat())
+        pipe.expire(self._meta_key(session_id), self.ttl_seconds)
+        pipe.expire(self._messages_key(session_id), self.ttl_seconds)
+    
+    async def create(self, session: ConversationSession) -> bool:
+        meta_key = self._meta_key(session.session_id)
+        fields = {
+            "session_id": session.session_id,
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": orjson.dumps(session.metadata),
+            "max_exchanges": session.max_exchanges,
+        }
+        
+        # One MULTI so a crash can't leave a claimed ID without its fields or
+        # TTL. HSETNX never overwrites, so a session that already exists is
+        # left intact and the first result reports whether the ID was free
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for name, value in fields.items():
+                pipe.hsetnx(meta_key, name, value)
+            pipe.expire(meta_key, self.ttl_seconds)
+            results = await pipe.execute()
+        return bool(results[0])
+    
+    async def get(self, session_id: str) -> Optional[ConversationSession]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(self._meta_key(session_id))
+            pipe.lrange(self._messages_key(session_id), 0, -1)
+            meta, messages = await pipe.execute()
+        
+        # A hash missing its fields is a partial write, not a session
+        if not all(field in meta for field in self.REQUIRED_FIELDS):
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return ConversationSession(
+            session_id=session_id,
+            messages=[
+                ConversationMessage.from_dict(orjson.loads(message))
+                for message in messages
+            ],
+            created_at=datetime.fromisoformat(meta[b"created_at"].decode()),
+            updated_at=datetime.fromisoformat(meta[b"updated_at"].decode()),
+            metadata=orjson.loads(meta[b"metadata"]),
+            max_exchanges=int(meta[b"max_exchanges"]),
+        )
+    
+    async def append(
+        self,
+        session_id: str,
+        message: ConversationMessage,
+        max_messages: int
+    ) -> Optional[int]:
+        messages_key = self._messages_key(session_id)
+        
+        def queue(pipe, metadata):
+            pipe.rpush(messages_key, orjson.dumps(message.to_dict()))
+            pipe.ltrim(messages_key, -max_messages, -1)
+            pipe.llen(messages_key)
+            self._touch(pipe, session_id)
+        
+        results = await self._transaction(session_id, queue)
+        return None if results is None else results[2]
+    
+    async def reset(self, session_id: str) -> Optional[int]:
+        messages_key = self._messages_key(session_id)
+        
+        def queue(pipe, metadata):
+            pipe.llen(messages_key)
+            pipe.delete(messages_key)
+            self._touch(pipe, session_id)
+        
+        results = await self._transaction(session_id, queue)
+        return None if results is None else results[0]
+    
+    async def update_metadata(self, session_id: str, metadata: Dict[str, Any]) -> bool:
+        # Merged from the metadata read under WATCH, so a concurrent update
+        # retries instead of losing keys
+        def queue(pipe, current):
+            merged = orjson.loads(current)
+            merged.update(metadata)
+            pipe.hset(self._meta_key(session_id), "metadata", orjson.dumps(merged))
+            self._touch(pipe, session_id)
+        
+        return await self._transaction(session_id, queue) is not None
+    
+    async def delete(self, session_id: str) -> bool:
+        deleted = await self.redis.delete(
+            self._meta_key(session_id), self._messages_key(session_id)
+        )
+        return deleted > 0
+    
+    async def session_ids(self) -> List[str]:
+        prefix = f"{self.key_prefix}:meta:"
+        return [
+            key.decode()[len(prefix):]
+            async for key in self.redis.scan_iter(match=f"{prefix}*")
+        ]
+    
+    async def cleanup(self, max_age_hours: int) -> int:
+        # Idle sessions expire through their Redis TTL
+        return 0
+    
+    async def stats(self) -> Dict[str, Any]:
+        # Hits and misses are counted by this worker only
+        return {
+            "backend": "redis",
+            "size": len(await self.session_ids()),
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def create_session_store() -> SessionStore:
+    """
+    Create the session store selected by the environment.
+    
+    Returns:
+        RedisSessionStore if VERBA_SESSION_REDIS_URL is set, otherwise
+        InMemorySessionStore
+    """
+    redis_url = os.getenv("VERBA_SESSION_REDIS_URL")
+    if redis_url:
+        msg.info("Storing conversation sessions in Redis")
+        return RedisSessionStore(redis_url)
+    return InMemorySessionStore()
+
+
 class ConversationManager:
     """
     Manages conversation context for resume generation sessions.
@@ -60,18 +556,19 @@ class ConversationManager:
     and prune old messages to maintain token limits.
     """
     
-    def __init__(self, max_exchanges: int = 10):
+    def __init__(self, max_exchanges: int = 10, store: Optional[SessionStore] = None):
         """
         Initialize ConversationManager.
         
         Args:
             max_exchanges: Maximum number of user-assistant exchanges to keep (default: 10)
+            store: Session store to use (default: InMemorySessionStore)
         """
         self.max_exchanges = max_exchanges
-        self.sessions: Dict[str, ConversationSession] = {}
+        self.store = store or InMemorySessionStore()
         msg.info(f"ConversationManager initialized with max_exchanges={max_exchanges}")
     
-    def create_session(
+    async def create_session(
         self,
         session_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
@@ -89,22 +586,21 @@ class ConversationManager:
         if session_id is None:
             session_id = str(uuid.uuid4())
         
-        if session_id in self.sessions:
-            msg.warn(f"Session {session_id} already exists, returning existing session")
-            return session_id
-        
         session = ConversationSession(
             session_id=session_id,
             metadata=metadata or {},
             max_exchanges=self.max_exchanges
         )
         
-        self.sessions[session_id] = session
+        if not await self.store.create(session):
+            msg.warn(f"Session {session_id} already exists, returning existing session")
+            return session_id
+        
         msg.good(f"Created conversation session: {session_id}")
         
         return session_id
     
-    def get_session(self, session_id: str) -> Optional[ConversationSession]:
+    async def get_session(self, session_id: str) -> Optional[ConversationSession]:
         """
         Get a conversation session by ID.
         
@@ -114,9 +610,9 @@ class ConversationManager:
         Returns:
             ConversationSession or None if not found
         """
-        return self.sessions.get(session_id)
+        return await self.store.get(session_id)
     
-    def session_exists(self, session_id: str) -> bool:
+    async def session_exists(self, session_id: str) -> bool:
         """
         Check if a session exists.
         
@@ -126,9 +622,9 @@ class ConversationManager:
         Returns:
             bool: True if session exists, False otherwise
         """
-        return session_id in self.sessions
+        return await self.store.get(session_id) is not None
     
-    def append_message(
+    async def append_message(
         self,
         session_id: str,
         role: str,
@@ -138,6 +634,8 @@ class ConversationManager:
         """
         Append a message to a conversation session.
         
+        Keeps only the last N exchanges (2N messages where N = max_exchanges).
+        
         Args:
             session_id: The session ID
             role: Message role ("user" or "assistant")
@@ -147,33 +645,30 @@ class ConversationManager:
         Returns:
             bool: True if successful, False if session not found
         """
-        if session_id not in self.sessions:
-            msg.warn(f"Session {session_id} not found, cannot append message")
-            return False
-        
         if role not in ["user", "assistant"]:
             msg.warn(f"Invalid role '{role}', must be 'user' or 'assistant'")
             return False
         
-        session = self.sessions[session_id]
-        
         message = ConversationMessage(
             role=role,
             content=content,
             metadata=metadata or {}
         )
         
-        session.messages.append(message)
-        session.updated_at = datetime.now()
+        # Each exchange = user + assistant
+        message_count = await self.store.append(
+            session_id, message, self.max_exchanges * 2
+        )
         
-        # Prune if necessary
-        self._prune_session(session_id)
+        if message_count is None:
+            msg.warn(f"Session {session_id} not found, cannot append message")
+            return False
         
-        msg.info(f"Appended {role} message to session {session_id} ({len(session.messages)} total messages)")
+        msg.info(f"Appended {role} message to session {session_id} ({message_count} total messages)")
         
         return True
     
-    def append_user_message(
+    async def append_user_message(
         self,
         session_id: str,
         content: str,
@@ -190,9 +685,9 @@ class ConversationManager:
         Returns:
             bool: True if successful, False if session not found
         """
-        return self.append_message(session_id, "user", content, metadata)
+        return await self.append_message(session_id, "user", content, metadata)
     
-    def append_assistant_message(
+    async def append_assistant_message(
         self,
         session_id: str,
         content: str,
@@ -209,9 +704,9 @@ class ConversationManager:
         Returns:
             bool: True if successful, False if session not found
         """
-        return self.append_message(session_id, "assistant", content, metadata)
+        return await self.append_message(session_id, "assistant", content, metadata)
     
-    def get_messages(
+    async def get_messages(
         self,
         session_id: str,
         limit: Optional[int] = None
@@ -226,11 +721,11 @@ class ConversationManager:
         Returns:
             List[ConversationMessage]: List of messages (empty if session not found)
         """
-        if session_id not in self.sessions:
+        session = await self.store.get(session_id)
+        if session is None:
             msg.warn(f"Session {session_id} not found")
             return []
         
-        session = self.sessions[session_id]
         messages = session.messages
         
         if limit is not None and limit > 0:
@@ -238,7 +733,7 @@ class ConversationManager:
         
         return messages
     
-    def get_conversation_history(
+    async def get_conversation_history(
         self,
         session_id: str,
         format: str = "list"
@@ -253,8 +748,11 @@ class ConversationManager:
         Returns:
             Conversation history in requested format
         """
-        messages = self.get_messages(session_id)
-        
+        messages = await self.get_messages(session_id)
+        return self._format_history(messages, format)
+    
+    def _format_history(self, messages: List[ConversationMessage], format: str) -> Any:
+        """Render messages as "list", "dict" or "openai" history."""
         if format == "list":
             return messages
         
@@ -272,27 +770,7 @@ class ConversationManager:
             msg.warn(f"Unknown format '{format}', returning list")
             return messages
     
-    def _prune_session(self, session_id: str):
-        """
-        Prune old messages from a session to maintain token limits.
-        
-        Keeps only the last N exchanges (2N messages where N = max_exchanges).
-        
-        Args:
-            session_id: The session ID to prune
-        """
-        if session_id not in self.sessions:
-            return
-        
-        session = self.sessions[session_id]
-        max_messages = session.max_exchanges * 2  # Each exchange = user + assistant
-        
-        if len(session.messages) > max_messages:
-            removed_count = len(session.messages) - max_messages
-            session.messages = session.messages[-max_messages:]
-            msg.info(f"Pruned {removed_count} old messages from session {session_id}")
-    
-    def reset_session(self, session_id: str) -> bool:
+    async def reset_session(self, session_id: str) -> bool:
         """
         Clear all messages from a conversation session.
         
@@ -302,20 +780,16 @@ class ConversationManager:
         Returns:
             bool: True if successful, False if session not found
         """
-        if session_id not in self.sessions:
+        message_count = await self.store.reset(session_id)
+        if message_count is None:
             msg.warn(f"Session {session_id} not found, cannot reset")
             return False
         
-        session = self.sessions[session_id]
-        message_count = len(session.messages)
-        session.messages = []
-        session.updated_at = datetime.now()
-        
         msg.good(f"Reset session {session_id} (removed {message_count} messages)")
         
         return True
     
-    def delete_session(self, session_id: str) -> bool:
+    async def delete_session(self, session_id: str) -> bool:
         """
         Delete a conversation session entirely.
         
@@ -325,34 +799,33 @@ class ConversationManager:
         Returns:
             bool: True if successful, False if session not found
         """
-        if session_id not in self.sessions:
+        if not await self.store.delete(session_id):
             msg.warn(f"Session {session_id} not found, cannot delete")
             return False
         
-        del self.sessions[session_id]
         msg.good(f"Deleted conversation session: {session_id}")
         
         return True
     
-    def get_session_count(self) -> int:
+    async def get_session_count(self) -> int:
         """
         Get the total number of active sessions.
         
         Returns:
             int: Number of active sessions
         """
-        return len(self.sessions)
+        return len(await self.store.session_ids())
     
-    def get_all_session_ids(self) -> List[str]:
+    async def get_all_session_ids(self) -> List[str]:
         """
         Get all active session IDs.
         
         Returns:
             List[str]: List of session IDs
         """
-        return list(self.sessions.keys())
+        return await self.store.session_ids()
     
-    def update_session_metadata(
+    async def update_session_metadata(
         self,
         session_id: str,
         metadata: Dict[str, Any]
@@ -367,19 +840,15 @@ class ConversationManager:
         Returns:
             bool: True if successful, False if session not found
         """
-        if session_id not in self.sessions:
+        if not await self.store.update_metadata(session_id, metadata):
             msg.warn(f"Session {session_id} not found, cannot update metadata")
             return False
         
-        session = self.sessions[session_id]
-        session.metadata.update(metadata)
-        session.updated_at = datetime.now()
-        
         msg.info(f"Updated metadata for session {session_id}")
         
         return True
     
-    def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
+    async def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Get information about a session.
         
@@ -389,11 +858,14 @@ class ConversationManager:
         Returns:
             Dict with session info or None if not found
         """
-        if session_id not in self.sessions:
+        session = await self.store.get(session_id)
+        if session is None:
             return None
         
-        session = self.sessions[session_id]
-        
+        return self._session_info(session)
+    
+    def _session_info(self, session: ConversationSession) -> Dict[str, Any]:
+        """Summarize a session without its messages."""
         return {
             "session_id": session.session_id,
             "message_count": len(session.messages),
@@ -403,7 +875,37 @@ class ConversationManager:
             "max_exchanges": session.max_exchanges
         }
     
-    def cleanup_old_sessions(self, max_age_hours: int = 24) -> int:
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        Get session store size and lookup counters.
+        
+        Returns:
+            Dict with the backend name, session count, hits and misses
+        """
+        return await self.store.stats()
+    
+    async def get_session_snapshot(
+        self,
+        session_id: str,
+        format: str = "list"
+    ) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """
+        Get session info and conversation history from a single store read.
+        
+        Args:
+            session_id: The session ID
+            format: History format - "list" (default), "dict", or "openai"
+            
+        Returns:
+            Tuple of (session info, history); (None, []) if not found
+        """
+        session = await self.store.get(session_id)
+        if session is None:
+            return None, []
+        
+        return self._session_info(session), self._format_history(session.messages, format)
+    
+    async def cleanup_old_sessions(self, max_age_hours: int = 24) -> int:
         """
         Remove sessions that haven't been updated in a specified time.
         
@@ -413,18 +915,9 @@ class ConversationManager:
         Returns:
             int: Number of sessions cleaned up
         """
-        now = datetime.now()
-        sessions_to_delete = []
+        removed = await self.store.cleanup(max_age_hours)
         
-        for session_id, session in self.sessions.items():
-            age_hours = (now - session.updated_at).total_seconds() / 3600
-            if age_hours > max_age_hours:
-                sessions_to_delete.append(session_id)
+        if removed:
+            msg.good(f"Cleaned up {removed} old sessions")
         
-        for session_id in sessions_to_delete:
-            del self.sessions[session_id]
-        
-        if sessions_to_delete:
-            msg.good(f"Cleaned up {len(sessions_to_delete)} old sessions")
-        
-        return len(sessions_to_delete)
+        return removed
@@ -7,6 +7,7 @@ from weaviate.classes.query import Filter, Sort, MetadataQuery
 from weaviate.collections.classes.data import DataObject
 from weaviate.classes.aggregate import GroupByAggregate
 from weaviate.classes.init import AdditionalConfig, Timeout
+from weaviate.config import ConnectionConfig
 
 import os
 import asyncio
@@ -157,6 +158,21 @@ else:
 
 ### ----------------------- ###
 
+# Each client shares one HTTP connection pool across all concurrent requests;
+# its size is fixed per process and tunable for busy deployments
+WEAVIATE_POOL_CONNECTIONS = int(os.getenv("WEAVIATE_POOL_CONNECTIONS", "20"))
+WEAVIATE_POOL_MAXSIZE = int(os.getenv("WEAVIATE_POOL_MAXSIZE", "100"))
+
+
+def weaviate_additional_config() -> AdditionalConfig:
+    return AdditionalConfig(
+        timeout=Timeout(init=60, query=300, insert=300),
+        connection=ConnectionConfig(
+            session_pool_connections=WEAVIATE_POOL_CONNECTIONS,
+            session_pool_maxsize=WEAVIATE_POOL_MAXSIZE,
+        ),
+    )
+
 
 class WeaviateManager:
     def __init__(self):
@@ -173,9 +189,7 @@ class WeaviateManager:
             return weaviate.use_async_with_weaviate_cloud(
                 cluster_url=w_url,
                 auth_credentials=AuthApiKey(w_key),
-                additional_config=AdditionalConfig(
-                    timeout=Timeout(init=60, query=300, insert=300)
-                ),
+                additional_config=weaviate_additional_config(),
             )
         else:
             raise Exception("No URL or API Key provided")
@@ -184,9 +198,7 @@ class WeaviateManager:
         msg.info(f"Connecting to Weaviate Docker")
         return weaviate.use_async_with_local(
             host=w_url,
-            additional_config=AdditionalConfig(
-                timeout=Timeout(init=60, query=300, insert=300)
-            ),
+            additional_config=weaviate_additional_config(),
         )
 
     async def connect_to_custom(self, host, w_key, port):
@@ -201,9 +213,7 @@ class WeaviateManager:
                 host=host,
                 port=int(port),
                 skip_init_checks=True,
-                additional_config=AdditionalConfig(
-                    timeout=Timeout(init=60, query=300, insert=300)
-                ),
+                additional_config=weaviate_additional_config(),
             )
         else:
             return weaviate.use_async_with_local(
@@ -211,17 +221,13 @@ class WeaviateManager:
                 port=int(port),
                 skip_init_checks=True,
                 auth_credentials=AuthApiKey(w_key),
-                additional_config=AdditionalConfig(
-                    timeout=Timeout(init=60, query=300, insert=300)
-                ),
+                additional_config=weaviate_additional_config(),
             )
 
     async def connect_to_embedded(self):
         msg.info(f"Connecting to Weaviate Embedded")
         return weaviate.use_async_with_embedded(
-            additional_config=AdditionalConfig(
-                timeout=Timeout(init=60, query=300, insert=300)
-            )
+            additional_config=weaviate_additional_config()
         )
 
     async def connect(
@@ -254,7 +260,9 @@ class WeaviateManager:
 
         except Exception as e:
             msg.fail(f"Couldn't connect to Weaviate, check your URL/API KEY: {str(e)}")
-            raise Exception(
+            # ConnectionError lets endpoints tell an unreachable cluster
+            # apart from other failures; it is still an Exception
+            raise ConnectionError(
                 f"Couldn't connect to Weaviate, check your URL/API KEY: {str(e)}"
             )
 
@@ -44,9 +44,17 @@ from uuid import UUID
 import uuid
 import json
 from dataclasses import dataclass
+from collections import OrderedDict
+import asyncio
+import copy
 
-from goldenverba.components.conversation_manager import ConversationManager
+from goldenverba.components.conversation_manager import (
+    ConversationManager,
+    SessionStore,
+)
 from goldenverba.components.resume_exporter import ResumeExporter
+from goldenverba.components.resume_tracker import ResumeRecord
+from goldenverba.components.util import config_value, llm_cache_key
 
 
 @dataclass
@@ -87,6 +95,8 @@ class ResumeOptions:
 class Resume:
     """Represents a generated resume."""
     
+    __slots__ = ("id", "content", "format", "generated_at", "metadata")
+    
     def __init__(
         self,
         content: str,
@@ -101,6 +111,28 @@ class Resume:
         self.generated_at = generated_at or datetime.now()
         self.metadata = metadata or {}
     
+    @classmethod
+    def from_record(cls, record: ResumeRecord) -> "Resume":
+        """
+        Build a Resume from a stored resume record.
+        
+        Args:
+            record: ResumeRecord loaded by ResumeTracker
+            
+        Returns:
+            Resume carrying the record's content, ID and target role metadata
+        """
+        return cls(
+            content=record.resume_content,
+            format=record.format,
+            generated_at=record.generated_at,
+            resume_id=record.id,
+            metadata={
+                "target_role": record.target_role,
+                "job_description": record.job_description
+            }
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert Resume to dictionary."""
         return {
@@ -125,7 +157,9 @@ class ResumeGenerator:
         worklog_collection: str = "VERBA_WorkLog",
         document_collection: str = "VERBA_Document",
         chunk_collection: str = "VERBA_Chunk",
-        max_exchanges: int = 10
+        max_exchanges: int = 10,
+        session_store: Optional[SessionStore] = None,
+        requirements_cache_size: int = 128
     ):
         """
         Initialize ResumeGenerator.
@@ -135,12 +169,19 @@ class ResumeGenerator:
             document_collection: Name of the document collection
             chunk_collection: Name of the chunk collection
             max_exchanges: Maximum number of conversation exchanges to keep (default: 10)
+            session_store: Store for conversation sessions (default: in-memory)
+            requirements_cache_size: Maximum number of extracted job requirements kept in process
         """
         self.worklog_collection = worklog_collection
         self.document_collection = document_collection
         self.chunk_collection = chunk_collection
-        self.conversation_manager = ConversationManager(max_exchanges=max_exchanges)
+        self.conversation_manager = ConversationManager(
+            max_exchanges=max_exchanges, store=session_store
+        )
         self.exporter = ResumeExporter()
+        self.requirements_cache_size = requirements_cache_size
+        self._requirements_cache: OrderedDict[str, JobRequirements] = OrderedDict()
+        self._requirements_pending: Dict[str, asyncio.Future] = {}
         msg.good(f"ResumeGenerator initialized with ConversationManager (max_exchanges={max_exchanges})")
     
     async def extract_job_requirements(
@@ -152,6 +193,10 @@ class ResumeGenerator:
         """
         Parse job description to extract requirements using LLM.
         
+        Regenerating a resume re-reads the same job description, so results
+        are kept in an in-process LRU keyed by the description and model, and
+        concurrent requests for the same key share a single LLM call.
+        
         Args:
             job_description: The job description text
             generator: The LLM generator instance
@@ -164,40 +209,99 @@ class ResumeGenerator:
             Exception: If extraction fails
         """
         try:
-            # Create extraction prompt
-            prompt = self._create_job_extraction_prompt(job_description)
-            
-            # Call LLM to extract requirements
-            full_response = ""
-            async for chunk in generator.generate_stream(
-                config=generator_config,
-                query=prompt,
-                context="",
-                conversation=[]
-            ):
-                if chunk.get("message"):
-                    full_response += chunk["message"]
-            
-            # Parse JSON response
-            requirements_data = self._parse_json_response(full_response)
-            
-            # Create JobRequirements object
-            requirements = JobRequirements(
-                required_skills=requirements_data.get("required_skills", []),
-                preferred_skills=requirements_data.get("preferred_skills", []),
-                experience_level=requirements_data.get("experience_level", ""),
-                role_description=requirements_data.get("role_description", ""),
-                responsibilities=requirements_data.get("responsibilities", []),
-                qualifications=requirements_data.get("qualifications", [])
+            # generator_config is the selected generator's own config, so the
+            # generator name comes from the instance
+            cache_key = llm_cache_key(
+                job_description, generator.name, config_value(generator_config, "Model")
             )
+            cached = self._requirements_cache.get(cache_key)
+            if cached is not None:
+                self._requirements_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+            
+            # The extraction runs as its own task owned by the pending map, so
+            # cancelling any one waiter (the first included) leaves it running
+            # for the others
+            pending = self._requirements_pending.get(cache_key)
+            if pending is None:
+                pending = asyncio.ensure_future(
+                    self._extract_and_cache_requirements(
+                        cache_key, job_description, generator, generator_config
+                    )
+                )
+                self._requirements_pending[cache_key] = pending
+                pending.add_done_callback(
+                    lambda task: self._finish_requirements(cache_key, task)
+                )
             
-            msg.good(f"Extracted {len(requirements.required_skills)} required skills from job description")
-            return requirements
+            return copy.deepcopy(await asyncio.shield(pending))
             
         except Exception as e:
             msg.fail(f"Failed to extract job requirements: {str(e)}")
             raise Exception(f"Failed to extract job requirements: {str(e)}")
     
+    async def _extract_and_cache_requirements(
+        self,
+        cache_key: str,
+        job_description: str,
+        generator,
+        generator_config: dict
+    ) -> JobRequirements:
+        """Run one shared extraction and cache its result if the JSON parsed."""
+        requirements, parsed = await self._request_job_requirements(
+            job_description, generator, generator_config
+        )
+        # Don't cache unparseable responses, so the next attempt retries
+        if parsed:
+            self._requirements_cache[cache_key] = requirements
+            while len(self._requirements_cache) > self.requirements_cache_size:
+                self._requirements_cache.popitem(last=False)
+        
+        msg.good(f"Extracted {len(requirements.required_skills)} required skills from job description")
+        return requirements
+    
+    def _finish_requirements(self, cache_key: str, task: asyncio.Future):
+        if self._requirements_pending.get(cache_key) is task:
+            del self._requirements_pending[cache_key]
+        # Mark a failure retrieved, in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    async def _request_job_requirements(
+        self,
+        job_description: str,
+        generator,
+        generator_config: dict
+    ) -> Tuple[JobRequirements, bool]:
+        """Ask the LLM for job requirements; the flag is False if its JSON couldn't be parsed."""
+        # Create extraction prompt
+        prompt = self._create_job_extraction_prompt(job_description)
+        
+        # Call LLM to extract requirements
+        full_response = ""
+        async for chunk in generator.generate_stream(
+            config=generator_config,
+            query=prompt,
+            context="",
+            conversation=[]
+        ):
+            if chunk.get("message"):
+                full_response += chunk["message"]
+        
+        # Parse JSON response
+        requirements_data = self._parse_json_response(full_response)
+        
+        # Create JobRequirements object
+        requirements = JobRequirements(
+            required_skills=requirements_data.get("required_skills", []),
+            preferred_skills=requirements_data.get("preferred_skills", []),
+            experience_level=requirements_data.get("experience_level", ""),
+            role_description=requirements_data.get("role_description", ""),
+            responsibilities=requirements_data.get("responsibilities", []),
+            qualifications=requirements_data.get("qualifications", [])
+        )
+        return requirements, bool(requirements_data)
+    
     def _create_job_extraction_prompt(self, job_description: str) -> str:
         """Create a prompt for job requirement extraction."""
         return f"""Analyze the following job description and extract key information.
@@ -667,8 +771,8 @@ JSON Response:"""
             conversation = []
             if session_id:
                 # Create session if it doesn't exist
-                if not self.conversation_manager.session_exists(session_id):
-                    self.conversation_manager.create_session(
+                if not await self.conversation_manager.session_exists(session_id):
+                    await self.conversation_manager.create_session(
                         session_id=session_id,
                         metadata={
                             "job_description": job_description,
@@ -677,7 +781,7 @@ JSON Response:"""
                     )
                 
                 # Get conversation history in OpenAI format
-                conversation = self.conversation_manager.get_conversation_history(
+                conversation = await self.conversation_manager.get_conversation_history(
                     session_id,
                     format="openai"
                 )
@@ -715,12 +819,12 @@ JSON Response:"""
             
             # Update conversation context if session provided
             if session_id:
-                self.conversation_manager.append_user_message(
+                await self.conversation_manager.append_user_message(
                     session_id,
                     prompt,
                     metadata={"type": "refinement" if user_feedback else "initial"}
                 )
-                self.conversation_manager.append_assistant_message(
+                await self.conversation_manager.append_assistant_message(
                     session_id,
                     full_response,
                     metadata={"resume_length": len(full_response)}
@@ -827,7 +931,7 @@ INSTRUCTIONS:
 
 Generate the refined resume now:"""
     
-    def create_conversation_session(
+    async def create_conversation_session(
         self,
         session_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
@@ -842,9 +946,9 @@ Generate the refined resume now:"""
         Returns:
             str: The session ID
         """
-        return self.conversation_manager.create_session(session_id, metadata)
+        return await self.conversation_manager.create_session(session_id, metadata)
     
-    def get_conversation_history(
+    async def get_conversation_history(
         self,
         session_id: str,
         format: str = "openai"
@@ -859,9 +963,9 @@ Generate the refined resume now:"""
         Returns:
             Conversation history in requested format
         """
-        return self.conversation_manager.get_conversation_history(session_id, format)
+        return await self.conversation_manager.get_conversation_history(session_id, format)
     
-    def reset_conversation_context(self, session_id: str) -> bool:
+    async def reset_conversation_context(self, session_id: str) -> bool:
         """
         Clear conversation context for a session.
         
@@ -871,9 +975,9 @@ Generate the refined resume now:"""
         Returns:
             bool: True if successful, False if session not found
         """
-        return self.conversation_manager.reset_session(session_id)
+        return await self.conversation_manager.reset_session(session_id)
     
-    def delete_conversation_session(self, session_id: str) -> bool:
+    async def delete_conversation_session(self, session_id: str) -> bool:
         """
         Delete a conversation session entirely.
         
@@ -883,9 +987,9 @@ Generate the refined resume now:"""
         Returns:
             bool: True if successful, False if session not found
         """
-        return self.conversation_manager.delete_session(session_id)
+        return await self.conversation_manager.delete_session(session_id)
     
-    def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
+    async def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Get information about a conversation session.
         
@@ -895,7 +999,33 @@ Generate the refined resume now:"""
         Returns:
             Dict with session info or None if not found
         """
-        return self.conversation_manager.get_session_info(session_id)
+        return await self.conversation_manager.get_session_info(session_id)
+    
+    async def get_session_stats(self) -> Dict[str, Any]:
+        """
+        Get conversation session store statistics.
+        
+        Returns:
+            Dict with the backend name, session count, hits and misses
+        """
+        return await self.conversation_manager.get_stats()
+    
+    async def get_session_snapshot(
+        self,
+        session_id: str,
+        format: str = "openai"
+    ) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """
+        Get session info and conversation history in one session store read.
+        
+        Args:
+            session_id: The session ID
+            format: Output format ("list", "dict", or "openai")
+            
+        Returns:
+            Tuple of (session info, history); (None, []) if not found
+        """
+        return await self.conversation_manager.get_session_snapshot(session_id, format)
     
     def format_resume(
         self,
@@ -7,13 +7,15 @@ along with their associated job descriptions and metadata.
 
 from wasabi import msg
 from weaviate.client import WeaviateAsyncClient
-from weaviate.classes.query import Filter, Sort
+from weaviate.classes.query import Filter
 from weaviate.collections.classes.data import DataObject
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 from uuid import UUID
 import uuid
 
+from goldenverba.components.util import keyset_filter, keyset_sort
+
 
 class ResumeRecord:
     """Represents a resume record with its properties."""
@@ -166,7 +168,8 @@ class ResumeTracker:
         end_date: Optional[datetime] = None,
         format: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[ResumeRecord]:
         """
         Retrieve resume records with optional filtering and pagination.
@@ -178,7 +181,10 @@ class ResumeTracker:
             end_date: Optional filter by end date (inclusive)
             format: Optional filter by resume format
             limit: Maximum number of records to return
-            offset: Number of records to skip for pagination
+            offset: Number of records to skip for pagination (deprecated, prefer cursor)
+            cursor: Optional keyset cursor from a previous page; when given,
+                offset is ignored and the query seeks past the cursor instead
+                of scanning and discarding skipped rows
             
         Returns:
             List[ResumeRecord]: List of matching resume records
@@ -212,6 +218,10 @@ class ResumeTracker:
                     Filter.by_property("generated_at").less_or_equal(end_date.isoformat())
                 )
             
+            if cursor:
+                filters.append(keyset_filter("generated_at", cursor))
+                offset = 0
+            
             # Combine filters with AND logic
             combined_filter = None
             if len(filters) == 1:
@@ -227,13 +237,13 @@ class ResumeTracker:
                     filters=combined_filter,
                     limit=limit,
                     offset=offset,
-                    sort=Sort.by_property("generated_at", ascending=False)
+                    sort=keyset_sort("generated_at")
                 )
             else:
                 response = await collection.query.fetch_objects(
                     limit=limit,
                     offset=offset,
-                    sort=Sort.by_property("generated_at", ascending=False)
+                    sort=keyset_sort("generated_at")
                 )
             
             # Convert to ResumeRecord objects
@@ -268,19 +278,15 @@ class ResumeTracker:
             Exception: If Weaviate connection fails
         """
         try:
-            # Verify collection exists
-            if not await client.collections.exists(self.collection_name):
-                raise Exception(f"Collection {self.collection_name} does not exist")
-            
             collection = client.collections.get(self.collection_name)
             
-            # Check if record exists
-            if not await collection.data.exists(UUID(resume_id)):
+            # One round trip: fetch_object_by_id returns None for a missing
+            # record, so separate existence checks aren't needed
+            obj = await collection.query.fetch_object_by_id(UUID(resume_id))
+            if obj is None:
                 msg.warn(f"Resume record not found: {resume_id}")
                 return None
             
-            # Fetch record
-            obj = await collection.query.fetch_object_by_id(UUID(resume_id))
             record = ResumeRecord.from_weaviate_object(obj)
             
             return record
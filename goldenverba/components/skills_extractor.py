@@ -15,7 +15,9 @@ from uuid import UUID
 import uuid
 import json
 import hashlib
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+
+from goldenverba.components.util import config_value, llm_cache_key
 
 
 # Predefined skill categories
@@ -160,7 +162,8 @@ class SkillsExtractor:
     def __init__(
         self,
         skill_collection_name: str = "VERBA_Skill",
-        cache_collection_name: str = "VERBA_Cache_Skills"
+        cache_collection_name: str = "VERBA_Cache_Skills",
+        memory_cache_size: int = 512
     ):
         """
         Initialize SkillsExtractor.
@@ -168,15 +171,41 @@ class SkillsExtractor:
         Args:
             skill_collection_name: Name of the Weaviate collection for skills
             cache_collection_name: Name of the Weaviate collection for caching
+            memory_cache_size: Maximum number of extractions kept in process
         """
         self.skill_collection_name = skill_collection_name
         self.cache_collection_name = cache_collection_name
         self.skill_categories = SKILL_CATEGORIES
+        self.memory_cache_size = memory_cache_size
+        self._memory_cache: OrderedDict[str, List[str]] = OrderedDict()
     
     def _generate_cache_key(self, text: str) -> str:
         """Generate a cache key from text content."""
         return hashlib.md5(text.encode()).hexdigest()
     
+    def _generate_memory_cache_key(self, text: str, generator_config: dict) -> str:
+        """Generate an in-process cache key from text content and the selected model."""
+        selected = generator_config.get("selected", "")
+        component_config = (
+            generator_config.get("components", {}).get(selected, {}).get("config", {})
+        )
+        return llm_cache_key(text, selected, config_value(component_config, "Model"))
+    
+    def _get_memory_cached_skills(self, key: str) -> Optional[List[str]]:
+        """Return skills from the in-process LRU cache, marking them recently used."""
+        skills = self._memory_cache.get(key)
+        if skills is None:
+            return None
+        self._memory_cache.move_to_end(key)
+        return list(skills)
+    
+    def _set_memory_cached_skills(self, key: str, skills: List[str]) -> None:
+        """Store skills in the in-process LRU cache, evicting the oldest entry when full."""
+        self._memory_cache[key] = list(skills)
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self.memory_cache_size:
+            self._memory_cache.popitem(last=False)
+    
     async def _get_cached_skills(
         self,
         client: WeaviateAsyncClient,
@@ -296,12 +325,18 @@ class SkillsExtractor:
             Exception: If skill extraction fails
         """
         try:
-            # Check cache first
+            # Check the in-process cache, then the Weaviate cache
             if use_cache:
+                memory_key = self._generate_memory_cache_key(text, generator_config)
+                cached_skills = self._get_memory_cached_skills(memory_key)
+                if cached_skills is not None:
+                    return cached_skills
+                
                 cache_key = self._generate_cache_key(text)
                 cached_skills = await self._get_cached_skills(client, cache_key)
                 if cached_skills is not None:
                     msg.info(f"Retrieved {len(cached_skills)} skills from cache")
+                    self._set_memory_cached_skills(memory_key, cached_skills)
                     return cached_skills
             
             # Prepare prompt for LLM
@@ -315,6 +350,7 @@ class SkillsExtractor:
             
             # Cache the results
             if use_cache and extracted_skills:
+                self._set_memory_cached_skills(memory_key, extracted_skills)
                 await self._cache_skills(client, cache_key, extracted_skills)
             
             msg.good(f"Extracted {len(extracted_skills)} skills from text")
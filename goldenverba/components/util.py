@@ -1,5 +1,14 @@
 import numpy as np
 import os
+import base64
+import json
+import hashlib
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from weaviate.classes.query import Filter, Sort
+from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.grpc import _Sorting
 
 # Step 1: Standardize the data
 def standardize_data(X):
@@ -58,4 +67,71 @@ def get_environment(config, value: str, env: str, error_msg: str) -> str:
 def get_token(env: str, default: str = None) -> str:
     # return token, but treat empty string als None
     token = tok if bool(tok := os.getenv(env, None)) else default
-    return token
\ No newline at end of file
+    return token
+
+def encode_keyset_cursor(timestamp: datetime, row_id: str) -> str:
+    """Encode the position after the last row of a page sorted by (timestamp, id) desc."""
+    payload = json.dumps({"ts": timestamp.isoformat(), "id": row_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor created by encode_keyset_cursor."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["ts"]), str(payload["id"])
+    except Exception as e:
+        raise Exception(f"Invalid cursor: {str(e)}")
+
+
+def next_keyset_cursor(rows: list[tuple[datetime, str]]) -> str | None:
+    """Build the cursor for the page after `rows`, given as (timestamp, id) pairs."""
+    if not rows:
+        return None
+    last_ts, last_id = rows[-1]
+    return encode_keyset_cursor(last_ts, last_id)
+
+
+def keyset_sort(timestamp_property: str) -> _Sorting:
+    """Newest first, with the object ID breaking ties between equal timestamps."""
+    return Sort.by_property(timestamp_property, ascending=False).by_property(
+        "_id", ascending=False
+    )
+
+
+def keyset_filter(timestamp_property: str, cursor: str) -> _Filters:
+    """Match the rows that come after `cursor` in keyset_sort order.
+
+    The cursor holds a single (timestamp, id) pair, so its size and the page
+    query stay constant however many rows share a timestamp.
+    """
+    last_ts, last_id = decode_keyset_cursor(cursor)
+    return Filter.by_property(timestamp_property).less_than(last_ts) | (
+        Filter.by_property(timestamp_property).equal(last_ts)
+        & Filter.by_property("_id").less_than(last_id)
+    )
+
+
+@lru_cache(maxsize=256)
+def parse_iso_utc(value: str) -> datetime:
+    """Parse an ISO 8601 string, treating naive values as UTC.
+
+    Filter dates repeat across requests, and datetimes are immutable, so
+    parsed results are cached and shared.
+    """
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def config_value(component_config: dict, key: str) -> str:
+    """Read a component setting, given as an InputConfig or its dict form."""
+    entry = component_config.get(key, "")
+    if isinstance(entry, dict):
+        return str(entry.get("value", ""))
+    return str(getattr(entry, "value", entry))
+
+
+def llm_cache_key(text: str, generator_name: str, model: str) -> str:
+    """Key an LLM result by the input text, the generator and its model."""
+    digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    return f"{digest}:{generator_name}:{model}"
@@ -7,33 +7,46 @@ work log entries that document daily work activities and accomplishments.
 
 from wasabi import msg
 from weaviate.client import WeaviateAsyncClient
-from weaviate.classes.query import Filter, Sort
+from weaviate.classes.query import Filter
 from weaviate.collections.classes.data import DataObject
 from datetime import datetime
+from dataclasses import dataclass, field, InitVar
 from typing import List, Dict, Optional, Any
 from uuid import UUID
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import os
 import uuid
 
+from goldenverba.components.util import keyset_filter, keyset_sort
 
+
+class WorkLogNotFoundError(Exception):
+    """Raised when a work log entry with the given ID does not exist."""
+
+
+@dataclass(slots=True)
 class WorkLogEntry:
-    """Represents a work log entry with its properties."""
+    """Represents a work log entry with its properties.
     
-    def __init__(
-        self,
-        content: str,
-        user_id: str,
-        timestamp: Optional[datetime] = None,
-        extracted_skills: Optional[List[str]] = None,
-        metadata: Optional[Dict[str, Any]] = None,
-        entry_id: Optional[str] = None
-    ):
+    Uses slots instead of a per-instance __dict__, which keeps large result
+    pages small in memory and makes attribute access cheaper.
+    """
+    
+    id: str = field(init=False)
+    content: str
+    user_id: str
+    timestamp: Optional[datetime] = None
+    extracted_skills: Optional[List[str]] = None
+    metadata: Optional[Dict[str, Any]] = None
+    entry_id: InitVar[Optional[str]] = None
+    
+    def __post_init__(self, entry_id: Optional[str]):
         self.id = entry_id or str(uuid.uuid4())
-        self.content = content
-        self.timestamp = timestamp or datetime.now()
-        self.user_id = user_id
-        self.extracted_skills = extracted_skills or []
+        self.timestamp = self.timestamp or datetime.now()
+        self.extracted_skills = self.extracted_skills or []
         # Ensure metadata always has at least one property for Weaviate object type
-        self.metadata = metadata if metadata else {"created_via": "api"}
+        self.metadata = self.metadata if self.metadata else {"created_via": "api"}
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert WorkLogEntry to dictionary for Weaviate storage."""
@@ -147,6 +160,103 @@ class WorkLogManager:
             msg.fail(f"Failed to create work log entry: {str(e)}")
             raise Exception(f"Failed to create work log entry: {str(e)}")
     
+    async def create_log_entries(
+        self,
+        client: WeaviateAsyncClient,
+        entries: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Create and store many work log entries in a single batch request.
+        
+        Args:
+            client: Weaviate async client instance
+            entries: List of dicts with "content" and optional "user_id",
+                "extracted_skills" and "metadata" keys
+            
+        Returns:
+            int: Number of entries that were stored successfully
+            
+        Raises:
+            Exception: If Weaviate connection fails or the batch request fails
+        """
+        try:
+            # Verify collection exists
+            if not await client.collections.exists(self.collection_name):
+                raise Exception(f"Collection {self.collection_name} does not exist")
+            
+            objects = [
+                DataObject(
+                    properties=WorkLogEntry(
+                        content=entry.get("content", ""),
+                        user_id=entry.get("user_id", "default_user"),
+                        extracted_skills=entry.get("extracted_skills"),
+                        metadata=entry.get("metadata")
+                    ).to_dict()
+                )
+                for entry in entries
+            ]
+            
+            collection = client.collections.get(self.collection_name)
+            response = await collection.data.insert_many(objects)
+            
+            if response.has_errors:
+                msg.warn(f"{len(response.errors)} work log entries failed to import")
+            
+            created = len(objects) - len(response.errors)
+            msg.good(f"Created {created} work log entries")
+            return created
+            
+        except Exception as e:
+            msg.fail(f"Failed to create work log entries: {str(e)}")
+            raise Exception(f"Failed to create work log entries: {str(e)}")
+    
+    def bulk_import(
+        self,
+        entries: List[Dict[str, Any]],
+        deployment: str,
+        url: str,
+        key: str,
+        port: str = "8080",
+        workers: Optional[int] = None
+    ) -> int:
+        """
+        Import a large number of work log entries using multiple processes.
+        
+        Validation and serialization are CPU-bound, so entries are sharded
+        across a ProcessPoolExecutor. Each worker process opens its own Weaviate
+        connection once and runs its own event loop to batch-insert its shard.
+        This is a blocking call; from async code run it via asyncio.to_thread.
+        
+        Args:
+            entries: List of dicts accepted by create_log_entries
+            deployment: Weaviate deployment each worker connects to
+            url: Weaviate URL
+            key: Weaviate API key
+            port: Weaviate port for Custom deployments
+            workers: Number of worker processes (defaults to CPU count)
+            
+        Returns:
+            int: Total number of entries stored across all workers
+        """
+        if not entries:
+            return 0
+        
+        workers = max(1, min(workers or os.cpu_count() or 1, len(entries)))
+        chunks = [entries[i::workers] for i in range(workers)]
+        connection = (deployment, url, key, port)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            counts = executor.map(
+                _bulk_import_worker,
+                [self.collection_name] * workers,
+                [connection] * workers,
+                chunks
+            )
+            total = sum(counts)
+        
+        msg.good(f"Bulk imported {total} of {len(entries)} work log entries with {workers} workers")
+        return total
+    
     async def get_log_entries(
         self,
         client: WeaviateAsyncClient,
@@ -154,7 +264,8 @@ class WorkLogManager:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[WorkLogEntry]:
         """
         Retrieve work log entries with optional filtering.
@@ -165,7 +276,10 @@ class WorkLogManager:
             start_date: Optional filter by start date (inclusive)
             end_date: Optional filter by end date (inclusive)
             limit: Maximum number of entries to return
-            offset: Number of entries to skip for pagination
+            offset: Number of entries to skip for pagination (deprecated, prefer cursor)
+            cursor: Optional keyset cursor from a previous page; when given,
+                offset is ignored and the query seeks past the cursor instead
+                of scanning and discarding skipped rows
             
         Returns:
             List[WorkLogEntry]: List of matching work log entries
@@ -196,6 +310,10 @@ class WorkLogManager:
                     Filter.by_property("timestamp").less_or_equal(end_date.isoformat())
                 )
             
+            if cursor:
+                filters.append(keyset_filter("timestamp", cursor))
+                offset = 0
+            
             # Combine filters with AND logic
             combined_filter = None
             if len(filters) == 1:
@@ -211,13 +329,13 @@ class WorkLogManager:
                     filters=combined_filter,
                     limit=limit,
                     offset=offset,
-                    sort=Sort.by_property("timestamp", ascending=False)
+                    sort=keyset_sort("timestamp")
                 )
             else:
                 response = await collection.query.fetch_objects(
                     limit=limit,
                     offset=offset,
-                    sort=Sort.by_property("timestamp", ascending=False)
+                    sort=keyset_sort("timestamp")
                 )
             
             # Convert to WorkLogEntry objects
@@ -239,23 +357,31 @@ class WorkLogManager:
         log_id: str,
         content: Optional[str] = None,
         extracted_skills: Optional[List[str]] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        prior: Optional[WorkLogEntry] = None
     ) -> WorkLogEntry:
         """
         Update an existing work log entry.
         
+        Only the provided fields are sent to Weaviate as a partial update, and
+        the returned entry is built from the known state instead of re-fetching
+        it. Pass `prior` when the caller already holds the current entry to skip
+        the single pre-fetch as well.
+        
         Args:
             client: Weaviate async client instance
             log_id: UUID of the work log entry to update
             content: Optional new content
             extracted_skills: Optional new skills list
             metadata: Optional new metadata
+            prior: Optional current state of the entry, if already known
             
         Returns:
             WorkLogEntry: The updated work log entry
             
         Raises:
-            Exception: If entry not found or update fails
+            WorkLogNotFoundError: If the entry does not exist
+            Exception: If update fails
         """
         try:
             # Verify collection exists
@@ -264,36 +390,42 @@ class WorkLogManager:
             
             collection = client.collections.get(self.collection_name)
             
-            # Check if entry exists
-            if not await collection.data.exists(UUID(log_id)):
-                raise Exception(f"Work log entry not found: {log_id}")
-            
-            # Fetch existing entry
-            existing_obj = await collection.query.fetch_object_by_id(UUID(log_id))
-            existing_props = existing_obj.properties
-            
-            # Build updated properties
-            updated_props = {
-                "content": content if content is not None else existing_props.get("content"),
-                "timestamp": existing_props.get("timestamp"),
-                "user_id": existing_props.get("user_id"),
-                "extracted_skills": extracted_skills if extracted_skills is not None else existing_props.get("extracted_skills", []),
-                "metadata": metadata if metadata is not None else existing_props.get("metadata", {})
-            }
-            
-            # Update in Weaviate
-            await collection.data.update(
-                uuid=UUID(log_id),
-                properties=updated_props
-            )
+            # Fetch existing entry unless the caller already has it
+            if prior is None:
+                existing_obj = await collection.query.fetch_object_by_id(UUID(log_id))
+                if existing_obj is None:
+                    raise WorkLogNotFoundError(f"Work log entry not found: {log_id}")
+                prior = WorkLogEntry.from_weaviate_object(existing_obj)
+            
+            # Build partial update with only the changed properties
+            patch = {}
+            if content is not None:
+                patch["content"] = content
+            if extracted_skills is not None:
+                patch["extracted_skills"] = extracted_skills
+            if metadata is not None:
+                patch["metadata"] = metadata
+            
+            if patch:
+                await collection.data.update(
+                    uuid=UUID(log_id),
+                    properties=patch
+                )
             
-            # Fetch and return updated entry
-            updated_obj = await collection.query.fetch_object_by_id(UUID(log_id))
-            updated_entry = WorkLogEntry.from_weaviate_object(updated_obj)
+            updated_entry = WorkLogEntry(
+                content=patch.get("content", prior.content),
+                user_id=prior.user_id,
+                timestamp=prior.timestamp,
+                extracted_skills=patch.get("extracted_skills", prior.extracted_skills),
+                metadata=patch.get("metadata", prior.metadata),
+                entry_id=log_id
+            )
             
             msg.good(f"Updated work log entry: {log_id}")
             return updated_entry
             
+        except WorkLogNotFoundError:
+            raise
         except Exception as e:
             msg.fail(f"Failed to update work log entry: {str(e)}")
             raise Exception(f"Failed to update work log entry: {str(e)}")
@@ -314,7 +446,8 @@ class WorkLogManager:
             bool: True if deletion was successful
             
         Raises:
-            Exception: If entry not found or deletion fails
+            WorkLogNotFoundError: If the entry does not exist
+            Exception: If deletion fails
         """
         try:
             # Verify collection exists
@@ -325,7 +458,7 @@ class WorkLogManager:
             
             # Check if entry exists
             if not await collection.data.exists(UUID(log_id)):
-                raise Exception(f"Work log entry not found: {log_id}")
+                raise WorkLogNotFoundError(f"Work log entry not found: {log_id}")
             
             # Delete entry
             await collection.data.delete_by_id(UUID(log_id))
@@ -333,6 +466,8 @@ class WorkLogManager:
             msg.good(f"Deleted work log entry: {log_id}")
             return True
             
+        except WorkLogNotFoundError:
+            raise
         except Exception as e:
             msg.fail(f"Failed to delete work log entry: {str(e)}")
             raise Exception(f"Failed to delete work log entry: {str(e)}")
@@ -418,3 +553,22 @@ class WorkLogManager:
         except Exception as e:
             msg.fail(f"Failed to count work log entries: {str(e)}")
             raise Exception(f"Failed to count work log entries: {str(e)}")
+
+
+def _bulk_import_worker(collection_name: str, connection: tuple, chunk: List[Dict[str, Any]]) -> int:
+    """Process pool entry point: import one shard of work log entries."""
+    return asyncio.run(_bulk_import_chunk(collection_name, connection, chunk))
+
+
+async def _bulk_import_chunk(collection_name: str, connection: tuple, chunk: List[Dict[str, Any]]) -> int:
+    # Imported here so the parent process does not pay for loading every component
+    from goldenverba.components.managers import WeaviateManager
+    
+    weaviate_manager = WeaviateManager()
+    client = await weaviate_manager.connect(*connection)
+    if client is None:
+        raise Exception("Couldn't connect to Weaviate for bulk import")
+    try:
+        return await WorkLogManager(collection_name).create_log_entries(client, chunk)
+    finally:
+        await weaviate_manager.disconnect(client)
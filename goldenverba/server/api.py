@@ -1,21 +1,42 @@
 from fastapi import FastAPI, WebSocket, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import (
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from contextlib import asynccontextmanager
-from fastapi.staticfiles import StaticFiles
+from pydantic import ValidationError
 import asyncio
-
-from goldenverba.server.helpers import LoggerManager, BatchManager
+import orjson
+import re
+
+from goldenverba.server.helpers import (
+    LoggerManager,
+    BatchManager,
+    StreamBatcher,
+    ImmutableStaticFiles,
+    SameOriginMiddleware,
+    receive_frame,
+    read_json_body,
+    create_queue_logger,
+    TTLCache,
+)
 from weaviate.client import WeaviateAsyncClient
 
 import os
 from pathlib import Path
+from datetime import datetime
 
 from dotenv import load_dotenv
 from starlette.websockets import WebSocketDisconnect
-from wasabi import msg  # type: ignore[import]
 
 from goldenverba import verba_manager
+from goldenverba.components.util import next_keyset_cursor, parse_iso_utc
+from goldenverba.components.skills_extractor import SKILL_CATEGORIES
+from goldenverba.components.worklog_manager import WorkLogNotFoundError
+from goldenverba.components.resume_generator import ResumeOptions, Resume
+from goldenverba.components.types import InputConfig
 
 from goldenverba.server.types import (
     ResetPayload,
@@ -40,8 +61,11 @@ from goldenverba.server.types import (
     CreateWorkLogPayload,
     GetWorkLogsPayload,
     UpdateWorkLogPayload,
+    WorkLogUpdateFields,
     DeleteWorkLogPayload,
     GetWorkLogByIdPayload,
+    WorkLogBatchOperation,
+    WorkLogBatchPayload,
     GetSkillsPayload,
     GetSkillCategoriesPayload,
     ExtractSkillsPayload,
@@ -59,139 +83,414 @@ from goldenverba.server.types import (
     GetDocumentTagsPayload,
     GetAllTagsPayload,
     SearchDocumentsByTagsPayload,
+    BatchRequestPayload,
 )
 
 load_dotenv()
 
+log = create_queue_logger("verba.api")
+
 # Check if runs in production
 production_key = os.environ.get("VERBA_PRODUCTION")
 tag = os.environ.get("VERBA_GOOGLE_TAG", "")
 
 
 if production_key:
-    msg.info(f"Verba runs in {production_key} mode")
+    log.info(f"Verba runs in {production_key} mode")
     production = production_key
 else:
     production = "Local"
 
+IS_DEMO = production == "Demo"
+
+# Demo mode rejects config writes with a fixed body, so encode it once
+DEMO_REJECT_CONFIG = orjson.dumps(
+    {
+        "status": "200",
+        "status_msg": "Config can't be updated in Production Mode",
+    }
+)
+
+
+def demo_config_rejection() -> Response:
+    # A fresh Response per request, since middleware mutates response headers
+    return Response(content=DEMO_REJECT_CONFIG, media_type="application/json")
+
+
+# Demo mode rejects every write with a fixed body, so encode them once
+DEMO_REJECTIONS = {
+    "document_tags": orjson.dumps(
+        {"error": "Document tag updates are disabled in Demo mode", "success": False}
+    ),
+    "worklog_create": orjson.dumps(
+        {"error": "Work log creation is disabled in Demo mode", "log": None}
+    ),
+    "worklog_update": orjson.dumps(
+        {"error": "Work log updates are disabled in Demo mode", "worklog": None}
+    ),
+    "worklog_delete": orjson.dumps(
+        {"error": "Work log deletion is disabled in Demo mode", "deleted": False}
+    ),
+    "skills_extract": orjson.dumps(
+        {
+            "error": "Skill extraction is disabled in Demo mode",
+            "skills": [],
+            "categorized_skills": {},
+        }
+    ),
+    "skills_extract_documents": orjson.dumps(
+        {"error": "Skill extraction is disabled in Demo mode", "success": False}
+    ),
+    "resume_generate": orjson.dumps(
+        {"error": "Resume generation is disabled in Demo mode", "resume": None}
+    ),
+    "resume_regenerate": orjson.dumps(
+        {"error": "Resume regeneration is disabled in Demo mode", "resume": None}
+    ),
+    "resume_delete": orjson.dumps(
+        {"error": "Resume deletion is disabled in Demo mode", "deleted": False}
+    ),
+    "resume_export": orjson.dumps(
+        {"error": "Resume export is disabled in Demo mode"}
+    ),
+}
+
+
+def demo_rejection(key: str) -> Response:
+    # Same as demo_config_rejection: shared bytes, but a new Response each time
+    return Response(
+        status_code=403, content=DEMO_REJECTIONS[key], media_type="application/json"
+    )
+
+
+# 400 bodies for a path ID that doesn't match the payload, encoded once.
+# Handlers check the IDs before connecting, so a mismatch costs no round-trip
+ID_MISMATCHES = {
+    "worklog": orjson.dumps(
+        {"error": "Log ID in URL does not match payload", "worklog": None}
+    ),
+    "worklog_delete": orjson.dumps(
+        {"error": "Log ID in URL does not match payload", "deleted": False}
+    ),
+    "resume": orjson.dumps(
+        {"error": "Resume ID in URL does not match payload", "resume": None}
+    ),
+    "resume_delete": orjson.dumps(
+        {"error": "Resume ID in URL does not match payload", "deleted": False}
+    ),
+    "resume_export": orjson.dumps(
+        {"error": "Resume ID in URL does not match payload"}
+    ),
+    "session_history": orjson.dumps(
+        {"error": "Session ID in URL does not match payload", "history": []}
+    ),
+    "session_update": orjson.dumps(
+        {"error": "Session ID in URL does not match payload", "success": False}
+    ),
+}
+
+
+def id_mismatch(key: str) -> Response:
+    return Response(
+        status_code=400, content=ID_MISMATCHES[key], media_type="application/json"
+    )
+
+
+# 503 bodies for when Weaviate can't be reached; the underlying error is
+# logged rather than echoed, since it can contain the cluster URL
+WEAVIATE_UNAVAILABLE_ERROR = "Could not connect to Weaviate, try again later"
+WEAVIATE_UNAVAILABLE = {
+    "resume": orjson.dumps({"error": WEAVIATE_UNAVAILABLE_ERROR, "resume": None}),
+    "resume_history": orjson.dumps(
+        {"error": WEAVIATE_UNAVAILABLE_ERROR, "resumes": [], "total_count": 0}
+    ),
+    "resume_delete": orjson.dumps(
+        {"error": WEAVIATE_UNAVAILABLE_ERROR, "deleted": False}
+    ),
+    "resume_export": orjson.dumps({"error": WEAVIATE_UNAVAILABLE_ERROR}),
+}
+
+
+def weaviate_unavailable(key: str) -> Response:
+    return Response(
+        status_code=503, content=WEAVIATE_UNAVAILABLE[key], media_type="application/json"
+    )
+
+
+EMPTY_JSON = b"{}"
+
+# Pagination totals only depend on the deployment and filter, not
+# limit/offset, so one cached count serves every page. Writes invalidate the
+# namespace in this worker only, so the TTL is kept short for the others
+count_cache = TTLCache(ttl=5)
+
+
+async def cached_count(key: tuple, fetch_count) -> int:
+    count = count_cache.get(key)
+    if count is None:
+        count = await fetch_count()
+        count_cache.set(key, count)
+    return count
+
+
+# The RAG config only changes through set_rag_config and reset, which
+# invalidate it, so LLM endpoints reuse a recent copy instead of reading it
+# from Weaviate per request. The invalidation is per worker, so the TTL is kept
+# short for the others. Callers must treat the returned dict as read-only.
+rag_config_cache = TTLCache(ttl=5)
+
+
+async def cached_rag_config(client, credentials: Credentials | None) -> dict:
+    key = (
+        "rag_config",
+        client_manager.hash_credentials(
+            credentials or client_manager.default_credentials()
+        ),
+    )
+    rag_config = rag_config_cache.get(key)
+    if rag_config is None:
+        rag_config = await manager.load_rag_config(client)
+        rag_config_cache.set(key, rag_config)
+    return rag_config
+
+
+# Encoded get_skills bodies, keyed by (credentials hash, start, end, category).
+# Skills are written by document imports and bulk extraction, which
+# invalidate the "skills" namespace in this worker only; the short TTL bounds
+# staleness in the others
+skills_report_cache = TTLCache(ttl=5, maxsize=256)
+
+
+def empty_json_response(status_code: int) -> Response:
+    # Clients only check the status code, so skip encoding an empty dict
+    return Response(status_code=status_code, content=EMPTY_JSON, media_type="application/json")
+
+SKILL_CATEGORIES_BODY = orjson.dumps(
+    {
+        "error": "",
+        "categories": [
+            {
+                "name": category,
+                "display_name": category.replace("_", " ").title(),
+                "example_skills": skills[:5],  # First 5 skills as examples
+            }
+            for category, skills in SKILL_CATEGORIES.items()
+        ],
+        "total_categories": len(SKILL_CATEGORIES),
+    }
+)
+
+# Resume export format -> (file extension, media type)
+EXPORT_FORMATS = {
+    "pdf": ("pdf", "application/pdf"),
+    "docx": (
+        "docx",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ),
+    "markdown": ("md", "text/markdown"),
+}
+
+# Anything outside this allowlist is replaced in export filenames, which end
+# up in the Content-Disposition header and on the user's disk
+UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+# Feature flags are fixed for the lifetime of the process, so read them once
+PROFILE_ASYNC = os.getenv("PROFILE_ASYNC", "0") == "1"
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+ENABLE_SKILL_EXTRACTION = os.getenv("ENABLE_SKILL_EXTRACTION", "true").lower() == "true"
+ENABLE_RESUME_TRACKING = os.getenv("ENABLE_RESUME_TRACKING", "true").lower() == "true"
+ENABLE_PDF_EXPORT = os.getenv("ENABLE_PDF_EXPORT", "false").lower() == "true"
+# Pool and session store stats are for tuning, not for deployed instances
+DEBUG_ENDPOINTS = production == "Local" or PROFILE_ASYNC
+DEFAULT_DEPLOYMENT = os.getenv("DEFAULT_DEPLOYMENT", "")
+MAX_CONCURRENT_IMPORTS = int(os.getenv("MAX_CONCURRENT_IMPORTS", "8"))
+# The frontend sends 256K character chunks, so a frame past this is not an upload batch
+MAX_IMPORT_FRAME_BYTES = int(os.getenv("MAX_IMPORT_FRAME_BYTES", str(8 * 1024 * 1024)))
+
+# Frontend build paths, resolved once
+BASE_DIR = Path(__file__).resolve().parent
+STATIC_DIR = str(BASE_DIR / "frontend" / "out")
+INDEX_HTML_PATH = str(BASE_DIR / "frontend" / "out" / "index.html")
+
 manager = verba_manager.VerbaManager()
 
 client_manager = verba_manager.ClientManager()
 
+# Work log, skills and resume components are shared across requests, and are
+# the manager's own instances so caches such as the skills extractor's are
+# shared with the manager's bulk operations too
+worklog_manager = manager.worklog_manager
+skills_extractor = manager.skills_extractor
+resume_tracker = manager.resume_tracker
+
 ### Lifespan
 
 
+async def build_health_payload() -> dict:
+    if production == "Local":
+        deployments = await manager.get_deployments()
+    else:
+        deployments = {"WEAVIATE_URL_VERBA": "", "WEAVIATE_API_KEY_VERBA": ""}
+
+    # Check new resume components status
+    resume_components = {
+        "worklog_manager": manager.worklog_manager is not None,
+        "skills_extractor": manager.skills_extractor is not None,
+        "resume_generator": manager.resume_generator is not None,
+        "resume_tracker": manager.resume_tracker is not None,
+        "skill_extraction_enabled": ENABLE_SKILL_EXTRACTION,
+        "resume_tracking_enabled": ENABLE_RESUME_TRACKING,
+        "pdf_export_enabled": ENABLE_PDF_EXPORT
+    }
+
+    return {
+        "message": "Alive!",
+        "production": production,
+        "gtag": tag,
+        "deployments": deployments,
+        "default_deployment": DEFAULT_DEPLOYMENT,
+        "resume_components": resume_components
+    }
+
+
+async def load_index_html() -> bytes:
+    return await asyncio.to_thread(Path(INDEX_HTML_PATH).read_bytes)
+
+
+async def periodic_client_cleanup(interval: float = 60):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await client_manager.clean_up()
+        except Exception as e:
+            log.warning(f"Client cleanup failed: {str(e)}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    app.state.health_body = orjson.dumps(await build_health_payload())
+    app.state.index_bytes = await load_index_html()
+    cleanup_task = asyncio.create_task(periodic_client_cleanup())
+
+    # Warm the shared client for the configured default deployment so the
+    # first request does not pay for the connection handshake
+    if DEFAULT_DEPLOYMENT:
+        try:
+            await client_manager.connect(
+                Credentials(
+                    deployment=DEFAULT_DEPLOYMENT,
+                    url=os.getenv("WEAVIATE_URL_VERBA", ""),
+                    key=os.getenv("WEAVIATE_API_KEY_VERBA", ""),
+                )
+            )
+        except Exception as e:
+            log.warning(f"Could not pre-connect default client: {str(e)}")
     yield
+    cleanup_task.cancel()
     await client_manager.disconnect()
 
 
 # FastAPI App
-app = FastAPI(lifespan=lifespan)
-
-# Allow requests only from the same origin
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # This will be restricted by the custom middleware
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# The only cross-origin caller is the Next.js dev server talking to a local
+# backend; deployed frontends are served same-origin from /static, so the
+# CORS layer is only installed for local runs and only for localhost origins
+if production == "Local":
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origin_regex=r"http://(localhost|127\.0\.0\.1):\d+",
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 
-# Custom middleware to check if the request is from the same origin
-@app.middleware("http")
-async def check_same_origin(request: Request, call_next):
-    # Allow public access to /api/health
-    if request.url.path == "/api/health":
-        return await call_next(request)
+# Rejects cross-origin /api/ calls; added after CORS so it runs first
+app.add_middleware(SameOriginMiddleware)
 
-    origin = request.headers.get("origin")
-    
-    # Allow requests without Origin header (same-origin requests from browser)
-    # Allow requests with matching origin
-    # Allow localhost requests
-    if (
-        origin is None or
-        origin == str(request.base_url).rstrip("/") or
-        (origin and origin.startswith("http://localhost:") and request.base_url.hostname == "localhost") or
-        (origin and origin.startswith("http://127.0.0.1:"))
-    ):
-        return await call_next(request)
-    else:
-        # Only apply restrictions to /api/ routes (except /api/health)
-        if request.url.path.startswith("/api/"):
-            return JSONResponse(
-                status_code=403,
-                content={
-                    "error": "Not allowed",
-                    "details": {
-                        "request_origin": origin,
-                        "expected_origin": str(request.base_url),
-                        "request_method": request.method,
-                        "request_url": str(request.url),
-                        "expected_header": "Origin header matching the server's base URL or localhost",
-                    },
-                },
-            )
 
-        # Allow non-API routes to pass through
-        return await call_next(request)
+# Development-only request profiling. pyinstrument's async mode attributes
+# time spent awaiting (Weaviate, LLM calls) to the awaiting handler, which
+# cProfile does not. Registered last so it wraps the other middleware, and the
+# profiler starts inside the request coroutine so it sees its context switches.
+if PROFILE_ASYNC:
+    from pyinstrument import Profiler
 
+    log.warning(f"PROFILE_ASYNC is on, writing request profiles to {PROFILE_DIR}/")
 
-BASE_DIR = Path(__file__).resolve().parent
+    def write_profile(path: Path, html: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(html)
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            # Streaming bodies are sent after this returns and aren't included
+            return await call_next(request)
+        finally:
+            profiler.stop()
+            name = request.url.path.strip("/").replace("/", "_") or "root"
+            await asyncio.to_thread(
+                write_profile,
+                Path(PROFILE_DIR) / f"{request.method}_{name}.html",
+                profiler.output_html(),
+            )
 
-# Serve all static files (including _next assets)
-app.mount("/static", StaticFiles(directory=BASE_DIR / "frontend/out"), name="app")
+
+# Serve all static files (including _next assets); hashed build assets are cached as immutable
+app.mount(
+    "/static", ImmutableStaticFiles(directory=STATIC_DIR), name="app"
+)
 
 
 @app.get("/")
 @app.head("/")
 async def serve_frontend():
-    response = FileResponse(os.path.join(BASE_DIR, "frontend/out/index.html"))
-    # Add cache-busting headers to force browser to reload
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
+    # index.html is read once and served from memory, no disk I/O per request
+    if getattr(app.state, "index_bytes", None) is None:
+        app.state.index_bytes = await load_index_html()
+    return Response(
+        content=app.state.index_bytes,
+        media_type="text/html",
+        # Add cache-busting headers to force browser to reload
+        headers={
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "Pragma": "no-cache",
+            "Expires": "0",
+        },
+    )
 
 
 ### INITIAL ENDPOINTS
 
 
+async def resolve_client(request: Request, credentials: Credentials):
+    # Prefer the session header from /api/session, which skips credential hashing
+    session_id = request.headers.get("x-verba-session")
+    if session_id:
+        return await client_manager.connect_session(session_id)
+    return await client_manager.connect(credentials)
+
+
 # Define health check endpoint
 @app.get("/api/health")
 async def health_check():
+    # Payload only depends on environment and startup state, so it is built
+    # and encoded once; each probe only wraps the shared bytes
+    if getattr(app.state, "health_body", None) is None:
+        app.state.health_body = orjson.dumps(await build_health_payload())
+    return Response(content=app.state.health_body, media_type="application/json")
 
-    await client_manager.clean_up()
 
-    if production == "Local":
-        deployments = await manager.get_deployments()
-    else:
-        deployments = {"WEAVIATE_URL_VERBA": "", "WEAVIATE_API_KEY_VERBA": ""}
+if DEBUG_ENDPOINTS:
 
-    # Check new resume components status
-    resume_components = {
-        "worklog_manager": manager.worklog_manager is not None,
-        "skills_extractor": manager.skills_extractor is not None,
-        "resume_generator": manager.resume_generator is not None,
-        "resume_tracker": manager.resume_tracker is not None,
-        "skill_extraction_enabled": os.getenv("ENABLE_SKILL_EXTRACTION", "true").lower() == "true",
-        "resume_tracking_enabled": os.getenv("ENABLE_RESUME_TRACKING", "true").lower() == "true",
-        "pdf_export_enabled": os.getenv("ENABLE_PDF_EXPORT", "false").lower() == "true"
-    }
-    
-    return JSONResponse(
-        content={
-            "message": "Alive!",
-            "production": production,
-            "gtag": tag,
-            "deployments": deployments,
-            "default_deployment": os.getenv("DEFAULT_DEPLOYMENT", ""),
-            "resume_components": resume_components
-        }
-    )
+    @app.get("/api/debug/pool")
+    async def get_client_pool_stats():
+        # Counts and limits only; credentials hashes are not exposed
+        return ORJSONResponse(content=client_manager.stats())
 
 
 @app.post("/api/connect")
@@ -201,10 +500,13 @@ async def connect_to_verba(payload: ConnectPayload):
         if isinstance(
             client, WeaviateAsyncClient
         ):  # Check if client is an AsyncClient object
-            config = await manager.load_rag_config(client)
-            user_config = await manager.load_user_config(client)
-            theme, themes = await manager.load_theme_config(client)
-            return JSONResponse(
+            # The three configs are independent reads, so fetch them concurrently
+            config, user_config, (theme, themes) = await asyncio.gather(
+                manager.load_rag_config(client),
+                manager.load_user_config(client),
+                manager.load_theme_config(client),
+            )
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "connected": True,
@@ -220,8 +522,8 @@ async def connect_to_verba(payload: ConnectPayload):
                 "Couldn't connect to Weaviate, client is not an AsyncClient object"
             )
     except Exception as e:
-        msg.fail(f"Failed to connect to Weaviate {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to connect to Weaviate {str(e)}")
+        return ORJSONResponse(
             status_code=400,
             content={
                 "connected": False,
@@ -233,6 +535,50 @@ async def connect_to_verba(payload: ConnectPayload):
         )
 
 
+@app.post("/api/session")
+async def create_session(payload: ConnectPayload):
+    """
+    Connect once and return a session id for the X-Verba-Session header.
+    
+    Args:
+        payload: ConnectPayload containing credentials and port
+        
+    Returns:
+        JSONResponse with the session id or error
+    """
+    try:
+        session_id = await client_manager.create_session(
+            payload.credentials, payload.port
+        )
+        return ORJSONResponse(content={"error": "", "session_id": session_id})
+    except Exception as e:
+        log.error(f"Failed to create session: {str(e)}")
+        return ORJSONResponse(
+            status_code=400,
+            content={"error": f"Failed to create session: {str(e)}", "session_id": ""},
+        )
+
+
+@app.delete("/api/session")
+async def delete_session(request: Request):
+    """
+    Forget the session id sent in the X-Verba-Session header.
+    
+    Args:
+        request: Request carrying the X-Verba-Session header
+        
+    Returns:
+        JSONResponse with success status or error
+    """
+    session_id = request.headers.get("x-verba-session", "")
+    if not client_manager.delete_session(session_id):
+        return ORJSONResponse(
+            status_code=404,
+            content={"error": "Unknown session", "success": False},
+        )
+    return ORJSONResponse(content={"error": "", "success": True})
+
+
 ### WEBSOCKETS
 
 
@@ -241,64 +587,97 @@ async def websocket_generate_stream(websocket: WebSocket):
     await websocket.accept()
     while True:  # Start a loop to keep the connection alive.
         try:
-            data = await websocket.receive_text()
+            data = await receive_frame(websocket)
             # Parse and validate the JSON string using Pydantic model
             payload = GeneratePayload.model_validate_json(data)
 
-            msg.good(f"Received generate stream call for {payload.query}")
+            log.info("Received generate stream call for %s", payload.query)
 
             full_text = ""
-            async for chunk in manager.generate_stream_answer(
-                payload.rag_config,
-                payload.query,
-                payload.context,
-                payload.conversation,
-            ):
-                full_text += chunk["message"]
-                if chunk["finish_reason"] == "stop":
-                    chunk["full_text"] = full_text
-                await websocket.send_json(chunk)
+            batcher = StreamBatcher(websocket)
+            try:
+                async for chunk in manager.generate_stream_answer(
+                    payload.rag_config,
+                    payload.query,
+                    payload.context,
+                    payload.conversation,
+                ):
+                    full_text += chunk["message"]
+                    if chunk["finish_reason"] == "stop":
+                        chunk["full_text"] = full_text
+                    await batcher.add(chunk)
+                await batcher.flush()
+            finally:
+                # Don't let a pending timer write after an error or disconnect
+                batcher.cancel()
 
         except WebSocketDisconnect:
-            msg.warn("WebSocket connection closed by client.")
+            log.warning("WebSocket connection closed by client.")
             break  # Break out of the loop when the client disconnects
 
         except Exception as e:
-            msg.fail(f"WebSocket Error: {str(e)}")
-            await websocket.send_json(
-                {"message": e, "finish_reason": "stop", "full_text": str(e)}
+            log.error(f"WebSocket Error: {str(e)}")
+            error = orjson.dumps(
+                {"message": str(e), "finish_reason": "stop", "full_text": str(e)}
             )
-        msg.good("Succesfully streamed answer")
+            await websocket.send_text(error.decode())
+        log.info("Succesfully streamed answer")
 
 
 @app.websocket("/ws/import_files")
 async def websocket_import_files(websocket: WebSocket):
 
-    if production == "Demo":
+    if IS_DEMO:
         return
 
     await websocket.accept()
     logger = LoggerManager(websocket)
     batcher = BatchManager()
+    # Imports run concurrently so the receive loop keeps accepting batches,
+    # but only MAX_CONCURRENT_IMPORTS of them read, chunk and embed at once
+    import_tasks: set[asyncio.Task] = set()
+    import_slots = asyncio.Semaphore(MAX_CONCURRENT_IMPORTS)
+
+    async def run_import(client, fileConfig):
+        async with import_slots:
+            try:
+                await manager.import_document(client, fileConfig, logger)
+            finally:
+                # Imports extract skills from the new document
+                skills_report_cache.invalidate("skills")
+
+    def finish_import(task: asyncio.Task):
+        import_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error(f"Import task failed: {str(task.exception())}")
 
     while True:
         try:
-            data = await websocket.receive_text()
+            data = await receive_frame(websocket)
+            # Checked before parsing so an oversized frame is never validated
+            if len(data) > MAX_IMPORT_FRAME_BYTES:
+                log.warning(f"Import frame of {len(data)} bytes exceeds limit, closing")
+                await websocket.close(code=1009)
+                break
             batch_data = DataBatchPayload.model_validate_json(data)
             fileConfig = batcher.add_batch(batch_data)
             if fileConfig is not None:
                 client = await client_manager.connect(batch_data.credentials)
-                await asyncio.create_task(
-                    manager.import_document(client, fileConfig, logger)
-                )
+                task = asyncio.create_task(run_import(client, fileConfig))
+                import_tasks.add(task)
+                task.add_done_callback(finish_import)
 
         except WebSocketDisconnect:
-            msg.warn("Import WebSocket connection closed by client.")
+            log.warning("Import WebSocket connection closed by client.")
             break
         except Exception as e:
-            msg.fail(f"Import WebSocket Error: {str(e)}")
+            log.error(f"Import WebSocket Error: {str(e)}")
             break
 
+    # Let in-flight imports finish before the handler returns
+    if import_tasks:
+        await asyncio.gather(*import_tasks, return_exceptions=True)
+
 
 ### CONFIG ENDPOINTS
 
@@ -309,13 +688,13 @@ async def retrieve_rag_config(payload: Credentials):
     try:
         client = await client_manager.connect(payload)
         config = await manager.load_rag_config(client)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200, content={"rag_config": config, "error": ""}
         )
 
     except Exception as e:
-        msg.warn(f"Could not retrieve configuration: {str(e)}")
-        return JSONResponse(
+        log.warning(f"Could not retrieve configuration: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "rag_config": {},
@@ -326,25 +705,21 @@ async def retrieve_rag_config(payload: Credentials):
 
 @app.post("/api/set_rag_config")
 async def update_rag_config(payload: SetRAGConfigPayload):
-    if production == "Demo":
-        return JSONResponse(
-            content={
-                "status": "200",
-                "status_msg": "Config can't be updated in Production Mode",
-            }
-        )
+    if IS_DEMO:
+        return demo_config_rejection()
 
     try:
         client = await client_manager.connect(payload.credentials)
         await manager.set_rag_config(client, payload.rag_config.model_dump())
-        return JSONResponse(
+        rag_config_cache.invalidate("rag_config")
+        return ORJSONResponse(
             content={
                 "status": 200,
             }
         )
     except Exception as e:
-        msg.warn(f"Failed to set new RAG Config {str(e)}")
-        return JSONResponse(
+        log.warning(f"Failed to set new RAG Config {str(e)}")
+        return ORJSONResponse(
             content={
                 "status": 400,
                 "status_msg": f"Failed to set new RAG Config {str(e)}",
@@ -357,13 +732,13 @@ async def retrieve_user_config(payload: Credentials):
     try:
         client = await client_manager.connect(payload)
         config = await manager.load_user_config(client)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200, content={"user_config": config, "error": ""}
         )
 
     except Exception as e:
-        msg.warn(f"Could not retrieve user configuration: {str(e)}")
-        return JSONResponse(
+        log.warning(f"Could not retrieve user configuration: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "user_config": {},
@@ -374,26 +749,21 @@ async def retrieve_user_config(payload: Credentials):
 
 @app.post("/api/set_user_config")
 async def update_user_config(payload: SetUserConfigPayload):
-    if production == "Demo":
-        return JSONResponse(
-            content={
-                "status": "200",
-                "status_msg": "Config can't be updated in Production Mode",
-            }
-        )
+    if IS_DEMO:
+        return demo_config_rejection()
 
     try:
         client = await client_manager.connect(payload.credentials)
         await manager.set_user_config(client, payload.user_config)
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": 200,
                 "status_msg": "User config updated",
             }
         )
     except Exception as e:
-        msg.warn(f"Failed to set new RAG Config {str(e)}")
-        return JSONResponse(
+        log.warning(f"Failed to set new RAG Config {str(e)}")
+        return ORJSONResponse(
             content={
                 "status": 400,
                 "status_msg": f"Failed to set new RAG Config {str(e)}",
@@ -407,13 +777,13 @@ async def retrieve_theme_config(payload: Credentials):
     try:
         client = await client_manager.connect(payload)
         theme, themes = await manager.load_theme_config(client)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200, content={"theme": theme, "themes": themes, "error": ""}
         )
 
     except Exception as e:
-        msg.warn(f"Could not retrieve configuration: {str(e)}")
-        return JSONResponse(
+        log.warning(f"Could not retrieve configuration: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "theme": None,
@@ -425,27 +795,22 @@ async def retrieve_theme_config(payload: Credentials):
 
 @app.post("/api/set_theme_config")
 async def update_theme_config(payload: SetThemeConfigPayload):
-    if production == "Demo":
-        return JSONResponse(
-            content={
-                "status": "200",
-                "status_msg": "Config can't be updated in Production Mode",
-            }
-        )
+    if IS_DEMO:
+        return demo_config_rejection()
 
     try:
         client = await client_manager.connect(payload.credentials)
         await manager.set_theme_config(
             client, {"theme": payload.theme, "themes": payload.themes}
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": 200,
             }
         )
     except Exception as e:
-        msg.warn(f"Failed to set new RAG Config {str(e)}")
-        return JSONResponse(
+        log.warning(f"Failed to set new RAG Config {str(e)}")
+        return ORJSONResponse(
             content={
                 "status": 400,
                 "status_msg": f"Failed to set new RAG Config {str(e)}",
@@ -458,21 +823,20 @@ async def update_theme_config(payload: SetThemeConfigPayload):
 
 # Receive query and return chunks and query answer
 @app.post("/api/query")
-async def query(payload: QueryPayload):
-    msg.good(f"Received query: {payload.query}")
+async def query(request: Request, payload: QueryPayload):
+    log.info("Received query: %s", payload.query)
     try:
-        client = await client_manager.connect(payload.credentials)
-        documents_uuid = [document.uuid for document in payload.documentFilter]
+        client = await resolve_client(request, payload.credentials)
         documents, context = await manager.retrieve_chunks(
-            client, payload.query, payload.RAG, payload.labels, documents_uuid
+            client, payload.query, payload.RAG, payload.labels, payload.document_uuids
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": "", "documents": documents, "context": context}
         )
     except Exception as e:
-        msg.warn(f"Query failed: {str(e)}")
-        return JSONResponse(
+        log.warning(f"Query failed: {str(e)}")
+        return ORJSONResponse(
             content={"error": f"Query failed: {str(e)}", "documents": [], "context": ""}
         )
 
@@ -482,9 +846,9 @@ async def query(payload: QueryPayload):
 
 # Retrieve specific document based on UUID
 @app.post("/api/get_document")
-async def get_document(payload: GetDocumentPayload):
+async def get_document(request: Request, payload: GetDocumentPayload):
     try:
-        client = await client_manager.connect(payload.credentials)
+        client = await resolve_client(request, payload.credentials)
         document = await manager.weaviate_manager.get_document(
             client,
             payload.uuid,
@@ -500,24 +864,24 @@ async def get_document(payload: GetDocumentPayload):
         )
         if document is not None:
             document["content"] = ""
-            msg.good(f"Succesfully retrieved document: {document['title']}")
-            return JSONResponse(
+            log.info("Succesfully retrieved document: %s", document["title"])
+            return ORJSONResponse(
                 content={
                     "error": "",
                     "document": document,
                 }
             )
         else:
-            msg.warn(f"Could't retrieve document")
-            return JSONResponse(
+            log.warning(f"Could't retrieve document")
+            return ORJSONResponse(
                 content={
                     "error": "Couldn't retrieve requested document",
                     "document": None,
                 }
             )
     except Exception as e:
-        msg.fail(f"Document retrieval failed: {str(e)}")
-        return JSONResponse(
+        log.error(f"Document retrieval failed: {str(e)}")
+        return ORJSONResponse(
             content={
                 "error": str(e),
                 "document": None,
@@ -526,21 +890,20 @@ async def get_document(payload: GetDocumentPayload):
 
 
 @app.post("/api/get_datacount")
-async def get_document_count(payload: DatacountPayload):
+async def get_document_count(request: Request, payload: DatacountPayload):
     try:
-        client = await client_manager.connect(payload.credentials)
-        document_uuids = [document.uuid for document in payload.documentFilter]
+        client = await resolve_client(request, payload.credentials)
         datacount = await manager.weaviate_manager.get_datacount(
-            client, payload.embedding_model, document_uuids
+            client, payload.embedding_model, payload.document_uuids
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "datacount": datacount,
             }
         )
     except Exception as e:
-        msg.fail(f"Document Count retrieval failed: {str(e)}")
-        return JSONResponse(
+        log.error(f"Document Count retrieval failed: {str(e)}")
+        return ORJSONResponse(
             content={
                 "datacount": 0,
             }
@@ -548,18 +911,18 @@ async def get_document_count(payload: DatacountPayload):
 
 
 @app.post("/api/get_labels")
-async def get_labels(payload: Credentials):
+async def get_labels(request: Request, payload: Credentials):
     try:
-        client = await client_manager.connect(payload)
+        client = await resolve_client(request, payload)
         labels = await manager.weaviate_manager.get_labels(client)
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "labels": labels,
             }
         )
     except Exception as e:
-        msg.fail(f"Document Labels retrieval failed: {str(e)}")
-        return JSONResponse(
+        log.error(f"Document Labels retrieval failed: {str(e)}")
+        return ORJSONResponse(
             content={
                 "labels": [],
             }
@@ -568,19 +931,19 @@ async def get_labels(payload: Credentials):
 
 # Retrieve specific document based on UUID
 @app.post("/api/get_content")
-async def get_content(payload: GetContentPayload):
+async def get_content(request: Request, payload: GetContentPayload):
     try:
-        client = await client_manager.connect(payload.credentials)
+        client = await resolve_client(request, payload.credentials)
         content, maxPage = await manager.get_content(
             client, payload.uuid, payload.page - 1, payload.chunkScores
         )
-        msg.good(f"Succesfully retrieved content from {payload.uuid}")
-        return JSONResponse(
+        log.info("Succesfully retrieved content from %s", payload.uuid)
+        return ORJSONResponse(
             content={"error": "", "content": content, "maxPage": maxPage}
         )
     except Exception as e:
-        msg.fail(f"Document retrieval failed: {str(e)}")
-        return JSONResponse(
+        log.error(f"Document retrieval failed: {str(e)}")
+        return ORJSONResponse(
             content={
                 "error": str(e),
                 "document": None,
@@ -590,21 +953,21 @@ async def get_content(payload: GetContentPayload):
 
 # Retrieve specific document based on UUID
 @app.post("/api/get_vectors")
-async def get_vectors(payload: GetVectorPayload):
+async def get_vectors(request: Request, payload: GetVectorPayload):
     try:
-        client = await client_manager.connect(payload.credentials)
+        client = await resolve_client(request, payload.credentials)
         vector_groups = await manager.weaviate_manager.get_vectors(
             client, payload.uuid, payload.showAll
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "error": "",
                 "vector_groups": vector_groups,
             }
         )
     except Exception as e:
-        msg.fail(f"Vector retrieval failed: {str(e)}")
-        return JSONResponse(
+        log.error(f"Vector retrieval failed: {str(e)}")
+        return ORJSONResponse(
             content={
                 "error": str(e),
                 "payload": {"embedder": "None", "vectors": []},
@@ -614,21 +977,21 @@ async def get_vectors(payload: GetVectorPayload):
 
 # Retrieve specific document based on UUID
 @app.post("/api/get_chunks")
-async def get_chunks(payload: ChunksPayload):
+async def get_chunks(request: Request, payload: ChunksPayload):
     try:
-        client = await client_manager.connect(payload.credentials)
+        client = await resolve_client(request, payload.credentials)
         chunks = await manager.weaviate_manager.get_chunks(
             client, payload.uuid, payload.page, payload.pageSize
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "error": "",
                 "chunks": chunks,
             }
         )
     except Exception as e:
-        msg.fail(f"Chunk retrieval failed: {str(e)}")
-        return JSONResponse(
+        log.error(f"Chunk retrieval failed: {str(e)}")
+        return ORJSONResponse(
             content={
                 "error": str(e),
                 "chunks": None,
@@ -638,21 +1001,21 @@ async def get_chunks(payload: ChunksPayload):
 
 # Retrieve specific document based on UUID
 @app.post("/api/get_chunk")
-async def get_chunk(payload: GetChunkPayload):
+async def get_chunk(request: Request, payload: GetChunkPayload):
     try:
-        client = await client_manager.connect(payload.credentials)
+        client = await resolve_client(request, payload.credentials)
         chunk = await manager.weaviate_manager.get_chunk(
             client, payload.uuid, payload.embedder
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "error": "",
                 "chunk": chunk,
             }
         )
     except Exception as e:
-        msg.fail(f"Chunk retrieval failed: {str(e)}")
-        return JSONResponse(
+        log.error(f"Chunk retrieval failed: {str(e)}")
+        return ORJSONResponse(
             content={
                 "error": str(e),
                 "chunk": None,
@@ -662,21 +1025,24 @@ async def get_chunk(payload: GetChunkPayload):
 
 ## Retrieve and search documents imported to Weaviate
 @app.post("/api/get_all_documents")
-async def get_all_documents(payload: SearchQueryPayload):
+async def get_all_documents(request: Request, payload: SearchQueryPayload):
     try:
-        client = await client_manager.connect(payload.credentials)
-        documents, total_count = await manager.weaviate_manager.get_documents(
-            client,
-            payload.query,
-            payload.pageSize,
-            payload.page,
-            payload.labels,
-            properties=["title", "extension", "fileSize", "labels", "source", "meta"],
+        client = await resolve_client(request, payload.credentials)
+        # Labels do not depend on the document query, so both run concurrently
+        (documents, total_count), labels = await asyncio.gather(
+            manager.weaviate_manager.get_documents(
+                client,
+                payload.query,
+                payload.pageSize,
+                payload.page,
+                payload.labels,
+                properties=["title", "extension", "fileSize", "labels", "source", "meta"],
+            ),
+            manager.weaviate_manager.get_labels(client),
         )
-        labels = await manager.weaviate_manager.get_labels(client)
 
-        msg.good(f"Succesfully retrieved document: {len(documents)} documents")
-        return JSONResponse(
+        log.info("Succesfully retrieved document: %d documents", len(documents))
+        return ORJSONResponse(
             content={
                 "documents": documents,
                 "labels": labels,
@@ -685,8 +1051,8 @@ async def get_all_documents(payload: SearchQueryPayload):
             }
         )
     except Exception as e:
-        msg.fail(f"Retrieving all documents failed: {str(e)}")
-        return JSONResponse(
+        log.error(f"Retrieving all documents failed: {str(e)}")
+        return ORJSONResponse(
             content={
                 "documents": [],
                 "label": [],
@@ -699,19 +1065,19 @@ async def get_all_documents(payload: SearchQueryPayload):
 # Delete specific document based on UUID
 @app.post("/api/delete_document")
 async def delete_document(payload: GetDocumentPayload):
-    if production == "Demo":
-        msg.warn("Can't delete documents when in Production Mode")
-        return JSONResponse(status_code=200, content={})
+    if IS_DEMO:
+        log.warning("Can't delete documents when in Production Mode")
+        return empty_json_response(200)
 
     try:
         client = await client_manager.connect(payload.credentials)
-        msg.info(f"Deleting {payload.uuid}")
+        log.info(f"Deleting {payload.uuid}")
         await manager.weaviate_manager.delete_document(client, payload.uuid)
-        return JSONResponse(status_code=200, content={})
+        return empty_json_response(200)
 
     except Exception as e:
-        msg.fail(f"Deleting Document with ID {payload.uuid} failed: {str(e)}")
-        return JSONResponse(status_code=400, content={})
+        log.error(f"Deleting Document with ID {payload.uuid} failed: {str(e)}")
+        return empty_json_response(400)
 
 
 ### DOCUMENT TAG MANAGEMENT ENDPOINTS
@@ -729,22 +1095,16 @@ async def update_document_tags(document_id: str, payload: UpdateDocumentTagsPayl
     Returns:
         JSONResponse with success status or error
     """
-    if production == "Demo":
-        msg.warn("Can't update document tags when in Production Mode")
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error": "Document tag updates are disabled in Demo mode",
-                "success": False
-            }
-        )
+    if IS_DEMO:
+        log.warning("Can't update document tags when in Production Mode")
+        return demo_rejection("document_tags")
     
     try:
         client = await client_manager.connect(payload.credentials)
         
         # Verify document_id matches payload
         if payload.document_id != document_id:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "error": "Document ID in URL does not match payload",
@@ -758,9 +1118,9 @@ async def update_document_tags(document_id: str, payload: UpdateDocumentTagsPayl
             tags=payload.tags
         )
         
-        msg.good(f"Updated tags for document: {document_id}")
+        log.info(f"Updated tags for document: {document_id}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
@@ -771,9 +1131,9 @@ async def update_document_tags(document_id: str, payload: UpdateDocumentTagsPayl
         )
         
     except Exception as e:
-        msg.fail(f"Failed to update document tags: {str(e)}")
+        log.error(f"Failed to update document tags: {str(e)}")
         status_code = 404 if "not found" in str(e).lower() else 500
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code,
             content={
                 "error": f"Failed to update document tags: {str(e)}",
@@ -799,7 +1159,7 @@ async def get_document_tags(document_id: str, payload: GetDocumentTagsPayload):
         
         # Verify document_id matches payload
         if payload.document_id != document_id:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "error": "Document ID in URL does not match payload",
@@ -812,9 +1172,9 @@ async def get_document_tags(document_id: str, payload: GetDocumentTagsPayload):
             document_id=document_id
         )
         
-        msg.info(f"Retrieved tags for document: {document_id}")
+        log.info(f"Retrieved tags for document: {document_id}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
@@ -824,9 +1184,9 @@ async def get_document_tags(document_id: str, payload: GetDocumentTagsPayload):
         )
         
     except Exception as e:
-        msg.fail(f"Failed to get document tags: {str(e)}")
+        log.error(f"Failed to get document tags: {str(e)}")
         status_code = 404 if "not found" in str(e).lower() else 500
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code,
             content={
                 "error": f"Failed to get document tags: {str(e)}",
@@ -851,9 +1211,9 @@ async def get_all_tags(payload: GetAllTagsPayload):
         
         tags = await manager.weaviate_manager.get_all_tags(client=client)
         
-        msg.info(f"Retrieved {len(tags)} unique tags")
+        log.info(f"Retrieved {len(tags)} unique tags")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
@@ -863,8 +1223,8 @@ async def get_all_tags(payload: GetAllTagsPayload):
         )
         
     except Exception as e:
-        msg.fail(f"Failed to get all tags: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to get all tags: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to get all tags: {str(e)}",
@@ -897,9 +1257,9 @@ async def search_documents_by_tags(payload: SearchDocumentsByTagsPayload):
             properties=["title", "extension", "fileSize", "labels", "source", "meta", "tags"]
         )
         
-        msg.info(f"Found {len(documents)} documents matching tags: {payload.tags}")
+        log.info(f"Found {len(documents)} documents matching tags: {payload.tags}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
@@ -913,8 +1273,8 @@ async def search_documents_by_tags(payload: SearchDocumentsByTagsPayload):
         )
         
     except Exception as e:
-        msg.fail(f"Failed to search documents by tags: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to search documents by tags: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to search documents by tags: {str(e)}",
@@ -929,8 +1289,8 @@ async def search_documents_by_tags(payload: SearchDocumentsByTagsPayload):
 
 @app.post("/api/reset")
 async def reset_verba(payload: ResetPayload):
-    if production == "Demo":
-        return JSONResponse(status_code=200, content={})
+    if IS_DEMO:
+        return empty_json_response(200)
 
     try:
         client = await client_manager.connect(payload.credentials)
@@ -943,13 +1303,17 @@ async def reset_verba(payload: ResetPayload):
         elif payload.resetMode == "SUGGESTIONS":
             await manager.weaviate_manager.delete_all_suggestions(client)
 
-        msg.info(f"Resetting Verba in ({payload.resetMode}) mode")
+        log.info(f"Resetting Verba in ({payload.resetMode}) mode")
+        if payload.resetMode in ("ALL", "CONFIG"):
+            rag_config_cache.invalidate("rag_config")
+        if payload.resetMode in ("ALL", "DOCUMENTS"):
+            skills_report_cache.invalidate("skills")
 
-        return JSONResponse(status_code=200, content={})
+        return empty_json_response(200)
 
     except Exception as e:
-        msg.warn(f"Failed to reset Verba {str(e)}")
-        return JSONResponse(status_code=500, content={})
+        log.warning(f"Failed to reset Verba {str(e)}")
+        return empty_json_response(500)
 
 
 # Get Status meta data
@@ -960,7 +1324,7 @@ async def get_meta(payload: Credentials):
         node_payload, collection_payload = await manager.weaviate_manager.get_metadata(
             client
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "error": "",
                 "node_payload": node_payload,
@@ -968,7 +1332,7 @@ async def get_meta(payload: Credentials):
             }
         )
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "error": f"Couldn't retrieve metadata {str(e)}",
                 "node_payload": {},
@@ -977,6 +1341,135 @@ async def get_meta(payload: Credentials):
         )
 
 
+### Batched reads
+
+
+async def batch_get_document(client, params: dict):
+    document = await manager.weaviate_manager.get_document(
+        client,
+        params["uuid"],
+        properties=[
+            "title",
+            "extension",
+            "fileSize",
+            "labels",
+            "source",
+            "meta",
+            "metadata",
+        ],
+    )
+    if document is None:
+        raise Exception("Couldn't retrieve requested document")
+    document["content"] = ""
+    return {"document": document}
+
+
+async def batch_get_datacount(client, params: dict):
+    document_uuids = [document["uuid"] for document in params.get("documentFilter", [])]
+    datacount = await manager.weaviate_manager.get_datacount(
+        client, params["embedding_model"], document_uuids
+    )
+    return {"datacount": datacount}
+
+
+async def batch_get_labels(client, params: dict):
+    return {"labels": await manager.weaviate_manager.get_labels(client)}
+
+
+async def batch_get_chunks(client, params: dict):
+    chunks = await manager.weaviate_manager.get_chunks(
+        client, params["uuid"], params["page"], params["pageSize"]
+    )
+    return {"chunks": chunks}
+
+
+async def batch_get_chunk(client, params: dict):
+    chunk = await manager.weaviate_manager.get_chunk(
+        client, params["uuid"], params["embedder"]
+    )
+    return {"chunk": chunk}
+
+
+async def batch_get_vectors(client, params: dict):
+    vector_groups = await manager.weaviate_manager.get_vectors(
+        client, params["uuid"], params["showAll"]
+    )
+    return {"vector_groups": vector_groups}
+
+
+async def batch_get_document_tags(client, params: dict):
+    tags = await manager.weaviate_manager.get_document_tags(
+        client=client, document_id=params["document_id"]
+    )
+    return {"document_id": params["document_id"], "tags": tags}
+
+
+async def batch_get_all_tags(client, params: dict):
+    tags = await manager.weaviate_manager.get_all_tags(client=client)
+    return {"tags": tags, "total_count": len(tags)}
+
+
+async def batch_get_meta(client, params: dict):
+    node_payload, collection_payload = await manager.weaviate_manager.get_metadata(
+        client
+    )
+    return {"node_payload": node_payload, "collection_payload": collection_payload}
+
+
+BATCH_HANDLERS = {
+    "get_document": batch_get_document,
+    "get_datacount": batch_get_datacount,
+    "get_labels": batch_get_labels,
+    "get_chunks": batch_get_chunks,
+    "get_chunk": batch_get_chunk,
+    "get_vectors": batch_get_vectors,
+    "get_document_tags": batch_get_document_tags,
+    "get_all_tags": batch_get_all_tags,
+    "get_meta": batch_get_meta,
+}
+
+
+async def run_batch_operation(client, op: str, params: dict) -> dict:
+    try:
+        handler = BATCH_HANDLERS.get(op)
+        if handler is None:
+            raise Exception(f"Unknown batch operation: {op}")
+        return {"op": op, "error": "", **(await handler(client, params))}
+    except KeyError as e:
+        log.error(f"Batch operation {op} missing parameter {str(e)}")
+        return {"op": op, "error": f"Missing parameter: {str(e)}"}
+    except Exception as e:
+        log.error(f"Batch operation {op} failed: {str(e)}")
+        return {"op": op, "error": str(e)}
+
+
+@app.post("/api/batch")
+async def batch_read(request: Request, payload: BatchRequestPayload):
+    """
+    Run several read operations concurrently over one shared client.
+    
+    Args:
+        payload: BatchRequestPayload with credentials and a list of {op, params}
+        
+    Returns:
+        ORJSONResponse with one result per request, in request order
+    """
+    try:
+        client = await resolve_client(request, payload.credentials)
+        results = await asyncio.gather(
+            *[
+                run_batch_operation(client, operation.op, operation.params)
+                for operation in payload.requests
+            ]
+        )
+        return ORJSONResponse(content={"error": "", "results": results})
+    except Exception as e:
+        log.error(f"Batch request failed: {str(e)}")
+        return ORJSONResponse(
+            content={"error": f"Batch request failed: {str(e)}", "results": []}
+        )
+
+
 ### Suggestions
 
 
@@ -987,13 +1480,13 @@ async def get_suggestions(payload: GetSuggestionsPayload):
         suggestions = await manager.weaviate_manager.retrieve_suggestions(
             client, payload.query, payload.limit
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "suggestions": suggestions,
             }
         )
     except Exception:
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "suggestions": [],
             }
@@ -1009,14 +1502,14 @@ async def get_all_suggestions(payload: GetAllSuggestionsPayload):
                 client, payload.page, payload.pageSize
             )
         )
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "suggestions": suggestions,
                 "total_count": total_count,
             }
         )
     except Exception:
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "suggestions": [],
                 "total_count": 0,
@@ -1024,21 +1517,17 @@ async def get_all_suggestions(payload: GetAllSuggestionsPayload):
         )
 
 
-@app.post("/api/delete_suggestion")
+@app.post("/api/delete_suggestion", status_code=204)
 async def delete_suggestion(payload: DeleteSuggestionPayload):
     try:
         client = await client_manager.connect(payload.credentials)
         await manager.weaviate_manager.delete_suggestions(client, payload.uuid)
-        return JSONResponse(
-            content={
-                "status": 200,
-            }
-        )
-    except Exception:
-        return JSONResponse(
-            content={
-                "status": 400,
-            }
+        return Response(status_code=204)
+    except Exception as e:
+        log.error(f"Failed to delete suggestion: {str(e)}")
+        return ORJSONResponse(
+            status_code=500,
+            content={"error": f"Failed to delete suggestion: {str(e)}"},
         )
 
 
@@ -1046,82 +1535,51 @@ async def delete_suggestion(payload: DeleteSuggestionPayload):
 
 
 @app.post("/api/worklogs")
-async def create_worklog(request: Request):
+async def create_worklog(payload: CreateWorkLogPayload):
     """
     Create a new work log entry.
     
     Args:
-        request: Request containing work log content and optional metadata
+        payload: CreateWorkLogPayload with content, optional metadata and
+            optional credentials; an empty content is rejected with 422
         
     Returns:
         JSONResponse with created work log entry or error
     """
-    if production == "Demo":
-        msg.warn("Can't create work logs when in Production Mode")
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error": "Work log creation is disabled in Demo mode",
-                "log": None
-            }
-        )
+    if IS_DEMO:
+        log.warning("Can't create work logs when in Production Mode")
+        return demo_rejection("worklog_create")
     
     try:
-        # Parse request body
-        body = await request.json()
-        content = body.get("content", "")
-        user_id = body.get("user_id", "default_user")
-        extracted_skills = body.get("extracted_skills", [])
-        metadata = body.get("metadata", {})
-        credentials = body.get("credentials", {})
-        
-        if not content:
-            return JSONResponse(
-                status_code=422,
-                content={
-                    "error": "Content is required",
-                    "log": None
-                }
-            )
-        
         # Get client
-        if credentials:
-            client = await client_manager.connect(Credentials(**credentials))
+        if payload.credentials:
+            client = await client_manager.connect(payload.credentials)
         else:
             client = await client_manager.get_client()
         
         # Create work log entry using WorkLogManager
-        from goldenverba.components.worklog_manager import WorkLogManager
-        worklog_manager = WorkLogManager()
-        
         entry = await worklog_manager.create_log_entry(
             client=client,
-            content=content,
-            user_id=user_id,
-            extracted_skills=extracted_skills,
-            metadata=metadata
+            content=payload.content,
+            user_id=payload.user_id,
+            extracted_skills=payload.extracted_skills,
+            metadata=payload.metadata
         )
         
-        msg.good(f"Created work log entry: {entry.id}")
+        log.info(f"Created work log entry: {entry.id}")
+        count_cache.invalidate("worklogs")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content={
                 "error": "",
-                "log": {
-                    "id": entry.id,
-                    "content": entry.content,
-                    "timestamp": entry.timestamp.isoformat(),
-                    "user_id": entry.user_id,
-                    "extracted_skills": entry.extracted_skills,
-                    "metadata": entry.metadata
-                }
+                "log": entry
             }
         )
         
     except Exception as e:
-        msg.fail(f"Failed to create work log entry: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to create work log entry: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to create work log entry: {str(e)}",
@@ -1130,13 +1588,49 @@ async def create_worklog(request: Request):
         )
 
 
+NDJSON_PAGE_SIZE = 500
+
+
+async def stream_worklogs_ndjson(client, user_id, start_dt, end_dt, limit: int):
+    # Pages come from the same filtered keyset query as the JSON path, so
+    # rows are newest first, only one page is held in memory, and each page
+    # is sent before the next one is fetched
+    sent = 0
+    cursor = None
+    try:
+        while sent < limit:
+            page_size = min(NDJSON_PAGE_SIZE, limit - sent)
+            entries = await worklog_manager.get_log_entries(
+                client=client,
+                user_id=user_id,
+                start_date=start_dt,
+                end_date=end_dt,
+                limit=page_size,
+                cursor=cursor,
+            )
+            for entry in entries:
+                yield orjson.dumps(entry) + b"\n"
+            sent += len(entries)
+            if len(entries) < page_size:
+                break
+            cursor = next_keyset_cursor([(entries[-1].timestamp, entries[-1].id)])
+    except Exception as e:
+        # Headers are already sent, so report the failure as a final line
+        log.error(f"Failed to stream work log entries: {str(e)}")
+        yield orjson.dumps(
+            {"error": f"Failed to stream work log entries: {str(e)}"}
+        ) + b"\n"
+
+
 @app.get("/api/worklogs")
 async def get_worklogs(
     user_id: str = None,
     start_date: str = None,
     end_date: str = None,
     limit: int = 100,
-    offset: int = 0
+    offset: int = 0,
+    cursor: str = None,
+    format: str = "json"
 ):
     """
     Retrieve work log entries with optional filtering.
@@ -1146,67 +1640,73 @@ async def get_worklogs(
         start_date: Optional start date filter (ISO format)
         end_date: Optional end date filter (ISO format)
         limit: Maximum number of entries to return
-        offset: Number of entries to skip
+        offset: Number of entries to skip (deprecated, prefer cursor)
+        cursor: Keyset cursor returned as next_cursor by the previous page
+        format: "json" for a paginated JSON object, or "ndjson" to stream up
+            to `limit` entries, one per line, in storage order
         
     Returns:
-        JSONResponse with list of work log entries or error
+        JSONResponse with list of work log entries or error, or a
+        StreamingResponse of NDJSON lines
     """
     try:
         # Use default credentials for GET request
         client = await client_manager.get_client()
         
-        from goldenverba.components.worklog_manager import WorkLogManager
-        from datetime import datetime
-        
-        worklog_manager = WorkLogManager()
-        
         # Parse dates if provided
-        start_dt = datetime.fromisoformat(start_date) if start_date else None
-        end_dt = datetime.fromisoformat(end_date) if end_date else None
-        
-        entries = await worklog_manager.get_log_entries(
-            client=client,
-            user_id=user_id,
-            start_date=start_dt,
-            end_date=end_dt,
-            limit=limit,
-            offset=offset
-        )
-        
-        # Get total count
-        total_count = await worklog_manager.count_log_entries(
-            client=client,
-            user_id=user_id
-        )
+        start_dt = parse_iso_utc(start_date) if start_date else None
+        end_dt = parse_iso_utc(end_date) if end_date else None
         
-        logs = [
-            {
-                "id": entry.id,
-                "content": entry.content,
-                "timestamp": entry.timestamp.isoformat(),
-                "user_id": entry.user_id,
-                "extracted_skills": entry.extracted_skills,
-                "metadata": entry.metadata
-            }
-            for entry in entries
-        ]
-        
-        msg.info(f"Retrieved {len(logs)} work log entries")
+        if format == "ndjson":
+            return StreamingResponse(
+                stream_worklogs_ndjson(client, user_id, start_dt, end_dt, limit),
+                media_type="application/x-ndjson",
+            )
         
-        return JSONResponse(
+        # Page and total count are independent queries, so run them concurrently
+        entries, total_count = await asyncio.gather(
+            worklog_manager.get_log_entries(
+                client=client,
+                user_id=user_id,
+                start_date=start_dt,
+                end_date=end_dt,
+                limit=limit,
+                offset=offset,
+                cursor=cursor
+            ),
+            cached_count(
+                (
+                    "worklogs",
+                    client_manager.hash_credentials(client_manager.default_credentials()),
+                    user_id,
+                ),
+                lambda: worklog_manager.count_log_entries(
+                    client=client,
+                    user_id=user_id
+                ),
+            ),
+        )
+        
+        log.info("Retrieved %d work log entries", len(entries))
+        
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
-                "logs": logs,
+                # WorkLogEntry is a dataclass, which orjson encodes directly
+                "logs": entries,
                 "total_count": total_count,
                 "limit": limit,
-                "offset": offset
+                "offset": offset,
+                "next_cursor": next_keyset_cursor(
+                    [(entry.timestamp, entry.id) for entry in entries[-1:]]
+                ) if len(entries) == limit else None
             }
         )
         
     except Exception as e:
-        msg.fail(f"Failed to retrieve work log entries: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to retrieve work log entries: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to retrieve work log entries: {str(e)}",
@@ -1228,31 +1728,16 @@ async def update_worklog(log_id: str, payload: UpdateWorkLogPayload):
     Returns:
         JSONResponse with updated work log entry or error
     """
-    if production == "Demo":
-        msg.warn("Can't update work logs when in Production Mode")
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error": "Work log updates are disabled in Demo mode",
-                "worklog": None
-            }
-        )
+    if IS_DEMO:
+        log.warning("Can't update work logs when in Production Mode")
+        return demo_rejection("worklog_update")
     
     try:
-        client = await client_manager.connect(payload.credentials)
-        
-        from goldenverba.components.worklog_manager import WorkLogManager
-        worklog_manager = WorkLogManager()
-        
         # Verify log_id matches payload
         if payload.log_id != log_id:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Log ID in URL does not match payload",
-                    "worklog": None
-                }
-            )
+            return id_mismatch("worklog")
+        
+        client = await client_manager.connect(payload.credentials)
         
         entry = await worklog_manager.update_log_entry(
             client=client,
@@ -1262,27 +1747,20 @@ async def update_worklog(log_id: str, payload: UpdateWorkLogPayload):
             metadata=payload.metadata
         )
         
-        msg.good(f"Updated work log entry: {entry.id}")
+        log.info(f"Updated work log entry: {entry.id}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
-                "worklog": {
-                    "id": entry.id,
-                    "content": entry.content,
-                    "timestamp": entry.timestamp.isoformat(),
-                    "user_id": entry.user_id,
-                    "extracted_skills": entry.extracted_skills,
-                    "metadata": entry.metadata
-                }
+                "worklog": entry
             }
         )
         
     except Exception as e:
-        msg.fail(f"Failed to update work log entry: {str(e)}")
-        status_code = 404 if "not found" in str(e).lower() else 500
-        return JSONResponse(
+        log.error(f"Failed to update work log entry: {str(e)}")
+        status_code = 404 if isinstance(e, WorkLogNotFoundError) else 500
+        return ORJSONResponse(
             status_code=status_code,
             content={
                 "error": f"Failed to update work log entry: {str(e)}",
@@ -1291,7 +1769,7 @@ async def update_worklog(log_id: str, payload: UpdateWorkLogPayload):
         )
 
 
-@app.delete("/api/worklogs/{log_id}")
+@app.delete("/api/worklogs/{log_id}", status_code=204)
 async def delete_worklog(log_id: str, payload: DeleteWorkLogPayload):
     """
     Delete a work log entry.
@@ -1301,54 +1779,34 @@ async def delete_worklog(log_id: str, payload: DeleteWorkLogPayload):
         payload: DeleteWorkLogPayload containing credentials
         
     Returns:
-        JSONResponse with success status or error
+        Empty 204 response on success, or JSONResponse with the error
     """
-    if production == "Demo":
-        msg.warn("Can't delete work logs when in Production Mode")
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error": "Work log deletion is disabled in Demo mode",
-                "deleted": False
-            }
-        )
+    if IS_DEMO:
+        log.warning("Can't delete work logs when in Production Mode")
+        return demo_rejection("worklog_delete")
     
     try:
-        client = await client_manager.connect(payload.credentials)
-        
-        from goldenverba.components.worklog_manager import WorkLogManager
-        worklog_manager = WorkLogManager()
-        
         # Verify log_id matches payload
         if payload.log_id != log_id:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Log ID in URL does not match payload",
-                    "deleted": False
-                }
-            )
+            return id_mismatch("worklog_delete")
+        
+        client = await client_manager.connect(payload.credentials)
         
-        success = await worklog_manager.delete_log_entry(
+        await worklog_manager.delete_log_entry(
             client=client,
             log_id=log_id
         )
         
-        msg.good(f"Deleted work log entry: {log_id}")
+        log.info(f"Deleted work log entry: {log_id}")
+        count_cache.invalidate("worklogs")
         
-        return JSONResponse(
-            status_code=200,
-            content={
-                "error": "",
-                "deleted": success,
-                "log_id": log_id
-            }
-        )
+        # Clients only need the status on success, so send no body
+        return Response(status_code=204)
         
     except Exception as e:
-        msg.fail(f"Failed to delete work log entry: {str(e)}")
-        status_code = 404 if "not found" in str(e).lower() else 500
-        return JSONResponse(
+        log.error(f"Failed to delete work log entry: {str(e)}")
+        status_code = 404 if isinstance(e, WorkLogNotFoundError) else 500
+        return ORJSONResponse(
             status_code=status_code,
             content={
                 "error": f"Failed to delete work log entry: {str(e)}",
@@ -1357,6 +1815,141 @@ async def delete_worklog(log_id: str, payload: DeleteWorkLogPayload):
         )
 
 
+def invalid_batch_body(e: ValidationError, key: str) -> tuple[int, dict]:
+    return 422, {
+        "error": "Invalid work log body",
+        "detail": e.errors(include_url=False, include_context=False),
+        key: None,
+    }
+
+
+async def worklog_batch_create(client, operation: WorkLogBatchOperation):
+    # Same schema as POST /api/worklogs, so nothing unvalidated reaches Weaviate
+    try:
+        body = CreateWorkLogPayload.model_validate(operation.body)
+    except ValidationError as e:
+        return invalid_batch_body(e, "log")
+    entry = await worklog_manager.create_log_entry(
+        client=client,
+        content=body.content,
+        user_id=body.user_id,
+        extracted_skills=body.extracted_skills,
+        metadata=body.metadata,
+    )
+    return 201, {"error": "", "log": entry}
+
+
+async def worklog_batch_update(client, operation: WorkLogBatchOperation):
+    try:
+        body = WorkLogUpdateFields.model_validate(operation.body)
+    except ValidationError as e:
+        return invalid_batch_body(e, "worklog")
+    entry = await worklog_manager.update_log_entry(
+        client=client,
+        log_id=operation.log_id,
+        content=body.content,
+        extracted_skills=body.extracted_skills,
+        metadata=body.metadata,
+    )
+    return 200, {"error": "", "worklog": entry}
+
+
+async def worklog_batch_delete(client, operation: WorkLogBatchOperation):
+    success = await worklog_manager.delete_log_entry(
+        client=client, log_id=operation.log_id
+    )
+    return 200, {"error": "", "deleted": success, "log_id": operation.log_id}
+
+
+async def worklog_batch_get(client, operation: WorkLogBatchOperation):
+    entry = await worklog_manager.get_log_entry_by_id(
+        client=client, log_id=operation.log_id
+    )
+    if entry is None:
+        return 404, {
+            "error": f"Work log entry not found: {operation.log_id}",
+            "worklog": None,
+        }
+    return 200, {"error": "", "worklog": entry}
+
+
+WORKLOG_BATCH_HANDLERS = {
+    "POST": worklog_batch_create,
+    "PUT": worklog_batch_update,
+    "DELETE": worklog_batch_delete,
+    "GET": worklog_batch_get,
+}
+
+
+async def run_worklog_batch_operation(
+    client, operation: WorkLogBatchOperation
+) -> dict:
+    try:
+        if IS_DEMO and operation.method != "GET":
+            status, body = 403, {"error": "Work log changes are disabled in Demo mode"}
+        elif operation.method != "POST" and not operation.log_id:
+            status, body = 400, {"error": "log_id is required"}
+        else:
+            status, body = await WORKLOG_BATCH_HANDLERS[operation.method](
+                client, operation
+            )
+    except Exception as e:
+        log.error(f"Batch {operation.method} on work log failed: {str(e)}")
+        status = 404 if isinstance(e, WorkLogNotFoundError) else 500
+        body = {"error": str(e)}
+    return {"id": operation.id, "status": status, "body": body}
+
+
+# Registered before the POST /api/worklogs/{log_id} route so "batch" is not
+# taken as a log ID
+@app.post("/api/worklogs/batch")
+async def batch_worklogs(payload: WorkLogBatchPayload):
+    """
+    Run several work log operations concurrently over one shared client.
+    
+    Operations are independent and may complete in any order, so a batch
+    should not contain two operations on the same log ID.
+    
+    Args:
+        payload: WorkLogBatchPayload with credentials and a list of
+            {id, method, log_id, body} sub-requests
+        
+    Returns:
+        ORJSONResponse with one {id, status, body} result per sub-request,
+        in request order
+    """
+    try:
+        client = await client_manager.connect(payload.credentials)
+        results = await asyncio.gather(
+            *[
+                run_worklog_batch_operation(client, operation)
+                for operation in payload.requests
+            ]
+        )
+        if any(
+            operation.method in ("POST", "DELETE") and result["status"] < 300
+            for operation, result in zip(payload.requests, results)
+        ):
+            count_cache.invalidate("worklogs")
+        
+        log.info(f"Ran {len(results)} batched work log operations")
+        
+        return ORJSONResponse(
+            status_code=200,
+            content={"error": "", "results": results}
+        )
+        
+    except Exception as e:
+        log.error(f"Work log batch request failed: {str(e)}")
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "error": f"Work log batch request failed: {str(e)}",
+                "results": []
+            }
+        )
+
+
 @app.post("/api/worklogs/{log_id}")
 async def get_worklog_by_id(log_id: str, payload: GetWorkLogByIdPayload):
     """
@@ -1370,20 +1963,11 @@ async def get_worklog_by_id(log_id: str, payload: GetWorkLogByIdPayload):
         JSONResponse with work log entry or error
     """
     try:
-        client = await client_manager.connect(payload.credentials)
-        
-        from goldenverba.components.worklog_manager import WorkLogManager
-        worklog_manager = WorkLogManager()
-        
         # Verify log_id matches payload
         if payload.log_id != log_id:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Log ID in URL does not match payload",
-                    "worklog": None
-                }
-            )
+            return id_mismatch("worklog")
+        
+        client = await client_manager.connect(payload.credentials)
         
         entry = await worklog_manager.get_log_entry_by_id(
             client=client,
@@ -1391,7 +1975,7 @@ async def get_worklog_by_id(log_id: str, payload: GetWorkLogByIdPayload):
         )
         
         if entry is None:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "error": f"Work log entry not found: {log_id}",
@@ -1399,24 +1983,14 @@ async def get_worklog_by_id(log_id: str, payload: GetWorkLogByIdPayload):
                 }
             )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
-            content={
-                "error": "",
-                "worklog": {
-                    "id": entry.id,
-                    "content": entry.content,
-                    "timestamp": entry.timestamp.isoformat(),
-                    "user_id": entry.user_id,
-                    "extracted_skills": entry.extracted_skills,
-                    "metadata": entry.metadata
-                }
-            }
+            content={"error": "", "worklog": entry}
         )
         
     except Exception as e:
-        msg.fail(f"Failed to retrieve work log entry: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to retrieve work log entry: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to retrieve work log entry: {str(e)}",
@@ -1442,7 +2016,7 @@ async def get_skills(request: Request):
     """
     try:
         # Parse request body
-        body = await request.json() if request.headers.get("content-length") else {}
+        body = await read_json_body(request)
         credentials = body.get("credentials", {})
         start_date = body.get("start_date")
         end_date = body.get("end_date")
@@ -1450,30 +2024,28 @@ async def get_skills(request: Request):
         
         # Get client
         if credentials:
-            client = await client_manager.connect(Credentials(**credentials))
+            credentials = Credentials(**credentials)
+            client = await client_manager.connect(credentials)
         else:
+            credentials = None
             client = await client_manager.get_client()
         
-        from goldenverba.components.skills_extractor import SkillsExtractor
-        from datetime import datetime, timezone
-        
-        skills_extractor = SkillsExtractor()
-        
-        # Parse dates if provided and ensure they're timezone-aware
-        start_dt = None
-        end_dt = None
-        
-        if start_date:
-            start_dt = datetime.fromisoformat(start_date)
-            if start_dt.tzinfo is None:
-                # Add UTC timezone if naive datetime
-                start_dt = start_dt.replace(tzinfo=timezone.utc)
+        cache_key = (
+            "skills",
+            client_manager.hash_credentials(
+                credentials or client_manager.default_credentials()
+            ),
+            start_date,
+            end_date,
+            category,
+        )
+        cached_body = skills_report_cache.get(cache_key)
+        if cached_body is not None:
+            return Response(content=cached_body, media_type="application/json")
         
-        if end_date:
-            end_dt = datetime.fromisoformat(end_date)
-            if end_dt.tzinfo is None:
-                # Add UTC timezone if naive datetime
-                end_dt = end_dt.replace(tzinfo=timezone.utc)
+        # Parse dates if provided, treating naive values as UTC
+        start_dt = parse_iso_utc(start_date) if start_date else None
+        end_dt = parse_iso_utc(end_date) if end_date else None
         
         # Generate skills report with filters
         report = await skills_extractor.aggregate_skills(
@@ -1483,25 +2055,17 @@ async def get_skills(request: Request):
             category_filter=category
         )
         
-        msg.info(f"Retrieved skills breakdown with {report.total_skills} total skills")
+        log.info(f"Retrieved skills breakdown with {report.total_skills} total skills")
         
-        return JSONResponse(
-            status_code=200,
-            content={
-                "error": "",
-                "skills_by_category": report.to_dict()["skills_by_category"],
-                "total_skills": report.total_skills,
-                "top_skills": report.to_dict()["top_skills"],
-                "recent_skills": report.to_dict()["recent_skills"],
-                "generated_at": report.generated_at.isoformat()
-            }
-        )
+        # Serialize the report once; each to_dict() rebuilds every skill dict
+        body = orjson.dumps({"error": "", **report.to_dict()})
+        skills_report_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        msg.fail(f"Failed to retrieve skills breakdown: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return JSONResponse(
+        # Traceback goes through the queue logger instead of a blocking stderr write
+        log.exception("Failed to retrieve skills breakdown: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to retrieve skills breakdown: {str(e)}",
@@ -1509,7 +2073,7 @@ async def get_skills(request: Request):
                 "total_skills": 0,
                 "top_skills": [],
                 "recent_skills": [],
-                "generated_at": datetime.now().isoformat()
+                "generated_at": datetime.now()
             }
         )
 
@@ -1525,41 +2089,8 @@ async def get_skill_categories(payload: GetSkillCategoriesPayload):
     Returns:
         JSONResponse with skill categories or error
     """
-    try:
-        # No need to connect to client for static categories
-        from goldenverba.components.skills_extractor import SKILL_CATEGORIES
-        
-        # Format categories with their example skills
-        categories = [
-            {
-                "name": category,
-                "display_name": category.replace("_", " ").title(),
-                "example_skills": skills[:5]  # First 5 skills as examples
-            }
-            for category, skills in SKILL_CATEGORIES.items()
-        ]
-        
-        msg.info(f"Retrieved {len(categories)} skill categories")
-        
-        return JSONResponse(
-            status_code=200,
-            content={
-                "error": "",
-                "categories": categories,
-                "total_categories": len(categories)
-            }
-        )
-        
-    except Exception as e:
-        msg.fail(f"Failed to retrieve skill categories: {str(e)}")
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": f"Failed to retrieve skill categories: {str(e)}",
-                "categories": [],
-                "total_categories": 0
-            }
-        )
+    # Categories are static, so the body is encoded once at import
+    return Response(content=SKILL_CATEGORIES_BODY, media_type="application/json")
 
 
 @app.post("/api/skills/extract")
@@ -1573,26 +2104,15 @@ async def extract_skills(payload: ExtractSkillsPayload):
     Returns:
         JSONResponse with extracted skills or error
     """
-    if production == "Demo":
-        msg.warn("Can't extract skills when in Production Mode")
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error": "Skill extraction is disabled in Demo mode",
-                "skills": [],
-                "categorized_skills": {}
-            }
-        )
+    if IS_DEMO:
+        log.warning("Can't extract skills when in Production Mode")
+        return demo_rejection("skills_extract")
     
     try:
         client = await client_manager.connect(payload.credentials)
         
-        from goldenverba.components.skills_extractor import SkillsExtractor
-        
-        skills_extractor = SkillsExtractor()
-        
         # Get RAG config for generator settings
-        rag_config = await manager.load_rag_config(client)
+        rag_config = await cached_rag_config(client, payload.credentials)
         generator_config = rag_config.get("Generator", {})
         
         # Extract skills from text
@@ -1606,9 +2126,9 @@ async def extract_skills(payload: ExtractSkillsPayload):
         # Categorize the extracted skills
         categorized_skills = skills_extractor.categorize_skills(extracted_skills)
         
-        msg.good(f"Extracted {len(extracted_skills)} skills from text")
+        log.info(f"Extracted {len(extracted_skills)} skills from text")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
@@ -1619,8 +2139,8 @@ async def extract_skills(payload: ExtractSkillsPayload):
         )
         
     except Exception as e:
-        msg.fail(f"Failed to extract skills: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to extract skills: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to extract skills: {str(e)}",
@@ -1646,33 +2166,28 @@ async def extract_skills_from_documents(request: Request):
     Returns:
         JSONResponse with extraction results or error
     """
-    if production == "Demo":
-        msg.warn("Can't extract skills when in Production Mode")
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error": "Skill extraction is disabled in Demo mode",
-                "success": False
-            }
-        )
+    if IS_DEMO:
+        log.warning("Can't extract skills when in Production Mode")
+        return demo_rejection("skills_extract_documents")
     
     try:
         # Parse request body
-        body = await request.json() if request.headers.get("content-length") else {}
+        body = await read_json_body(request)
         credentials = body.get("credentials", {})
         limit = body.get("limit", 100)
         
         # Get client
+        credentials = Credentials(**credentials) if credentials else None
         if credentials:
-            client = await client_manager.connect(Credentials(**credentials))
+            client = await client_manager.connect(credentials)
         else:
             client = await client_manager.get_client()
         
         # Get RAG config for generator settings
-        rag_config = await manager.load_rag_config(client)
+        rag_config = await cached_rag_config(client, credentials)
         generator_config = rag_config.get("Generator", {})
         
-        msg.info(f"Starting bulk skill extraction from up to {limit} documents")
+        log.info(f"Starting bulk skill extraction from up to {limit} documents")
         
         # Extract skills from all documents
         result = await manager.extract_skills_from_all_documents(
@@ -1680,9 +2195,10 @@ async def extract_skills_from_documents(request: Request):
             generator_config=generator_config,
             limit=limit
         )
+        skills_report_cache.invalidate("skills")
         
         if result["success"]:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "error": "",
@@ -1690,7 +2206,7 @@ async def extract_skills_from_documents(request: Request):
                 }
             )
         else:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={
                     "error": result.get("message", "Extraction failed"),
@@ -1699,10 +2215,9 @@ async def extract_skills_from_documents(request: Request):
             )
         
     except Exception as e:
-        msg.fail(f"Failed to extract skills from documents: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return JSONResponse(
+        # Traceback goes through the queue logger instead of a blocking stderr write
+        log.exception("Failed to extract skills from documents: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to extract skills from documents: {str(e)}",
@@ -1733,27 +2248,19 @@ async def generate_resume(payload: GenerateResumePayload):
     Returns:
         JSONResponse with generated resume or error
     """
-    if production == "Demo":
-        msg.warn("Can't generate resumes when in Production Mode")
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error": "Resume generation is disabled in Demo mode",
-                "resume": None
-            }
-        )
+    if IS_DEMO:
+        log.warning("Can't generate resumes when in Production Mode")
+        return demo_rejection("resume_generate")
     
     try:
         client = await client_manager.connect(payload.credentials)
         
-        from goldenverba.components.resume_generator import ResumeOptions
-        
         # Use manager's instances
         resume_generator = manager.resume_generator
         resume_tracker = manager.resume_tracker
         
         # Get RAG config for generator and embedder settings
-        rag_config = await manager.load_rag_config(client)
+        rag_config = await cached_rag_config(client, payload.credentials)
         generator_full_config = rag_config.get("Generator", {})
         embedder_full_config = rag_config.get("Embedder", {})
         
@@ -1766,17 +2273,15 @@ async def generate_resume(payload: GenerateResumePayload):
         embedder = manager.embedder_manager.get_embedder(selected_embedder)
         
         # Extract component-specific configs and convert to InputConfig objects
-        from goldenverba.components.types import InputConfig
-        
         raw_generator_config = generator_full_config.get("components", {}).get(selected_generator, {}).get("config", {})
-        msg.info(f"Raw generator config keys: {list(raw_generator_config.keys())}")
+        log.debug("Raw generator config keys: %s", list(raw_generator_config))
         generator_config = {}
         for key, value in raw_generator_config.items():
             if isinstance(value, dict) and "value" in value:
                 generator_config[key] = InputConfig(**value)
             else:
                 generator_config[key] = value
-        msg.info(f"Processed generator config keys: {list(generator_config.keys())}")
+        log.debug("Processed generator config keys: %s", list(generator_config))
         
         raw_embedder_config = embedder_full_config.get("components", {}).get(selected_embedder, {}).get("config", {})
         embedder_config = {}
@@ -1786,7 +2291,7 @@ async def generate_resume(payload: GenerateResumePayload):
             else:
                 embedder_config[key] = value
         
-        msg.info(f"Generating resume for role: {payload.target_role or 'unspecified'}")
+        log.info(f"Generating resume for role: {payload.target_role or 'unspecified'}")
         
         # Step 1: Extract job requirements
         requirements = await resume_generator.extract_job_requirements(
@@ -1827,7 +2332,13 @@ async def generate_resume(payload: GenerateResumePayload):
         )
         
         # Extract source log IDs from experiences
-        source_log_ids = [exp.get("id") for exp in experiences if exp.get("source") == resume_generator.worklog_collection]
+        worklog_collection = resume_generator.worklog_collection
+        source_log_ids = [
+            log_id
+            for exp in experiences
+            if exp.get("source") == worklog_collection
+            and (log_id := exp.get("id")) is not None
+        ]
         
         # Step 4: Save the resume record for tracking
         resume_record = await resume_tracker.save_resume_record(
@@ -1840,13 +2351,15 @@ async def generate_resume(payload: GenerateResumePayload):
             metadata={
                 "user_id": payload.user_id,
                 "experience_count": len(experiences),
-                "requirements": requirements.to_dict()
+                # JobRequirements is a dataclass, which orjson encodes directly
+                "requirements": requirements
             }
         )
         
-        msg.good(f"Successfully generated resume: {resume_record.id}")
+        log.info(f"Successfully generated resume: {resume_record.id}")
+        count_cache.invalidate("resumes")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content={
                 "error": "",
@@ -1856,16 +2369,20 @@ async def generate_resume(payload: GenerateResumePayload):
                     "job_description": resume_record.job_description,
                     "target_role": resume_record.target_role,
                     "format": resume_record.format,
-                    "generated_at": resume_record.generated_at.isoformat(),
+                    "generated_at": resume_record.generated_at,
                     "source_log_ids": resume_record.source_log_ids,
                     "metadata": resume_record.metadata
                 }
             }
         )
         
+    except ConnectionError as e:
+        log.error(f"Failed to generate resume: {str(e)}")
+        return weaviate_unavailable("resume")
+        
     except Exception as e:
-        msg.fail(f"Failed to generate resume: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to generate resume: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to generate resume: {str(e)}",
@@ -1888,30 +2405,33 @@ async def get_resumes(payload: GetResumesPayload):
     try:
         client = await client_manager.connect(payload.credentials)
         
-        from goldenverba.components.resume_tracker import ResumeTracker
-        from datetime import datetime
-        
-        resume_tracker = ResumeTracker()
-        
         # Parse dates if provided
-        start_dt = datetime.fromisoformat(payload.start_date) if payload.start_date else None
-        end_dt = datetime.fromisoformat(payload.end_date) if payload.end_date else None
-        
-        # Get resume history with filters
-        records = await resume_tracker.get_resume_history(
-            client=client,
-            target_role=payload.target_role,
-            start_date=start_dt,
-            end_date=end_dt,
-            format=None,
-            limit=payload.limit,
-            offset=payload.offset
-        )
-        
-        # Get total count
-        total_count = await resume_tracker.count_resume_records(
-            client=client,
-            target_role=payload.target_role
+        start_dt = parse_iso_utc(payload.start_date) if payload.start_date else None
+        end_dt = parse_iso_utc(payload.end_date) if payload.end_date else None
+        
+        # History page and total count are independent queries, so run them concurrently
+        records, total_count = await asyncio.gather(
+            resume_tracker.get_resume_history(
+                client=client,
+                target_role=payload.target_role,
+                start_date=start_dt,
+                end_date=end_dt,
+                format=None,
+                limit=payload.limit,
+                offset=payload.offset,
+                cursor=payload.cursor
+            ),
+            cached_count(
+                (
+                    "resumes",
+                    client_manager.hash_credentials(payload.credentials),
+                    payload.target_role,
+                ),
+                lambda: resume_tracker.count_resume_records(
+                    client=client,
+                    target_role=payload.target_role
+                ),
+            ),
         )
         
         resumes = [
@@ -1921,29 +2441,36 @@ async def get_resumes(payload: GetResumesPayload):
                 "job_description": record.job_description,
                 "target_role": record.target_role,
                 "format": record.format,
-                "generated_at": record.generated_at.isoformat(),
+                "generated_at": record.generated_at,
                 "source_log_ids": record.source_log_ids,
                 "metadata": record.metadata
             }
             for record in records
         ]
         
-        msg.info(f"Retrieved {len(resumes)} resume records")
+        log.info("Retrieved %d resume records", len(resumes))
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
                 "resumes": resumes,
                 "total_count": total_count,
                 "limit": payload.limit,
-                "offset": payload.offset
+                "offset": payload.offset,
+                "next_cursor": next_keyset_cursor(
+                    [(record.generated_at, record.id) for record in records[-1:]]
+                ) if len(records) == payload.limit else None
             }
         )
         
+    except ConnectionError as e:
+        log.error(f"Failed to retrieve resume history: {str(e)}")
+        return weaviate_unavailable("resume_history")
+        
     except Exception as e:
-        msg.fail(f"Failed to retrieve resume history: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to retrieve resume history: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to retrieve resume history: {str(e)}",
@@ -1966,29 +2493,16 @@ async def get_resume_by_id(resume_id: str, payload: GetResumeByIdPayload):
         JSONResponse with resume record or error
     """
     try:
-        client = await client_manager.connect(payload.credentials)
-        
-        from goldenverba.components.resume_tracker import ResumeTracker
-        
-        resume_tracker = ResumeTracker()
-        
         # Verify resume_id matches payload
         if payload.resume_id != resume_id:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Resume ID in URL does not match payload",
-                    "resume": None
-                }
-            )
+            return id_mismatch("resume")
         
-        record = await resume_tracker.get_resume_by_id(
-            client=client,
-            resume_id=resume_id
-        )
+        client = await client_manager.connect(payload.credentials)
+        
+        record = await resume_tracker.get_resume_by_id(client, resume_id)
         
         if record is None:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "error": f"Resume not found: {resume_id}",
@@ -1996,9 +2510,9 @@ async def get_resume_by_id(resume_id: str, payload: GetResumeByIdPayload):
                 }
             )
         
-        msg.info(f"Retrieved resume: {resume_id}")
+        log.info("Retrieved resume: %s", resume_id)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
@@ -2008,16 +2522,20 @@ async def get_resume_by_id(resume_id: str, payload: GetResumeByIdPayload):
                     "job_description": record.job_description,
                     "target_role": record.target_role,
                     "format": record.format,
-                    "generated_at": record.generated_at.isoformat(),
+                    "generated_at": record.generated_at,
                     "source_log_ids": record.source_log_ids,
                     "metadata": record.metadata
                 }
             }
         )
         
+    except ConnectionError as e:
+        log.error(f"Failed to retrieve resume: {str(e)}")
+        return weaviate_unavailable("resume")
+        
     except Exception as e:
-        msg.fail(f"Failed to retrieve resume: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to retrieve resume: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to retrieve resume: {str(e)}",
@@ -2038,43 +2556,28 @@ async def regenerate_resume(resume_id: str, payload: RegenerateResumePayload):
     Returns:
         JSONResponse with regenerated resume or error
     """
-    if production == "Demo":
-        msg.warn("Can't regenerate resumes when in Production Mode")
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error": "Resume regeneration is disabled in Demo mode",
-                "resume": None
-            }
-        )
+    if IS_DEMO:
+        log.warning("Can't regenerate resumes when in Production Mode")
+        return demo_rejection("resume_regenerate")
     
     try:
-        client = await client_manager.connect(payload.credentials)
-        
-        from goldenverba.components.resume_generator import ResumeGenerator, ResumeOptions
-        from goldenverba.components.resume_tracker import ResumeTracker
-        
-        resume_generator = ResumeGenerator()
-        resume_tracker = ResumeTracker()
-        
         # Verify resume_id matches payload
         if payload.resume_id != resume_id:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Resume ID in URL does not match payload",
-                    "resume": None
-                }
-            )
+            return id_mismatch("resume")
         
-        # Get the original resume record
-        original_record = await resume_tracker.get_resume_by_id(
-            client=client,
-            resume_id=resume_id
+        client = await client_manager.connect(payload.credentials)
+        
+        # Share the manager's generator, like generate_resume does
+        resume_generator = manager.resume_generator
+        
+        # The original record and the RAG config are independent reads
+        original_record, rag_config = await asyncio.gather(
+            resume_tracker.get_resume_by_id(client, resume_id),
+            cached_rag_config(client, payload.credentials),
         )
         
         if original_record is None:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "error": f"Resume not found: {resume_id}",
@@ -2083,7 +2586,6 @@ async def regenerate_resume(resume_id: str, payload: RegenerateResumePayload):
             )
         
         # Get RAG config for generator and embedder settings
-        rag_config = await manager.load_rag_config(client)
         generator_full_config = rag_config.get("Generator", {})
         embedder_full_config = rag_config.get("Embedder", {})
         
@@ -2096,8 +2598,6 @@ async def regenerate_resume(resume_id: str, payload: RegenerateResumePayload):
         embedder = manager.embedder_manager.get_embedder(selected_embedder)
         
         # Extract component-specific configs and convert to InputConfig objects
-        from goldenverba.components.types import InputConfig
-        
         raw_generator_config = generator_full_config.get("components", {}).get(selected_generator, {}).get("config", {})
         generator_config = {}
         for key, value in raw_generator_config.items():
@@ -2114,7 +2614,7 @@ async def regenerate_resume(resume_id: str, payload: RegenerateResumePayload):
             else:
                 embedder_config[key] = value
         
-        msg.info(f"Regenerating resume: {resume_id}")
+        log.info(f"Regenerating resume: {resume_id}")
         
         # Step 1: Extract job requirements
         requirements = await resume_generator.extract_job_requirements(
@@ -2153,7 +2653,13 @@ async def regenerate_resume(resume_id: str, payload: RegenerateResumePayload):
         )
         
         # Extract source log IDs from experiences
-        source_log_ids = [exp.get("id") for exp in experiences if exp.get("source") == resume_generator.worklog_collection]
+        worklog_collection = resume_generator.worklog_collection
+        source_log_ids = [
+            log_id
+            for exp in experiences
+            if exp.get("source") == worklog_collection
+            and (log_id := exp.get("id")) is not None
+        ]
         
         # Save the new resume record
         new_record = await resume_tracker.save_resume_record(
@@ -2167,13 +2673,15 @@ async def regenerate_resume(resume_id: str, payload: RegenerateResumePayload):
                 "user_id": original_record.metadata.get("user_id") if original_record.metadata else None,
                 "regenerated_from": resume_id,
                 "experience_count": len(experiences),
-                "requirements": requirements.to_dict()
+                # JobRequirements is a dataclass, which orjson encodes directly
+                "requirements": requirements
             }
         )
         
-        msg.good(f"Successfully regenerated resume: {new_record.id}")
+        log.info(f"Successfully regenerated resume: {new_record.id}")
+        count_cache.invalidate("resumes")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content={
                 "error": "",
@@ -2183,7 +2691,7 @@ async def regenerate_resume(resume_id: str, payload: RegenerateResumePayload):
                     "job_description": new_record.job_description,
                     "target_role": new_record.target_role,
                     "format": new_record.format,
-                    "generated_at": new_record.generated_at.isoformat(),
+                    "generated_at": new_record.generated_at,
                     "source_log_ids": new_record.source_log_ids,
                     "metadata": new_record.metadata
                 },
@@ -2191,9 +2699,13 @@ async def regenerate_resume(resume_id: str, payload: RegenerateResumePayload):
             }
         )
         
+    except ConnectionError as e:
+        log.error(f"Failed to regenerate resume: {str(e)}")
+        return weaviate_unavailable("resume")
+        
     except Exception as e:
-        msg.fail(f"Failed to regenerate resume: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to regenerate resume: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to regenerate resume: {str(e)}",
@@ -2214,32 +2726,16 @@ async def delete_resume(resume_id: str, payload: DeleteResumePayload):
     Returns:
         JSONResponse with success status or error
     """
-    if production == "Demo":
-        msg.warn("Can't delete resumes when in Production Mode")
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error": "Resume deletion is disabled in Demo mode",
-                "deleted": False
-            }
-        )
+    if IS_DEMO:
+        log.warning("Can't delete resumes when in Production Mode")
+        return demo_rejection("resume_delete")
     
     try:
-        client = await client_manager.connect(payload.credentials)
-        
-        from goldenverba.components.resume_tracker import ResumeTracker
-        
-        resume_tracker = ResumeTracker()
-        
         # Verify resume_id matches payload
         if payload.resume_id != resume_id:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Resume ID in URL does not match payload",
-                    "deleted": False
-                }
-            )
+            return id_mismatch("resume_delete")
+        
+        client = await client_manager.connect(payload.credentials)
         
         success = await resume_tracker.delete_resume_record(
             client=client,
@@ -2247,7 +2743,7 @@ async def delete_resume(resume_id: str, payload: DeleteResumePayload):
         )
         
         if not success:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "error": f"Resume not found: {resume_id}",
@@ -2255,9 +2751,10 @@ async def delete_resume(resume_id: str, payload: DeleteResumePayload):
                 }
             )
         
-        msg.good(f"Deleted resume: {resume_id}")
+        log.info(f"Deleted resume: {resume_id}")
+        count_cache.invalidate("resumes")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
@@ -2266,9 +2763,13 @@ async def delete_resume(resume_id: str, payload: DeleteResumePayload):
             }
         )
         
+    except ConnectionError as e:
+        log.error(f"Failed to delete resume: {str(e)}")
+        return weaviate_unavailable("resume_delete")
+        
     except Exception as e:
-        msg.fail(f"Failed to delete resume: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to delete resume: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to delete resume: {str(e)}",
@@ -2287,115 +2788,79 @@ async def export_resume(resume_id: str, payload: ExportResumePayload):
         payload: ExportResumePayload containing format and credentials
         
     Returns:
-        FileResponse with the exported resume file or JSONResponse with error
+        Response with the exported resume file or JSONResponse with error
     """
-    if production == "Demo":
-        msg.warn("Can't export resumes when in Production Mode")
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error": "Resume export is disabled in Demo mode"
-            }
-        )
+    if IS_DEMO:
+        log.warning("Can't export resumes when in Production Mode")
+        return demo_rejection("resume_export")
     
     try:
-        client = await client_manager.connect(payload.credentials)
-        
-        from goldenverba.components.resume_tracker import ResumeTracker
-        from goldenverba.components.resume_generator import ResumeGenerator, Resume
-        import tempfile
-        
-        resume_tracker = ResumeTracker()
-        resume_generator = ResumeGenerator()
-        
         # Verify resume_id matches payload
         if payload.resume_id != resume_id:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Resume ID in URL does not match payload"
-                }
-            )
+            return id_mismatch("resume_export")
+        
+        client = await client_manager.connect(payload.credentials)
+        
+        resume_generator = manager.resume_generator
         
         # Get the resume record
-        record = await resume_tracker.get_resume_by_id(
-            client=client,
-            resume_id=resume_id
-        )
+        record = await resume_tracker.get_resume_by_id(client, resume_id)
         
         if record is None:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "error": f"Resume not found: {resume_id}"
                 }
             )
         
-        msg.info(f"Exporting resume {resume_id} as {payload.format}")
+        log.info(f"Exporting resume {resume_id} as {payload.format}")
         
-        # Create Resume object from record
-        resume = Resume(
-            content=record.resume_content,
-            format=record.format,
-            generated_at=record.generated_at,
-            resume_id=record.id,
-            metadata={
-                "target_role": record.target_role,
-                "job_description": record.job_description
-            }
-        )
+        resume = Resume.from_record(record)
         
-        # Format the resume content
-        file_bytes = resume_generator.format_resume(
+        # PDF/DOCX rendering is CPU-bound, so keep it off the event loop
+        file_bytes = await asyncio.to_thread(
+            resume_generator.format_resume,
             resume=resume,
             target_format=payload.format,
             title=f"Resume - {record.target_role}",
             author=payload.author
         )
         
-        # Determine file extension and media type
-        if payload.format == "pdf":
-            extension = "pdf"
-            media_type = "application/pdf"
-        elif payload.format == "docx":
-            extension = "docx"
-            media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        else:  # markdown
-            extension = "md"
-            media_type = "text/markdown"
-        
-        # Create a temporary file to store the export
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{extension}") as tmp_file:
-            tmp_file.write(file_bytes)
-            tmp_file_path = tmp_file.name
+        # ExportResumePayload only accepts these formats, so the lookup can't miss
+        extension, media_type = EXPORT_FORMATS[payload.format]
         
         # Generate filename
-        safe_role = record.target_role.replace(" ", "_").replace("/", "-")
+        safe_role = UNSAFE_FILENAME_CHARS.sub("_", record.target_role).strip("_")[:64] or "resume"
         filename = f"resume_{safe_role}_{resume_id[:8]}.{extension}"
         
-        msg.good(f"Successfully exported resume as {filename}")
+        log.info(f"Successfully exported resume as {filename}")
         
-        return FileResponse(
-            path=tmp_file_path,
+        # The export is already in memory, so send it without a temp file
+        return Response(
+            content=file_bytes,
             media_type=media_type,
-            filename=filename,
             headers={
-                "Content-Disposition": f"attachment; filename={filename}"
+                "Content-Disposition": f'attachment; filename="{filename}"'
             }
         )
         
     except NotImplementedError as e:
-        msg.warn(f"Export format not yet implemented: {str(e)}")
-        return JSONResponse(
+        log.warning(f"Export format not yet implemented: {str(e)}")
+        return ORJSONResponse(
             status_code=501,
             content={
                 "error": f"Export format not yet implemented: {str(e)}"
             }
         )
         
+    except ConnectionError as e:
+        log.error(f"Failed to export resume: {str(e)}")
+        return weaviate_unavailable("resume_export")
+        
     except Exception as e:
-        msg.fail(f"Failed to export resume: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to export resume: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to export resume: {str(e)}"
@@ -2417,18 +2882,15 @@ async def create_conversation_session(payload: CreateConversationSessionPayload)
         JSONResponse with session_id or error
     """
     try:
-        # No need to connect to Weaviate for session creation
-        # Sessions are managed in-memory by the ResumeGenerator
-        
-        # Use the manager's resume_generator instance
-        session_id = manager.resume_generator.create_conversation_session(
+        # Sessions live in the manager's session store, not in Weaviate
+        session_id = await manager.resume_generator.create_conversation_session(
             session_id=payload.session_id,
             metadata=payload.metadata
         )
         
-        msg.good(f"Created conversation session: {session_id}")
+        log.info(f"Created conversation session: {session_id}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content={
                 "error": "",
@@ -2438,8 +2900,8 @@ async def create_conversation_session(payload: CreateConversationSessionPayload)
         )
         
     except Exception as e:
-        msg.fail(f"Failed to create conversation session: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to create conversation session: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to create conversation session: {str(e)}",
@@ -2448,6 +2910,31 @@ async def create_conversation_session(payload: CreateConversationSessionPayload)
         )
 
 
+if DEBUG_ENDPOINTS:
+
+    @app.get("/api/conversations/sessions/stats")
+    async def get_conversation_session_stats():
+        """
+        Get conversation session store statistics for tuning its limits.
+        
+        Returns:
+            JSONResponse with session count, hits and misses
+        """
+        try:
+            stats = await manager.resume_generator.get_session_stats()
+            return ORJSONResponse(status_code=200, content={"error": "", "stats": stats})
+            
+        except Exception as e:
+            log.error(f"Failed to get conversation session stats: {str(e)}")
+            return ORJSONResponse(
+                status_code=500,
+                content={
+                    "error": f"Failed to get conversation session stats: {str(e)}",
+                    "stats": None
+                }
+            )
+
+
 @app.post("/api/conversations/sessions/{session_id}/history")
 async def get_conversation_history(session_id: str, payload: GetConversationHistoryPayload):
     """
@@ -2463,19 +2950,14 @@ async def get_conversation_history(session_id: str, payload: GetConversationHist
     try:
         # Verify session_id matches payload
         if payload.session_id != session_id:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Session ID in URL does not match payload",
-                    "history": []
-                }
-            )
+            return id_mismatch("session_history")
         
-        # Get session info
-        session_info = manager.resume_generator.get_session_info(session_id)
+        session_info, history = await manager.resume_generator.get_session_snapshot(
+            session_id, payload.format
+        )
         
         if session_info is None:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "error": f"Session not found: {session_id}",
@@ -2483,15 +2965,9 @@ async def get_conversation_history(session_id: str, payload: GetConversationHist
                 }
             )
         
-        # Get conversation history
-        history = manager.resume_generator.get_conversation_history(
-            session_id=session_id,
-            format=payload.format
-        )
-        
-        msg.info(f"Retrieved conversation history for session {session_id}")
+        log.info(f"Retrieved conversation history for session {session_id}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
@@ -2502,8 +2978,8 @@ async def get_conversation_history(session_id: str, payload: GetConversationHist
         )
         
     except Exception as e:
-        msg.fail(f"Failed to get conversation history: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to get conversation history: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to get conversation history: {str(e)}",
@@ -2527,19 +3003,13 @@ async def reset_conversation_session(session_id: str, payload: ResetConversation
     try:
         # Verify session_id matches payload
         if payload.session_id != session_id:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Session ID in URL does not match payload",
-                    "success": False
-                }
-            )
+            return id_mismatch("session_update")
         
         # Reset the session
-        success = manager.resume_generator.reset_conversation_context(session_id)
+        success = await manager.resume_generator.reset_conversation_context(session_id)
         
         if not success:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "error": f"Session not found: {session_id}",
@@ -2547,9 +3017,9 @@ async def reset_conversation_session(session_id: str, payload: ResetConversation
                 }
             )
         
-        msg.good(f"Reset conversation session: {session_id}")
+        log.info(f"Reset conversation session: {session_id}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
@@ -2559,8 +3029,8 @@ async def reset_conversation_session(session_id: str, payload: ResetConversation
         )
         
     except Exception as e:
-        msg.fail(f"Failed to reset conversation session: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to reset conversation session: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to reset conversation session: {str(e)}",
@@ -2584,19 +3054,13 @@ async def delete_conversation_session(session_id: str, payload: DeleteConversati
     try:
         # Verify session_id matches payload
         if payload.session_id != session_id:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "Session ID in URL does not match payload",
-                    "success": False
-                }
-            )
+            return id_mismatch("session_update")
         
         # Delete the session
-        success = manager.resume_generator.delete_conversation_session(session_id)
+        success = await manager.resume_generator.delete_conversation_session(session_id)
         
         if not success:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "error": f"Session not found: {session_id}",
@@ -2604,9 +3068,9 @@ async def delete_conversation_session(session_id: str, payload: DeleteConversati
                 }
             )
         
-        msg.good(f"Deleted conversation session: {session_id}")
+        log.info(f"Deleted conversation session: {session_id}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "error": "",
@@ -2616,8 +3080,8 @@ async def delete_conversation_session(session_id: str, payload: DeleteConversati
         )
         
     except Exception as e:
-        msg.fail(f"Failed to delete conversation session: {str(e)}")
-        return JSONResponse(
+        log.error(f"Failed to delete conversation session: {str(e)}")
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": f"Failed to delete conversation session: {str(e)}",
@@ -40,6 +40,7 @@ def start(port, host, prod, workers):
     """
     Run the FastAPI application.
     """
+    # uvicorn's default loop="auto" already picks uvloop when it is installed
     uvicorn.run(
         "goldenverba.server.api:app",
         host=host,
@@ -1,4 +1,8 @@
-from fastapi import WebSocket
+from fastapi import WebSocket, Request
+from fastapi.responses import Response
+from starlette.responses import FileResponse
+from starlette.websockets import WebSocketDisconnect
+from fastapi.staticfiles import StaticFiles
 from goldenverba.server.types import (
     FileStatus,
     StatusReport,
@@ -7,6 +11,113 @@ from goldenverba.server.types import (
     CreateNewDocument,
 )
 from wasabi import msg
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+import asyncio
+import atexit
+import gzip
+import logging
+import os
+import queue
+import time
+import orjson
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread.
+
+    The stock handler merges `%s` args into the message before enqueueing,
+    on the caller's thread. Records here stay in-process, so they are queued
+    as-is and the QueueListener's handler formats them.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def create_queue_logger(name: str) -> logging.Logger:
+    """Create a logger whose records are formatted and written on a background thread.
+
+    Request handlers only enqueue records; a QueueListener does the formatting
+    and stdout I/O, so logging never blocks the event loop. Pass values as
+    `%s` args rather than f-strings so they are only formatted off the loop,
+    and not at all below the logger's level. The level can be
+    set with VERBA_LOG_LEVEL (defaults to INFO).
+    """
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s | %(message)s")
+    )
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(DeferredQueueHandler(log_queue))
+    logger.setLevel(os.getenv("VERBA_LOG_LEVEL", "INFO").upper())
+    logger.propagate = False
+    return logger
+
+
+class TTLCache:
+    """Small in-process cache whose entries expire after `ttl` seconds.
+
+    Keys are tuples whose first element is a namespace, so all entries of one
+    kind can be dropped together when the underlying data changes.
+    """
+
+    def __init__(self, ttl: float = 30, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries: dict[tuple, tuple] = {}
+
+    def get(self, key: tuple):
+        item = self.entries.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return None
+        return value
+
+    def set(self, key: tuple, value):
+        if key not in self.entries and len(self.entries) >= self.maxsize:
+            # Evict the oldest insertion
+            del self.entries[next(iter(self.entries))]
+        self.entries[key] = (value, time.monotonic() + self.ttl)
+
+    def invalidate(self, namespace: str):
+        for key in [key for key in self.entries if key[0] == namespace]:
+            del self.entries[key]
+
+    def clear(self):
+        self.entries.clear()
+
+
+async def receive_frame(socket: WebSocket) -> bytes | str:
+    """Receive the raw payload of the next WebSocket frame.
+
+    Binary frames are returned as bytes without a UTF-8 decode, text frames
+    as str; both can be passed straight to `model_validate_json`.
+    """
+    message = await socket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    if message.get("bytes") is not None:
+        return message["bytes"]
+    return message["text"]
+
+
+async def read_json_body(request: Request) -> dict:
+    """Parse a JSON request body with orjson, returning {} for an empty body."""
+    raw = await request.body()
+    return orjson.loads(raw) if raw else {}
 
 
 class LoggerManager:
@@ -46,17 +157,30 @@ class BatchManager:
         self.batches = {}
 
     def add_batch(self, payload: DataBatchPayload) -> FileConfig:
+        # The payload bounds order by its own total, so a later chunk must
+        # agree with the total the file's slots were allocated for
+        batch = self.batches.get(payload.fileID)
+        if batch is not None and payload.total != batch["total"]:
+            raise ValueError(
+                f"Chunk total {payload.total} of {payload.fileID} does not match {batch['total']}"
+            )
+
         try:
             # msg.info(f"Receiving Batch for {payload.fileID} : {payload.order} of {payload.total}")
 
             if payload.fileID not in self.batches:
+                # Preallocate one slot per chunk so out-of-order chunks land in place
                 self.batches[payload.fileID] = {
                     "fileID": payload.fileID,
                     "total": payload.total,
-                    "chunks": {},
+                    "received": 0,
+                    "chunks": [None] * payload.total,
                 }
 
-            self.batches[payload.fileID]["chunks"][payload.order] = payload.chunk
+            batch = self.batches[payload.fileID]
+            if batch["chunks"][payload.order] is None:
+                batch["received"] += 1
+            batch["chunks"][payload.order] = payload.chunk
 
             fileConfig = self.check_batch(payload.fileID)
 
@@ -70,10 +194,223 @@ class BatchManager:
             msg.fail(f"Failed to add batch to BatchManager: {str(e)}")
 
     def check_batch(self, fileID: str):
-        if len(self.batches[fileID]["chunks"].keys()) == self.batches[fileID]["total"]:
+        if self.batches[fileID]["received"] == self.batches[fileID]["total"]:
             msg.good(f"Collected all Batches of {fileID}")
-            chunks = self.batches[fileID]["chunks"]
-            data = "".join([chunks[chunk] for chunk in chunks])
+            data = "".join(self.batches[fileID]["chunks"])
             return FileConfig.model_validate_json(data)
         else:
             return None
+
+
+class SameOriginMiddleware:
+    """Reject /api/ requests whose Origin is neither this server nor localhost.
+
+    Written as pure ASGI middleware: it reads the raw scope headers instead
+    of going through BaseHTTPMiddleware, so allowed requests don't pay for a
+    Request/Response pair and an extra task. Static assets, pages, WebSockets
+    and the public /api/health probe are passed through untouched.
+    """
+
+    # Header values are compared as raw bytes; nothing is decoded unless the
+    # request is rejected
+    LOCAL_PREFIXES = (b"http://localhost:", b"http://127.0.0.1:")
+    LOOPBACK_PREFIX = b"http://127.0.0.1:"
+    SCHEME_PREFIXES = {"http": b"http://", "https": b"https://"}
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        path = scope["path"]
+        if not path.startswith("/api/") or path == "/api/health":
+            return await self.app(scope, receive, send)
+
+        origin = None
+        host = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"host":
+                host = value
+
+        # Allow requests without Origin header (same-origin requests from browser)
+        if origin is None:
+            return await self.app(scope, receive, send)
+
+        if host is None:
+            server_host, server_port = scope["server"]
+            host = f"{server_host}:{server_port}".encode()
+
+        # Allow localhost requests
+        if origin.startswith(self.LOCAL_PREFIXES):
+            if origin.startswith(self.LOOPBACK_PREFIX) or host.split(b":")[0] == b"localhost":
+                return await self.app(scope, receive, send)
+
+        scheme = scope["scheme"]
+        base_url = (
+            self.SCHEME_PREFIXES.get(scheme, f"{scheme}://".encode())
+            + host
+            + scope.get("root_path", "").encode()
+        ).rstrip(b"/")
+        if origin == base_url:
+            return await self.app(scope, receive, send)
+
+        await self.reject(scope, send, origin, base_url)
+
+    async def reject(self, scope, send, origin: bytes, base_url: bytes):
+        base = base_url.decode("latin-1")
+        query = scope.get("query_string", b"").decode("latin-1")
+        body = orjson.dumps(
+            {
+                "error": "Not allowed",
+                "details": {
+                    "request_origin": origin.decode("latin-1"),
+                    "expected_origin": base + "/",
+                    "request_method": scope["method"],
+                    "request_url": f"{base}{scope['path']}" + (f"?{query}" if query else ""),
+                    "expected_header": "Origin header matching the server's base URL or localhost",
+                },
+            }
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 403,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles that marks content-hashed Next.js build assets as immutable.
+
+    Files under `_next/static/` change name whenever their content changes,
+    so browsers can cache them for a year without revalidating. For the same
+    reason the server keeps the most requested of them in memory (up to
+    `cache_size` files of at most `max_cached_bytes` each), together with a
+    gzip copy for compressible types, and answers later GETs without a
+    stat() or open(). A matching If-None-Match gets a 304.
+    """
+
+    IMMUTABLE_PREFIX = "_next/static/"
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+    COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+    def __init__(self, *args, cache_size: int = 128, max_cached_bytes: int = 256 * 1024, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_size = cache_size
+        self.max_cached_bytes = max_cached_bytes
+        # path -> (headers, body, gzipped body or None)
+        self.cache: OrderedDict[str, tuple[dict, bytes, bytes | None]] = OrderedDict()
+
+    async def get_response(self, path: str, scope):
+        if not path.startswith(self.IMMUTABLE_PREFIX):
+            return await super().get_response(path, scope)
+
+        request_headers = dict(scope["headers"])
+        cacheable = scope["method"] == "GET" and b"range" not in request_headers
+        entry = self.cache.get(path) if cacheable else None
+        if entry is not None:
+            self.cache.move_to_end(path)
+            return self.cached_response(entry, request_headers)
+
+        response = await super().get_response(path, scope)
+        if response.status_code not in (200, 304):
+            return response
+        response.headers["Cache-Control"] = self.CACHE_CONTROL
+        if (
+            not cacheable
+            or not isinstance(response, FileResponse)
+            or response.stat_result.st_size > self.max_cached_bytes
+        ):
+            return response
+
+        body = await asyncio.to_thread(Path(response.path).read_bytes)
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key != "content-length"
+        }
+        compressed = None
+        if headers.get("content-type", "").startswith(self.COMPRESSIBLE_TYPES):
+            compressed = gzip.compress(body)
+            if len(compressed) >= len(body):
+                compressed = None
+        self.cache[path] = (headers, body, compressed)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return self.cached_response(self.cache[path], request_headers)
+
+    def cached_response(self, entry: tuple[dict, bytes, bytes | None], request_headers: dict):
+        headers, body, compressed = entry
+        if_none_match = request_headers.get(b"if-none-match")
+        if if_none_match is not None:
+            tags = [tag.strip(" W/") for tag in if_none_match.decode("latin-1").split(",")]
+            if headers["etag"] in tags:
+                return Response(
+                    status_code=304,
+                    headers={"etag": headers["etag"], "cache-control": self.CACHE_CONTROL},
+                )
+        if compressed is not None and b"gzip" in request_headers.get(b"accept-encoding", b""):
+            return Response(
+                compressed,
+                headers={**headers, "content-encoding": "gzip", "vary": "Accept-Encoding"},
+            )
+        return Response(body, headers=headers)
+
+
+class StreamBatcher:
+    """Coalesces generated chunks so several tokens share one WebSocket frame.
+
+    Pending chunks are merged into a single message and flushed once
+    `max_chunks` have accumulated, the final chunk arrives, or `max_delay`
+    seconds have passed since the first pending chunk. The delay is enforced
+    by a timer task, so a slow generator never holds tokens back longer than
+    that. The merged message keeps the shape of a single chunk, so clients
+    need no changes. Call `cancel()` when the stream is abandoned.
+    """
+
+    def __init__(self, socket: WebSocket, max_chunks: int = 8, max_delay: float = 0.02):
+        self.socket = socket
+        self.max_chunks = max_chunks
+        self.max_delay = max_delay
+        self.pending = []
+        self.timer: asyncio.Task | None = None
+        # The timer and add() may flush at once; frames must not interleave
+        self.lock = asyncio.Lock()
+
+    async def add(self, chunk: dict):
+        self.pending.append(chunk)
+        if len(self.pending) >= self.max_chunks or chunk.get("finish_reason") == "stop":
+            await self.flush()
+        elif self.timer is None:
+            self.timer = asyncio.create_task(self.flush_after_delay())
+
+    async def flush_after_delay(self):
+        await asyncio.sleep(self.max_delay)
+        self.timer = None
+        await self.flush()
+
+    def cancel(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+    async def flush(self):
+        self.cancel()
+        async with self.lock:
+            if not self.pending:
+                return
+            # The last chunk carries finish_reason and any final fields (full_text, cached, ...)
+            merged = dict(self.pending[-1])
+            merged["message"] = "".join(chunk.get("message", "") for chunk in self.pending)
+            self.pending = []
+            # orjson encodes straight to bytes, skipping the stdlib json round-trip
+            await self.socket.send_text(orjson.dumps(merged).decode())
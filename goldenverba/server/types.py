@@ -1,5 +1,6 @@
+from functools import cached_property
 from typing import Literal, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from enum import Enum
 
 
@@ -38,14 +39,25 @@ class ConnectPayload(BaseModel):
     port: str
 
 
+# The frontend uploads in 256K character chunks, so this allows files of about
+# 1 GiB while bounding the slots BatchManager preallocates per file
+MAX_IMPORT_CHUNKS = 4096
+
+
 class DataBatchPayload(BaseModel):
     chunk: str
     isLastChunk: bool
-    total: int
+    total: int = Field(ge=1, le=MAX_IMPORT_CHUNKS)
     fileID: str
-    order: int
+    order: int = Field(ge=0)
     credentials: Credentials
 
+    @model_validator(mode="after")
+    def check_order(self) -> "DataBatchPayload":
+        if self.order >= self.total:
+            raise ValueError(f"order {self.order} is out of range for {self.total} chunks")
+        return self
+
 
 class LoadPayload(BaseModel):
     reader: str
@@ -189,12 +201,20 @@ class QueryPayload(BaseModel):
     documentFilter: list[DocumentFilter]
     credentials: Credentials
 
+    @cached_property
+    def document_uuids(self) -> list[str]:
+        return [document.uuid for document in self.documentFilter]
+
 
 class DatacountPayload(BaseModel):
     embedding_model: str
     documentFilter: list[DocumentFilter]
     credentials: Credentials
 
+    @cached_property
+    def document_uuids(self) -> list[str]:
+        return [document.uuid for document in self.documentFilter]
+
 
 class SetRAGConfigPayload(BaseModel):
     rag_config: RAGConfig
@@ -263,11 +283,11 @@ class ResetPayload(BaseModel):
 
 
 class CreateWorkLogPayload(BaseModel):
-    content: str
-    user_id: str
-    extracted_skills: list[str] | None = None
-    metadata: dict | None = None
-    credentials: Credentials
+    content: str = Field(min_length=1)
+    user_id: str = "default_user"
+    extracted_skills: list[str] = []
+    metadata: dict = {}
+    credentials: Credentials | None = None
 
 
 class GetWorkLogsPayload(BaseModel):
@@ -279,11 +299,14 @@ class GetWorkLogsPayload(BaseModel):
     credentials: Credentials
 
 
-class UpdateWorkLogPayload(BaseModel):
-    log_id: str
+class WorkLogUpdateFields(BaseModel):
     content: str | None = None
     extracted_skills: list[str] | None = None
     metadata: dict | None = None
+
+
+class UpdateWorkLogPayload(WorkLogUpdateFields):
+    log_id: str
     credentials: Credentials
 
 
@@ -297,6 +320,18 @@ class GetWorkLogByIdPayload(BaseModel):
     credentials: Credentials
 
 
+class WorkLogBatchOperation(BaseModel):
+    id: str | None = None
+    method: Literal["GET", "POST", "PUT", "DELETE"]
+    log_id: str | None = None
+    body: dict = {}
+
+
+class WorkLogBatchPayload(BaseModel):
+    credentials: Credentials
+    requests: list[WorkLogBatchOperation]
+
+
 class GetSkillsPayload(BaseModel):
     credentials: Credentials
     start_date: str | None = None
@@ -345,6 +380,7 @@ class GetResumesPayload(BaseModel):
     target_role: str | None = None
     limit: int = 50
     offset: int = 0
+    cursor: str | None = None
 
 
 class GetResumeByIdPayload(BaseModel):
@@ -415,6 +451,16 @@ class GetAllTagsPayload(BaseModel):
     credentials: Credentials
 
 
+class BatchOperation(BaseModel):
+    op: str
+    params: dict = {}
+
+
+class BatchRequestPayload(BaseModel):
+    credentials: Credentials
+    requests: list[BatchOperation]
+
+
 class SearchDocumentsByTagsPayload(BaseModel):
     credentials: Credentials
     tags: list[str]
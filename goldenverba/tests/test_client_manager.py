@@ -0,0 +1,144 @@
+"""
+Tests for ClientManager.
+
+This module tests client caching and session resolution against a mocked VerbaManager.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from goldenverba.verba_manager import ClientManager
+from goldenverba.server.types import Credentials
+
+
+class TestClientManager:
+    """Test suite for ClientManager class."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock Weaviate client that reports as connected."""
+        client = MagicMock()
+        client.is_connected = MagicMock(return_value=True)
+        return client
+
+    @pytest.fixture
+    def client_manager(self, mock_client):
+        """Create a ClientManager whose connections return the mock client."""
+        manager = ClientManager()
+        manager.manager = MagicMock()
+        manager.manager.connect = AsyncMock(return_value=mock_client)
+        manager.manager.disconnect = AsyncMock()
+        return manager
+
+    @pytest.fixture
+    def credentials(self):
+        """Create custom deployment credentials."""
+        return Credentials(deployment="Custom", url="localhost", key="secret")
+
+    @pytest.mark.asyncio
+    async def test_connect_reuses_live_client(
+        self, client_manager, credentials, mock_client
+    ):
+        """Test that a connected cached client is reused."""
+        assert await client_manager.connect(credentials) is mock_client
+        assert await client_manager.connect(credentials) is mock_client
+
+        client_manager.manager.connect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_connect_replaces_dropped_client(
+        self, client_manager, credentials, mock_client
+    ):
+        """Test that a disconnected cached client is closed and replaced."""
+        await client_manager.connect(credentials)
+        mock_client.is_connected.return_value = False
+        new_client = MagicMock()
+        client_manager.manager.connect.return_value = new_client
+
+        assert await client_manager.connect(credentials) is new_client
+        client_manager.manager.disconnect.assert_awaited_once_with(mock_client)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connects_open_one_client(
+        self, client_manager, credentials, mock_client
+    ):
+        """Test that concurrent first requests share a single new connection."""
+        clients = await asyncio.gather(
+            *[client_manager.connect(credentials) for _ in range(5)]
+        )
+
+        assert all(client is mock_client for client in clients)
+        client_manager.manager.connect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_client_skips_lock(
+        self, client_manager, credentials, mock_client
+    ):
+        """Test that a live cached client is returned while the lock is held."""
+        await client_manager.connect(credentials)
+        lock = client_manager.get_or_create_lock(
+            client_manager.hash_credentials(credentials)
+        )
+
+        async with lock:
+            client = await asyncio.wait_for(
+                client_manager.connect(credentials), timeout=1
+            )
+
+        assert client is mock_client
+
+    @pytest.mark.asyncio
+    async def test_session_resolves_to_cached_client(
+        self, client_manager, credentials, mock_client
+    ):
+        """Test that a session id returns the client without reconnecting."""
+        session_id = await client_manager.create_session(credentials)
+
+        assert await client_manager.connect_session(session_id) is mock_client
+        client_manager.manager.connect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_session_raises(self, client_manager):
+        """Test that resolving an unknown session id raises."""
+        with pytest.raises(Exception, match="Unknown session"):
+            await client_manager.connect_session("missing")
+
+    @pytest.mark.asyncio
+    async def test_deleted_session_is_unknown(self, client_manager, credentials):
+        """Test that a deleted session id no longer resolves."""
+        session_id = await client_manager.create_session(credentials)
+
+        assert client_manager.delete_session(session_id) is True
+        assert client_manager.delete_session(session_id) is False
+        with pytest.raises(Exception, match="Unknown session"):
+            await client_manager.connect_session(session_id)
+
+    @pytest.mark.asyncio
+    async def test_clean_up_expires_sessions_with_their_client(
+        self, client_manager, credentials, mock_client
+    ):
+        """Test that removing an idle client also removes its sessions."""
+        session_id = await client_manager.create_session(credentials)
+        client_manager.max_time = -1
+
+        await client_manager.clean_up()
+
+        client_manager.manager.disconnect.assert_awaited_once_with(mock_client)
+        assert session_id not in client_manager.sessions
+        with pytest.raises(Exception, match="Unknown session"):
+            await client_manager.connect_session(session_id)
+
+    @pytest.mark.asyncio
+    async def test_stats_report_clients_without_hashes(
+        self, client_manager, credentials
+    ):
+        """Test that stats count cached clients and sessions."""
+        await client_manager.create_session(credentials)
+
+        stats = client_manager.stats()
+
+        assert stats["clients"] == 1
+        assert stats["connected"] == 1
+        assert stats["sessions"] == 1
+        assert client_manager.hash_credentials(credentials) not in str(stats)
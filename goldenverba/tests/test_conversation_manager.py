@@ -0,0 +1,130 @@
+"""
+Tests for conversation manager module.
+
+This module tests session handling through the in-memory session store.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from goldenverba.components.conversation_manager import (
+    ConversationManager,
+    InMemorySessionStore,
+    SessionStore,
+    create_session_store,
+)
+
+
+class TestConversationManager:
+    """Test suite for ConversationManager backed by InMemorySessionStore."""
+
+    @pytest.fixture
+    def conversation_manager(self):
+        """Create a ConversationManager that keeps two exchanges."""
+        return ConversationManager(max_exchanges=2, store=InMemorySessionStore())
+
+    @pytest.mark.asyncio
+    async def test_history_is_pruned_to_max_exchanges(self, conversation_manager):
+        """Test that only the newest exchanges are kept."""
+        session_id = await conversation_manager.create_session()
+
+        for i in range(3):
+            await conversation_manager.append_user_message(session_id, f"ask {i}")
+            await conversation_manager.append_assistant_message(session_id, f"answer {i}")
+
+        history = await conversation_manager.get_conversation_history(
+            session_id, format="openai"
+        )
+
+        assert [m["content"] for m in history] == [
+            "ask 1",
+            "answer 1",
+            "ask 2",
+            "answer 2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reset_and_delete(self, conversation_manager):
+        """Test that reset keeps the session and delete removes it."""
+        session_id = await conversation_manager.create_session("session_1", {"a": 1})
+        await conversation_manager.append_user_message(session_id, "hello")
+
+        assert await conversation_manager.reset_session(session_id) is True
+        info = await conversation_manager.get_session_info(session_id)
+        assert info["message_count"] == 0
+        assert info["metadata"] == {"a": 1}
+
+        assert await conversation_manager.delete_session(session_id) is True
+        assert await conversation_manager.get_session_info(session_id) is None
+        assert await conversation_manager.delete_session(session_id) is False
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reads_store_once(self, conversation_manager):
+        """Test that info and history come from a single store read."""
+        session_id = await conversation_manager.create_session("session_1")
+        await conversation_manager.append_user_message(session_id, "hello")
+
+        with patch.object(
+            conversation_manager.store, "get", wraps=conversation_manager.store.get
+        ) as store_get:
+            info, history = await conversation_manager.get_session_snapshot(
+                session_id, format="openai"
+            )
+
+        assert store_get.await_count == 1
+        assert info["message_count"] == 1
+        assert history == [{"role": "user", "content": "hello"}]
+        assert await conversation_manager.get_session_snapshot("missing") == (None, [])
+
+    @pytest.mark.asyncio
+    async def test_missing_session_is_reported(self, conversation_manager):
+        """Test that operations on an unknown session fail without raising."""
+        assert await conversation_manager.append_user_message("missing", "hi") is False
+        assert await conversation_manager.reset_session("missing") is False
+        assert await conversation_manager.get_messages("missing") == []
+
+
+class TestInMemorySessionStore:
+    """Test suite for InMemorySessionStore bounds."""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_session_is_evicted(self):
+        """Test that creating past max_sessions evicts the least recently used."""
+        conversation_manager = ConversationManager(
+            store=InMemorySessionStore(max_sessions=2)
+        )
+        await conversation_manager.create_session("a")
+        await conversation_manager.create_session("b")
+        await conversation_manager.get_session("a")
+        await conversation_manager.create_session("c")
+
+        assert sorted(await conversation_manager.get_all_session_ids()) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_expire(self):
+        """Test that sessions idle past the TTL are dropped and counted as misses."""
+        store = InMemorySessionStore(ttl_seconds=-1)
+        conversation_manager = ConversationManager(store=store)
+        await conversation_manager.create_session("a")
+
+        assert await conversation_manager.get_session("a") is None
+
+        stats = await conversation_manager.get_stats()
+        assert stats["size"] == 0
+        assert stats["hits"] == 0
+        assert stats["misses"] == 1
+
+
+class TestCreateSessionStore:
+    """Test suite for create_session_store."""
+
+    def test_defaults_to_in_memory(self, monkeypatch):
+        """Test that sessions stay in memory without a Redis URL."""
+        monkeypatch.delenv("VERBA_SESSION_REDIS_URL", raising=False)
+
+        assert isinstance(create_session_store(), InMemorySessionStore)
+
+    def test_store_interface_is_abstract(self):
+        """Test that SessionStore can't be used without a backend."""
+        with pytest.raises(TypeError):
+            SessionStore()
@@ -0,0 +1,400 @@
+"""
+Tests for server helpers.
+
+This module tests the WebSocket, upload batching, caching, logging and static file helpers.
+"""
+
+import asyncio
+import json
+import logging
+import queue
+import pytest
+from logging.handlers import QueueHandler
+from unittest.mock import AsyncMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from starlette.websockets import WebSocketDisconnect
+
+from pydantic import ValidationError
+
+from goldenverba.server.types import MAX_IMPORT_CHUNKS, Credentials, DataBatchPayload
+
+from goldenverba.server.helpers import (
+    BatchManager,
+    DeferredQueueHandler,
+    StreamBatcher,
+    ImmutableStaticFiles,
+    SameOriginMiddleware,
+    receive_frame,
+    read_json_body,
+    create_queue_logger,
+    TTLCache,
+)
+
+
+class TestBatchManager:
+    """Test suite for BatchManager class."""
+
+    def test_reassembles_out_of_order_chunks(self):
+        """Test that chunks are joined by their order, not arrival order."""
+        file_config = json.dumps(
+            {
+                "fileID": "file_1",
+                "filename": "notes.txt",
+                "isURL": False,
+                "overwrite": False,
+                "extension": "txt",
+                "source": "",
+                "content": "Hello world",
+                "labels": [],
+                "rag_config": {},
+                "file_size": 11,
+                "status": "READY",
+                "metadata": "",
+                "status_report": {},
+            }
+        )
+        parts = [file_config[:40], file_config[40:80], file_config[80:]]
+        credentials = Credentials(deployment="Local", url="", key="")
+        batcher = BatchManager()
+
+        results = [
+            batcher.add_batch(
+                DataBatchPayload(
+                    chunk=parts[order],
+                    isLastChunk=order == 2,
+                    total=3,
+                    fileID="file_1",
+                    order=order,
+                    credentials=credentials,
+                )
+            )
+            for order in [1, 0, 2]
+        ]
+
+        assert results[:2] == [None, None]
+        assert results[2].content == "Hello world"
+        assert batcher.batches == {}
+
+
+    @pytest.mark.parametrize(
+        "total, order",
+        [(3, -1), (3, 3), (0, 0), (MAX_IMPORT_CHUNKS + 1, 0)],
+    )
+    def test_rejects_out_of_range_chunks(self, total, order):
+        """Test that negative or out-of-range orders and oversized totals fail validation."""
+        with pytest.raises(ValidationError):
+            DataBatchPayload(
+                chunk="x",
+                isLastChunk=False,
+                total=total,
+                fileID="file_1",
+                order=order,
+                credentials=Credentials(deployment="Local", url="", key=""),
+            )
+
+    def test_rejects_chunk_with_different_total(self):
+        """Test that a chunk can't address slots beyond the file's first total."""
+        credentials = Credentials(deployment="Local", url="", key="")
+        batcher = BatchManager()
+        batcher.add_batch(
+            DataBatchPayload(
+                chunk="a", isLastChunk=False, total=2, fileID="file_1", order=0,
+                credentials=credentials,
+            )
+        )
+
+        with pytest.raises(ValueError, match="does not match"):
+            batcher.add_batch(
+                DataBatchPayload(
+                    chunk="b", isLastChunk=False, total=5, fileID="file_1", order=4,
+                    credentials=credentials,
+                )
+            )
+
+
+class TestStreamBatcher:
+    """Test suite for StreamBatcher class."""
+
+    @pytest.fixture
+    def mock_socket(self):
+        """Create a mock WebSocket."""
+        socket = AsyncMock()
+        socket.send_text = AsyncMock()
+        return socket
+
+    @pytest.mark.asyncio
+    async def test_merges_chunks_until_limit(self, mock_socket):
+        """Test that chunks are merged into one frame once the limit is reached."""
+        batcher = StreamBatcher(mock_socket, max_chunks=3, max_delay=60)
+
+        for token in ["a", "b", "c", "d"]:
+            await batcher.add({"message": token, "finish_reason": None})
+
+        mock_socket.send_text.assert_called_once()
+        frame = json.loads(mock_socket.send_text.call_args.args[0])
+        assert frame == {"message": "abc", "finish_reason": None}
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_stop(self, mock_socket):
+        """Test that the final chunk flushes immediately and keeps its extra fields."""
+        batcher = StreamBatcher(mock_socket, max_chunks=8, max_delay=60)
+
+        await batcher.add({"message": "Hello ", "finish_reason": None})
+        await batcher.add(
+            {"message": "world", "finish_reason": "stop", "full_text": "Hello world"}
+        )
+        await batcher.flush()
+
+        mock_socket.send_text.assert_called_once()
+        frame = json.loads(mock_socket.send_text.call_args.args[0])
+        assert frame == {
+            "message": "Hello world",
+            "finish_reason": "stop",
+            "full_text": "Hello world",
+        }
+
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_delay_without_new_chunks(self, mock_socket):
+        """Test that pending chunks are sent once max_delay passes, even if no chunk follows."""
+        batcher = StreamBatcher(mock_socket, max_chunks=8, max_delay=0.01)
+
+        await batcher.add({"message": "Hel", "finish_reason": None})
+        await batcher.add({"message": "lo", "finish_reason": None})
+        mock_socket.send_text.assert_not_called()
+        await asyncio.sleep(0.05)
+
+        mock_socket.send_text.assert_called_once()
+        frame = json.loads(mock_socket.send_text.call_args.args[0])
+        assert frame == {"message": "Hello", "finish_reason": None}
+
+
+class TestImmutableStaticFiles:
+    """Test suite for ImmutableStaticFiles class."""
+
+    @pytest.fixture
+    def static_client(self, tmp_path):
+        """Create a test client serving a temporary build directory."""
+        (tmp_path / "_next" / "static").mkdir(parents=True)
+        (tmp_path / "_next" / "static" / "app.js").write_text("console.log(1)")
+        (tmp_path / "index.html").write_text("<html></html>")
+        app = FastAPI()
+        app.mount("/static", ImmutableStaticFiles(directory=tmp_path), name="app")
+        return TestClient(app)
+
+    def test_hashed_assets_are_immutable(self, static_client):
+        """Test that build assets get a long-lived immutable cache header."""
+        response = static_client.get("/static/_next/static/app.js")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    def test_other_files_keep_default_headers(self, static_client):
+        """Test that non-hashed files are not marked immutable."""
+        response = static_client.get("/static/index.html")
+
+        assert response.status_code == 200
+        assert "immutable" not in response.headers.get("cache-control", "")
+
+    def test_hashed_assets_are_served_from_memory(self, static_client, tmp_path):
+        """Test that a cached asset survives removal from disk and honours ETags."""
+        first = static_client.get("/static/_next/static/app.js")
+        (tmp_path / "_next" / "static" / "app.js").unlink()
+
+        second = static_client.get("/static/_next/static/app.js")
+        assert second.status_code == 200
+        assert second.content == b"console.log(1)"
+        assert second.headers["etag"] == first.headers["etag"]
+
+        not_modified = static_client.get(
+            "/static/_next/static/app.js",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+    def test_cached_assets_are_gzipped(self, tmp_path):
+        """Test that compressible assets are sent gzipped to clients that accept it."""
+        (tmp_path / "_next" / "static").mkdir(parents=True)
+        (tmp_path / "_next" / "static" / "app.css").write_text("body { margin: 0 }\n" * 50)
+        app = FastAPI()
+        app.mount("/static", ImmutableStaticFiles(directory=tmp_path), name="app")
+        client = TestClient(app)
+
+        response = client.get("/static/_next/static/app.css", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == "body { margin: 0 }\n" * 50
+
+
+class TestSameOriginMiddleware:
+    """Test suite for SameOriginMiddleware class."""
+
+    @pytest.fixture
+    def origin_client(self):
+        """Create a test client for an app guarded by the middleware."""
+        app = FastAPI()
+        app.add_middleware(SameOriginMiddleware)
+
+        @app.get("/api/data")
+        async def data():
+            return {"ok": True}
+
+        @app.get("/page")
+        async def page():
+            return {"ok": True}
+
+        return TestClient(app, base_url="http://verba.example")
+
+    def test_same_origin_and_missing_origin_are_allowed(self, origin_client):
+        """Test that requests from the server's own origin pass through."""
+        assert origin_client.get("/api/data").status_code == 200
+        response = origin_client.get(
+            "/api/data", headers={"origin": "http://verba.example"}
+        )
+        assert response.status_code == 200
+
+    def test_foreign_origin_is_rejected(self, origin_client):
+        """Test that another origin gets a 403 with details."""
+        response = origin_client.get(
+            "/api/data?x=1", headers={"origin": "http://evil.example"}
+        )
+
+        assert response.status_code == 403
+        details = response.json()["details"]
+        assert details["request_origin"] == "http://evil.example"
+        assert details["expected_origin"] == "http://verba.example/"
+        assert details["request_url"] == "http://verba.example/api/data?x=1"
+
+    def test_non_api_paths_skip_the_check(self, origin_client):
+        """Test that pages are served regardless of Origin."""
+        response = origin_client.get("/page", headers={"origin": "http://evil.example"})
+
+        assert response.status_code == 200
+
+    def test_localhost_origin_needs_localhost_host(self):
+        """Test that a localhost origin is only trusted by a localhost server."""
+        app = FastAPI()
+        app.add_middleware(SameOriginMiddleware)
+
+        @app.get("/api/data")
+        async def data():
+            return {"ok": True}
+
+        local = TestClient(app, base_url="http://localhost:8000")
+        remote = TestClient(app, base_url="http://verba.example")
+        headers = {"origin": "http://localhost:3000"}
+
+        assert local.get("/api/data", headers=headers).status_code == 200
+        assert remote.get("/api/data", headers=headers).status_code == 403
+
+
+class TestReceiveFrame:
+    """Test suite for receive_frame helper."""
+
+    @pytest.mark.asyncio
+    async def test_returns_binary_and_text_payloads(self):
+        """Test that binary frames stay bytes and text frames stay str."""
+        socket = AsyncMock()
+        socket.receive = AsyncMock(
+            side_effect=[
+                {"type": "websocket.receive", "bytes": b'{"a": 1}'},
+                {"type": "websocket.receive", "text": '{"a": 1}'},
+            ]
+        )
+
+        assert await receive_frame(socket) == b'{"a": 1}'
+        assert await receive_frame(socket) == '{"a": 1}'
+
+    @pytest.mark.asyncio
+    async def test_raises_on_disconnect(self):
+        """Test that a disconnect message raises WebSocketDisconnect."""
+        socket = AsyncMock()
+        socket.receive = AsyncMock(
+            return_value={"type": "websocket.disconnect", "code": 1001}
+        )
+
+        with pytest.raises(WebSocketDisconnect):
+            await receive_frame(socket)
+
+
+class TestReadJsonBody:
+    """Test suite for read_json_body helper."""
+
+    @pytest.mark.asyncio
+    async def test_parses_body_and_defaults_to_empty(self):
+        """Test that a JSON body is parsed and an empty body yields {}."""
+        request = AsyncMock()
+        request.body = AsyncMock(side_effect=[b'{"content": "Shipped"}', b""])
+
+        assert await read_json_body(request) == {"content": "Shipped"}
+        assert await read_json_body(request) == {}
+
+
+class TestCreateQueueLogger:
+    """Test suite for create_queue_logger helper."""
+
+    def test_logger_enqueues_records(self):
+        """Test that records go through a queue handler and are not propagated."""
+        logger = create_queue_logger("verba.test")
+
+        assert isinstance(logger.handlers[0], QueueHandler)
+        assert logger.propagate is False
+        assert create_queue_logger("verba.test") is logger
+        assert len(logger.handlers) == 1
+
+    def test_records_are_formatted_by_the_listener(self):
+        """Test that queued records keep their args until the listener formats them."""
+        log_queue = queue.SimpleQueue()
+        logger = logging.getLogger("verba.test.deferred")
+        logger.addHandler(DeferredQueueHandler(log_queue))
+        logger.propagate = False
+
+        logger.warning("Retrieved %d entries", 3)
+        record = log_queue.get_nowait()
+
+        assert record.msg == "Retrieved %d entries"
+        assert record.args == (3,)
+        assert record.getMessage() == "Retrieved 3 entries"
+
+
+class TestTTLCache:
+    """Test suite for TTLCache class."""
+
+    def test_entries_expire(self):
+        """Test that entries are returned until their TTL passes."""
+        cache = TTLCache(ttl=60)
+        cache.set(("worklogs", "user_1"), 5)
+
+        assert cache.get(("worklogs", "user_1")) == 5
+
+        cache.ttl = -1
+        cache.set(("worklogs", "user_1"), 5)
+
+        assert cache.get(("worklogs", "user_1")) is None
+
+    def test_invalidate_namespace(self):
+        """Test that invalidating a namespace keeps other namespaces."""
+        cache = TTLCache(ttl=60)
+        cache.set(("worklogs", None), 1)
+        cache.set(("worklogs", "user_1"), 2)
+        cache.set(("resumes", "hash", None), 3)
+
+        cache.invalidate("worklogs")
+
+        assert cache.get(("worklogs", None)) is None
+        assert cache.get(("worklogs", "user_1")) is None
+        assert cache.get(("resumes", "hash", None)) == 3
+
+    def test_maxsize_evicts_oldest(self):
+        """Test that the oldest entry is evicted when the cache is full."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set(("a",), 1)
+        cache.set(("b",), 2)
+        cache.set(("c",), 3)
+
+        assert cache.get(("a",)) is None
+        assert cache.get(("c",)) == 3
@@ -0,0 +1,80 @@
+"""
+Tests for the file import WebSocket.
+
+This module tests import concurrency against a mocked VerbaManager.
+"""
+
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from goldenverba.server import api
+
+
+class TestImportFiles:
+    """Test suite for /ws/import_files."""
+
+    def test_imports_are_bounded(self, monkeypatch):
+        """Test that imports overlap but never exceed MAX_CONCURRENT_IMPORTS."""
+        monkeypatch.setattr(api, "IS_DEMO", False)
+        monkeypatch.setattr(api, "MAX_CONCURRENT_IMPORTS", 2)
+        monkeypatch.setattr(
+            api.client_manager, "connect", AsyncMock(return_value=MagicMock())
+        )
+        batch_manager = MagicMock()
+        batch_manager.add_batch = MagicMock(side_effect=lambda batch: batch.fileID)
+        monkeypatch.setattr(api, "BatchManager", MagicMock(return_value=batch_manager))
+
+        in_flight = 0
+        peak = 0
+        imported = []
+
+        async def import_document(client, fileConfig, logger):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            imported.append(fileConfig)
+
+        monkeypatch.setattr(api.manager, "import_document", import_document)
+
+        with TestClient(api.app).websocket_connect("/ws/import_files") as websocket:
+            for i in range(4):
+                websocket.send_text(
+                    json.dumps(
+                        {
+                            "chunk": "",
+                            "isLastChunk": True,
+                            "total": 1,
+                            "fileID": f"file_{i}",
+                            "order": 0,
+                            "credentials": {"deployment": "Local", "url": "", "key": ""},
+                        }
+                    )
+                )
+            # The test client cancels the handler on close, so let imports drain
+            time.sleep(0.2)
+
+        assert peak == 2
+        assert sorted(imported) == ["file_0", "file_1", "file_2", "file_3"]
+
+    def test_oversized_frame_closes_before_parsing(self, monkeypatch):
+        """Test that a frame over MAX_IMPORT_FRAME_BYTES is never validated."""
+        monkeypatch.setattr(api, "IS_DEMO", False)
+        monkeypatch.setattr(api, "MAX_IMPORT_FRAME_BYTES", 16)
+        data_batch_payload = MagicMock()
+        monkeypatch.setattr(api, "DataBatchPayload", data_batch_payload)
+
+        with TestClient(api.app).websocket_connect("/ws/import_files") as websocket:
+            websocket.send_bytes(b"x" * 17)
+            with pytest.raises(WebSocketDisconnect) as disconnect:
+                websocket.receive_text()
+
+        assert disconnect.value.code == 1009
+        data_batch_payload.model_validate_json.assert_not_called()
@@ -0,0 +1,138 @@
+"""
+Tests for the resume endpoints.
+
+This module tests resume export and RAG config caching against mocked components.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from goldenverba.server import api
+from goldenverba.components.resume_tracker import ResumeRecord
+
+
+class TestExportResume:
+    """Test suite for POST /api/resumes/{resume_id}/export."""
+
+    @pytest.fixture
+    def test_client(self, monkeypatch):
+        """Create a test client with a mocked tracker and generator."""
+        monkeypatch.setattr(api, "IS_DEMO", False)
+        monkeypatch.setattr(
+            api.client_manager, "connect", AsyncMock(return_value=MagicMock())
+        )
+        record = ResumeRecord(
+            resume_content="# Resume",
+            job_description="Backend role",
+            target_role="Backend Engineer",
+            generated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            record_id="abcdef123456",
+        )
+        resume_tracker = MagicMock()
+        resume_tracker.get_resume_by_id = AsyncMock(return_value=record)
+        monkeypatch.setattr(api, "resume_tracker", resume_tracker)
+        resume_generator = MagicMock()
+        resume_generator.format_resume = MagicMock(return_value=b"# Resume")
+        monkeypatch.setattr(api.manager, "resume_generator", resume_generator)
+        return TestClient(api.app)
+
+    def test_export_is_sent_from_memory(self, test_client):
+        """Test that the export bytes are returned as an attachment."""
+        response = test_client.post(
+            "/api/resumes/abcdef123456/export",
+            json={
+                "resume_id": "abcdef123456",
+                "format": "markdown",
+                "credentials": {"deployment": "Local", "url": "", "key": ""},
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.content == b"# Resume"
+        assert response.headers["content-type"].startswith("text/markdown")
+        assert response.headers["content-disposition"] == (
+            'attachment; filename="resume_Backend_Engineer_abcdef12.md"'
+        )
+
+    def test_filename_is_sanitized(self, test_client):
+        """Test that unsafe characters in the target role are replaced."""
+        api.resume_tracker.get_resume_by_id.return_value.target_role = 'R&D / "Lead" <QA>'
+
+        response = test_client.post(
+            "/api/resumes/abcdef123456/export",
+            json={
+                "resume_id": "abcdef123456",
+                "format": "markdown",
+                "credentials": {"deployment": "Local", "url": "", "key": ""},
+            },
+        )
+
+        assert response.headers["content-disposition"] == (
+            'attachment; filename="resume_R_D_Lead_QA_abcdef12.md"'
+        )
+
+    def test_resume_id_mismatch_is_rejected(self, test_client):
+        """Test that a payload ID differing from the path ID returns 400."""
+        payload = {
+            "resume_id": "other",
+            "format": "markdown",
+            "credentials": {"deployment": "Local", "url": "", "key": ""},
+        }
+
+        for _ in range(2):
+            response = test_client.post("/api/resumes/abcdef123456/export", json=payload)
+
+            assert response.status_code == 400
+            assert response.json() == {"error": "Resume ID in URL does not match payload"}
+
+        api.client_manager.connect.assert_not_awaited()
+
+
+class TestWeaviateUnavailable:
+    """Test suite for resume endpoints when Weaviate can't be reached."""
+
+    def test_connection_error_returns_503(self, monkeypatch):
+        """Test that a connection failure returns 503 without the raw error."""
+        monkeypatch.setattr(
+            api.client_manager,
+            "connect",
+            AsyncMock(side_effect=ConnectionError("http://secret-cluster:8080 refused")),
+        )
+        test_client = TestClient(api.app)
+
+        response = test_client.post(
+            "/api/resumes/abcdef123456",
+            json={
+                "resume_id": "abcdef123456",
+                "credentials": {"deployment": "Local", "url": "", "key": ""},
+            },
+        )
+
+        assert response.status_code == 503
+        assert response.json() == {
+            "error": api.WEAVIATE_UNAVAILABLE_ERROR,
+            "resume": None,
+        }
+
+
+class TestCachedRagConfig:
+    """Test suite for the RAG config cache used by the LLM endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_config_is_reused_until_invalidated(self, monkeypatch):
+        """Test that the config is read once per credentials until it changes."""
+        monkeypatch.setattr(api, "rag_config_cache", api.TTLCache(ttl=60))
+        load_rag_config = AsyncMock(return_value={"Generator": {}})
+        monkeypatch.setattr(api.manager, "load_rag_config", load_rag_config)
+        credentials = api.Credentials(deployment="Local", url="", key="")
+
+        await api.cached_rag_config(MagicMock(), credentials)
+        await api.cached_rag_config(MagicMock(), credentials)
+        assert load_rag_config.await_count == 1
+
+        api.rag_config_cache.invalidate("rag_config")
+        await api.cached_rag_config(MagicMock(), credentials)
+        assert load_rag_config.await_count == 2
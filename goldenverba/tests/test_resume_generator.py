@@ -0,0 +1,119 @@
+"""
+Tests for resume generator module.
+
+This module tests job requirement extraction against a mocked LLM generator.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from goldenverba.components.resume_generator import ResumeGenerator
+from goldenverba.components.types import InputConfig
+
+
+def make_generator(response: str):
+    """Create a generator mock that streams the given response."""
+    generator = MagicMock()
+    generator.name = "Ollama"
+
+    async def generate_stream(**kwargs):
+        await asyncio.sleep(0.01)
+        yield {"message": response}
+
+    generator.generate_stream = MagicMock(side_effect=generate_stream)
+    return generator
+
+
+def make_config(model: str) -> dict:
+    """Create the selected generator's component config, as the API passes it."""
+    return {
+        "Model": InputConfig(type="dropdown", value=model, description="", values=[])
+    }
+
+
+class TestExtractJobRequirements:
+    """Test suite for ResumeGenerator.extract_job_requirements caching."""
+
+    @pytest.mark.asyncio
+    async def test_same_description_skips_llm(self):
+        """Test that a repeated job description reuses the extracted requirements."""
+        resume_generator = ResumeGenerator()
+        generator = make_generator('{"required_skills": ["Python"]}')
+        config = make_config("llama3")
+
+        first = await resume_generator.extract_job_requirements("Backend role", generator, config)
+        first.required_skills.append("mutated")
+        second = await resume_generator.extract_job_requirements("Backend role", generator, config)
+
+        assert second.required_skills == ["Python"]
+        assert generator.generate_stream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_is_not_cached(self):
+        """Test that a response without JSON is retried on the next call."""
+        resume_generator = ResumeGenerator()
+        generator = make_generator("no json here")
+        config = make_config("llama3")
+
+        await resume_generator.extract_job_requirements("Backend role", generator, config)
+        await resume_generator.extract_job_requirements("Backend role", generator, config)
+
+        assert generator.generate_stream.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        """Test that identical in-flight extractions are coalesced."""
+        resume_generator = ResumeGenerator()
+        generator = make_generator('{"required_skills": ["Python"]}')
+        config = make_config("llama3")
+
+        results = await asyncio.gather(
+            *[
+                resume_generator.extract_job_requirements("Backend role", generator, config)
+                for _ in range(3)
+            ]
+        )
+
+        assert generator.generate_stream.call_count == 1
+        assert [r.required_skills for r in results] == [["Python"]] * 3
+        assert len({id(r) for r in results}) == 3
+        assert resume_generator._requirements_pending == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_request_does_not_cancel_followers(self):
+        """Test that a follower still gets the result if the request that started the call is cancelled."""
+        resume_generator = ResumeGenerator()
+        generator = make_generator('{"required_skills": ["Python"]}')
+        config = make_config("llama3")
+
+        first = asyncio.create_task(
+            resume_generator.extract_job_requirements("Backend role", generator, config)
+        )
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            resume_generator.extract_job_requirements("Backend role", generator, config)
+        )
+        await asyncio.sleep(0)
+        first.cancel()
+
+        result = await follower
+
+        assert first.cancelled()
+        assert result.required_skills == ["Python"]
+        assert generator.generate_stream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_models_do_not_share_results(self):
+        """Test that requirements extracted by one model aren't served for another."""
+        resume_generator = ResumeGenerator()
+        generator = make_generator('{"required_skills": ["Python"]}')
+
+        await resume_generator.extract_job_requirements(
+            "Backend role", generator, make_config("llama3")
+        )
+        await resume_generator.extract_job_requirements(
+            "Backend role", generator, make_config("mistral")
+        )
+
+        assert generator.generate_stream.call_count == 2
@@ -0,0 +1,58 @@
+"""
+Tests for the skills endpoints.
+
+This module tests skills report caching against a mocked SkillsExtractor.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from goldenverba.server import api
+from goldenverba.components.skills_extractor import SkillsReport
+
+
+class TestGetSkills:
+    """Test suite for POST /api/skills."""
+
+    @pytest.fixture
+    def skills_extractor(self, monkeypatch):
+        """Mock the skills extractor and give the endpoint a fresh cache."""
+        monkeypatch.setattr(api, "skills_report_cache", api.TTLCache(ttl=60))
+        monkeypatch.setattr(
+            api.client_manager, "connect", AsyncMock(return_value=MagicMock())
+        )
+        skills_extractor = MagicMock()
+        skills_extractor.aggregate_skills = AsyncMock(
+            return_value=SkillsReport(
+                skills_by_category={},
+                total_skills=0,
+                top_skills=[],
+                recent_skills=[],
+                generated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+        )
+        monkeypatch.setattr(api, "skills_extractor", skills_extractor)
+        return skills_extractor
+
+    def test_report_is_cached_per_filter(self, skills_extractor):
+        """Test that a repeated filter reuses the encoded report until invalidated."""
+        test_client = TestClient(api.app)
+        credentials = {"deployment": "Local", "url": "", "key": ""}
+
+        first = test_client.post("/api/skills", json={"credentials": credentials})
+        second = test_client.post("/api/skills", json={"credentials": credentials})
+        test_client.post(
+            "/api/skills", json={"credentials": credentials, "category": "frameworks"}
+        )
+
+        assert first.status_code == 200
+        assert second.json() == first.json()
+        assert first.json()["generated_at"] == "2024-01-01T00:00:00+00:00"
+        assert skills_extractor.aggregate_skills.await_count == 2
+
+        api.skills_report_cache.invalidate("skills")
+        test_client.post("/api/skills", json={"credentials": credentials})
+        assert skills_extractor.aggregate_skills.await_count == 3
@@ -0,0 +1,83 @@
+"""
+Tests for skills extractor module.
+
+This module tests skill extraction caching against a mocked LLM call and Weaviate client.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from goldenverba.components.skills_extractor import SkillsExtractor
+
+
+def make_generator_config(model="llama3"):
+    """Create a generator config selecting the given Ollama model."""
+    return {
+        "selected": "Ollama",
+        "components": {"Ollama": {"config": {"Model": {"value": model}}}},
+    }
+
+
+class TestSkillsExtractorCache:
+    """Test suite for the in-process extraction cache."""
+
+    @pytest.fixture
+    def skills_extractor(self):
+        """Create a SkillsExtractor whose LLM and Weaviate cache are mocked."""
+        extractor = SkillsExtractor(memory_cache_size=2)
+        extractor._call_llm_for_extraction = AsyncMock(return_value=["Python"])
+        extractor._get_cached_skills = AsyncMock(return_value=None)
+        extractor._cache_skills = AsyncMock(return_value=True)
+        return extractor
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_skips_llm(self, skills_extractor):
+        """Test that identical text and model are served from memory."""
+        client = MagicMock()
+        config = make_generator_config()
+
+        first = await skills_extractor.extract_skills(client, "Wrote Python", config)
+        first.append("mutated")
+        second = await skills_extractor.extract_skills(client, "Wrote Python", config)
+
+        assert second == ["Python"]
+        skills_extractor._call_llm_for_extraction.assert_awaited_once()
+        skills_extractor._get_cached_skills.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_by_model(self, skills_extractor):
+        """Test that a different model does not reuse another model's result."""
+        client = MagicMock()
+
+        await skills_extractor.extract_skills(
+            client, "Wrote Python", make_generator_config("llama3")
+        )
+        await skills_extractor.extract_skills(
+            client, "Wrote Python", make_generator_config("mistral")
+        )
+
+        assert skills_extractor._call_llm_for_extraction.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_bypasses_memory(self, skills_extractor):
+        """Test that use_cache=False always calls the LLM."""
+        client = MagicMock()
+        config = make_generator_config()
+
+        await skills_extractor.extract_skills(client, "Wrote Python", config)
+        await skills_extractor.extract_skills(
+            client, "Wrote Python", config, use_cache=False
+        )
+
+        assert skills_extractor._call_llm_for_extraction.await_count == 2
+
+    def test_memory_cache_evicts_least_recently_used(self, skills_extractor):
+        """Test that the least recently used entry is evicted when full."""
+        skills_extractor._set_memory_cached_skills("a", ["A"])
+        skills_extractor._set_memory_cached_skills("b", ["B"])
+        skills_extractor._get_memory_cached_skills("a")
+        skills_extractor._set_memory_cached_skills("c", ["C"])
+
+        assert skills_extractor._get_memory_cached_skills("b") is None
+        assert skills_extractor._get_memory_cached_skills("a") == ["A"]
+        assert skills_extractor._get_memory_cached_skills("c") == ["C"]
@@ -0,0 +1,27 @@
+"""
+Tests for component utilities.
+
+This module tests the date parsing helpers shared by the API filters.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from goldenverba.components.util import parse_iso_utc
+
+
+class TestParseIsoUtc:
+    """Test suite for parse_iso_utc helper."""
+
+    def test_naive_dates_become_utc(self):
+        """Test that a date without an offset is treated as UTC."""
+        assert parse_iso_utc("2024-01-01") == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def test_offsets_are_kept(self):
+        """Test that an explicit offset is preserved."""
+        parsed = parse_iso_utc("2024-01-01T09:00:00+02:00")
+
+        assert parsed.utcoffset() == timedelta(hours=2)
+
+    def test_repeated_values_are_cached(self):
+        """Test that the same string returns the cached datetime."""
+        assert parse_iso_utc("2024-02-01") is parse_iso_utc("2024-02-01")
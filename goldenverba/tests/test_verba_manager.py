@@ -0,0 +1,73 @@
+"""
+Tests for VerbaManager.
+
+This module tests bulk skill extraction against mocked Weaviate and skills components.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from goldenverba.verba_manager import VerbaManager
+
+
+class TestExtractSkillsFromAllDocuments:
+    """Test suite for VerbaManager.extract_skills_from_all_documents."""
+
+    @pytest.fixture
+    def verba_manager(self):
+        """Create a VerbaManager whose document store and extractor are mocked."""
+        manager = VerbaManager()
+        documents = [{"uuid": f"doc_{i}", "title": f"Doc {i}"} for i in range(4)]
+        manager.weaviate_manager = MagicMock()
+        manager.weaviate_manager.get_documents = AsyncMock(
+            return_value=(documents, len(documents))
+        )
+        manager.weaviate_manager.get_chunks = AsyncMock(
+            return_value=[{"content": "Built data pipelines in Python " * 3}]
+        )
+        manager.skills_extractor = MagicMock()
+        manager.skills_extractor.categorize_skills = MagicMock(
+            return_value={"programming_languages": ["Python"]}
+        )
+        manager.skills_extractor.store_or_update_skill = AsyncMock()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_extracts_concurrently_within_limit(self, verba_manager):
+        """Test that extraction overlaps across documents but stays under the cap."""
+        in_flight = 0
+        peak = 0
+
+        async def extract_skills(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ["Python"]
+
+        verba_manager.skills_extractor.extract_skills = extract_skills
+
+        result = await verba_manager.extract_skills_from_all_documents(
+            MagicMock(), {}, max_concurrency=2
+        )
+
+        assert peak == 2
+        assert result["documents_processed"] == 4
+        assert result["skills_extracted"] == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_documents_are_reported(self, verba_manager):
+        """Test that one failing document does not stop the others."""
+        verba_manager.skills_extractor.extract_skills = AsyncMock(
+            side_effect=[["Python"], Exception("LLM timeout"), ["Python"], ["Python"]]
+        )
+
+        result = await verba_manager.extract_skills_from_all_documents(
+            MagicMock(), {}
+        )
+
+        assert result["success"] is True
+        assert result["documents_processed"] == 3
+        assert result["failed_documents"] == ["Doc 1"]
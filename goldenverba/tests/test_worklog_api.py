@@ -0,0 +1,236 @@
+"""
+Tests for the work log endpoints.
+
+This module tests batching and NDJSON streaming against a mocked
+WorkLogManager.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from goldenverba.server import api
+from goldenverba.components.worklog_manager import WorkLogEntry, WorkLogNotFoundError
+
+
+class TestWorkLogBatch:
+    """Test suite for POST /api/worklogs/batch."""
+
+    @pytest.fixture
+    def test_client(self, monkeypatch):
+        """Create a test client with a mocked client manager and work log manager."""
+        monkeypatch.setattr(api, "IS_DEMO", False)
+        monkeypatch.setattr(
+            api.client_manager, "connect", AsyncMock(return_value=MagicMock())
+        )
+        worklog_manager = MagicMock()
+        worklog_manager.create_log_entry = AsyncMock(
+            return_value=WorkLogEntry(content="new", user_id="user_1", entry_id="a")
+        )
+        worklog_manager.delete_log_entry = AsyncMock(
+            side_effect=WorkLogNotFoundError("Work log entry not found: b")
+        )
+        worklog_manager.get_log_entry_by_id = AsyncMock(return_value=None)
+        monkeypatch.setattr(api, "worklog_manager", worklog_manager)
+        return TestClient(api.app)
+
+    def test_results_keep_request_order_and_status(self, test_client):
+        """Test that each sub-request gets its own id, status and body."""
+        response = test_client.post(
+            "/api/worklogs/batch",
+            json={
+                "credentials": {"deployment": "Local", "url": "", "key": ""},
+                "requests": [
+                    {"id": "1", "method": "POST", "body": {"content": "new"}},
+                    {"id": "2", "method": "DELETE", "log_id": "b"},
+                    {"id": "3", "method": "GET", "log_id": "c"},
+                    {"id": "4", "method": "PUT"},
+                ],
+            },
+        )
+
+        results = response.json()["results"]
+        assert response.status_code == 200
+        assert [(r["id"], r["status"]) for r in results] == [
+            ("1", 201),
+            ("2", 404),
+            ("3", 404),
+            ("4", 400),
+        ]
+        assert results[0]["body"]["log"]["id"] == "a"
+        api.client_manager.connect.assert_awaited_once()
+
+    def test_invalid_bodies_are_rejected(self, test_client):
+        """Test that create and update bodies are validated before reaching Weaviate."""
+        response = test_client.post(
+            "/api/worklogs/batch",
+            json={
+                "credentials": {"deployment": "Local", "url": "", "key": ""},
+                "requests": [
+                    {"id": "1", "method": "POST", "body": {"content": ""}},
+                    {
+                        "id": "2",
+                        "method": "POST",
+                        "body": {"content": "new", "extracted_skills": "Python"},
+                    },
+                    {
+                        "id": "3",
+                        "method": "PUT",
+                        "log_id": "a",
+                        "body": {"metadata": ["not", "a", "dict"]},
+                    },
+                ],
+            },
+        )
+
+        results = response.json()["results"]
+        assert [r["status"] for r in results] == [422, 422, 422]
+        assert results[1]["body"]["detail"][0]["loc"] == ["extracted_skills"]
+        api.worklog_manager.create_log_entry.assert_not_called()
+        api.worklog_manager.update_log_entry.assert_not_called()
+
+
+class TestCreateWorkLog:
+    """Test suite for POST /api/worklogs."""
+
+    @pytest.fixture
+    def worklog_manager(self, monkeypatch):
+        """Mock the default client and the shared WorkLogManager."""
+        monkeypatch.setattr(api, "IS_DEMO", False)
+        monkeypatch.setattr(
+            api.client_manager, "get_client", AsyncMock(return_value=MagicMock())
+        )
+        worklog_manager = MagicMock()
+        worklog_manager.create_log_entry = AsyncMock(
+            return_value=WorkLogEntry(content="new", user_id="default_user")
+        )
+        monkeypatch.setattr(api, "worklog_manager", worklog_manager)
+        return worklog_manager
+
+    def test_defaults_are_filled_by_payload_model(self, worklog_manager):
+        """Test that omitted fields get their defaults before reaching the manager."""
+        response = TestClient(api.app).post("/api/worklogs", json={"content": "new"})
+
+        assert response.status_code == 201
+        kwargs = worklog_manager.create_log_entry.call_args.kwargs
+        assert kwargs["user_id"] == "default_user"
+        assert kwargs["extracted_skills"] == []
+
+    def test_empty_content_is_rejected(self, worklog_manager):
+        """Test that empty content fails validation without touching Weaviate."""
+        response = TestClient(api.app).post("/api/worklogs", json={"content": ""})
+
+        assert response.status_code == 422
+        worklog_manager.create_log_entry.assert_not_called()
+
+
+class TestDeleteWorkLog:
+    """Test suite for DELETE /api/worklogs/{log_id}."""
+
+    def test_success_returns_empty_204(self, monkeypatch):
+        """Test that a successful delete sends no body."""
+        monkeypatch.setattr(api, "IS_DEMO", False)
+        monkeypatch.setattr(
+            api.client_manager, "connect", AsyncMock(return_value=MagicMock())
+        )
+        worklog_manager = MagicMock()
+        worklog_manager.delete_log_entry = AsyncMock(return_value=True)
+        monkeypatch.setattr(api, "worklog_manager", worklog_manager)
+
+        response = TestClient(api.app).request(
+            "DELETE",
+            "/api/worklogs/a",
+            json={
+                "log_id": "a",
+                "credentials": {"deployment": "Local", "url": "", "key": ""},
+            },
+        )
+
+        assert response.status_code == 204
+        assert response.content == b""
+
+
+class TestGetWorkLogById:
+    """Test suite for POST /api/worklogs/{log_id}."""
+
+    def test_every_fetch_reads_the_current_entry(self, monkeypatch):
+        """Test that entries are read per request, so other workers' writes are seen."""
+        monkeypatch.setattr(
+            api.client_manager, "connect", AsyncMock(return_value=MagicMock())
+        )
+        worklog_manager = MagicMock()
+        worklog_manager.get_log_entry_by_id = AsyncMock(
+            side_effect=[
+                WorkLogEntry(content="old", user_id="user_1", entry_id="a"),
+                None,
+            ]
+        )
+        monkeypatch.setattr(api, "worklog_manager", worklog_manager)
+        test_client = TestClient(api.app)
+        payload = {
+            "log_id": "a",
+            "credentials": {"deployment": "Local", "url": "", "key": ""},
+        }
+
+        assert test_client.post("/api/worklogs/a", json=payload).json()["worklog"]["content"] == "old"
+        assert test_client.post("/api/worklogs/a", json=payload).status_code == 404
+
+
+class TestWorkLogNdjson:
+    """Test suite for GET /api/worklogs?format=ndjson."""
+
+    def test_streams_keyset_pages_up_to_limit(self, monkeypatch):
+        """Test that entries are streamed page by page as NDJSON lines, capped at limit."""
+        monkeypatch.setattr(
+            api.client_manager, "get_client", AsyncMock(return_value=MagicMock())
+        )
+        monkeypatch.setattr(api, "NDJSON_PAGE_SIZE", 2)
+        entries = [
+            WorkLogEntry(content=f"entry {index}", user_id="user_1", entry_id=str(index))
+            for index in range(5)
+        ]
+        worklog_manager = MagicMock()
+        worklog_manager.get_log_entries = AsyncMock(
+            side_effect=[entries[0:2], entries[2:3]]
+        )
+        monkeypatch.setattr(api, "worklog_manager", worklog_manager)
+
+        response = TestClient(api.app).get(
+            "/api/worklogs",
+            params={"format": "ndjson", "limit": 3, "user_id": "user_1"},
+        )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [line["content"] for line in lines] == ["entry 0", "entry 1", "entry 2"]
+        first, second = worklog_manager.get_log_entries.call_args_list
+        assert first.kwargs["user_id"] == "user_1"
+        assert first.kwargs["cursor"] is None
+        assert second.kwargs["limit"] == 1
+        assert second.kwargs["cursor"] is not None
+
+
+class TestDemoRejections:
+    """Test suite for pre-encoded Demo mode rejections."""
+
+    def test_writes_are_rejected_with_fixed_body(self, monkeypatch):
+        """Test that Demo mode writes get a 403 with the endpoint's body."""
+        monkeypatch.setattr(api, "IS_DEMO", True)
+        test_client = TestClient(api.app)
+
+        responses = [
+            test_client.post("/api/worklogs", json={"content": "new"})
+            for _ in range(2)
+        ]
+
+        for response in responses:
+            assert response.status_code == 403
+            assert response.json() == {
+                "error": "Work log creation is disabled in Demo mode",
+                "log": None,
+            }
+        assert api.demo_rejection("worklog_create") is not api.demo_rejection(
+            "worklog_create"
+        )
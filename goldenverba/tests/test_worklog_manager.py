@@ -0,0 +1,180 @@
+"""
+Tests for worklog manager module.
+
+This module tests the work log CRUD helpers against a mocked Weaviate client.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from goldenverba.components.worklog_manager import (
+    WorkLogEntry,
+    WorkLogManager,
+    WorkLogNotFoundError,
+)
+from goldenverba.components.util import decode_keyset_cursor, next_keyset_cursor
+
+
+def make_weaviate_object(content="Did things", user_id="user_1", **props):
+    """Create a mock Weaviate object carrying work log properties."""
+    obj = MagicMock()
+    obj.uuid = uuid4()
+    obj.properties = {
+        "content": content,
+        "user_id": user_id,
+        "timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "extracted_skills": ["Python"],
+        "metadata": {"created_via": "api"},
+        **props,
+    }
+    return obj
+
+
+class TestWorkLogManager:
+    """Test suite for WorkLogManager class."""
+
+    @pytest.fixture
+    def worklog_manager(self):
+        """Create a WorkLogManager instance for testing."""
+        return WorkLogManager()
+
+    @pytest.fixture
+    def mock_collection(self):
+        """Create a mock Weaviate collection."""
+        collection = MagicMock()
+        collection.data = MagicMock()
+        collection.query = MagicMock()
+        return collection
+
+    @pytest.fixture
+    def mock_client(self, mock_collection):
+        """Create a mock Weaviate client returning the mock collection."""
+        client = AsyncMock()
+        client.collections = MagicMock()
+        client.collections.exists = AsyncMock(return_value=True)
+        client.collections.get = MagicMock(return_value=mock_collection)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_create_log_entries_batches_insert(
+        self, worklog_manager, mock_client, mock_collection
+    ):
+        """Test that entries are stored with one insert_many call."""
+        response = MagicMock()
+        response.has_errors = True
+        response.errors = {1: "failed"}
+        mock_collection.data.insert_many = AsyncMock(return_value=response)
+
+        created = await worklog_manager.create_log_entries(
+            mock_client,
+            [
+                {"content": "first", "user_id": "user_1"},
+                {"content": "second"},
+            ],
+        )
+
+        assert created == 1
+        objects = mock_collection.data.insert_many.call_args.args[0]
+        assert [obj.properties["content"] for obj in objects] == ["first", "second"]
+        assert objects[1].properties["user_id"] == "default_user"
+
+    def test_bulk_import_without_entries(self, worklog_manager):
+        """Test that an empty bulk import does not start any workers."""
+        assert worklog_manager.bulk_import([], "Local", "", "") == 0
+
+    @pytest.mark.asyncio
+    async def test_update_log_entry_sends_partial_update(
+        self, worklog_manager, mock_client, mock_collection
+    ):
+        """Test that only changed fields are sent and the result is not re-fetched."""
+        existing = make_weaviate_object(content="old")
+        mock_collection.query.fetch_object_by_id = AsyncMock(return_value=existing)
+        mock_collection.data.update = AsyncMock()
+
+        entry = await worklog_manager.update_log_entry(
+            mock_client, str(existing.uuid), content="new"
+        )
+
+        mock_collection.data.update.assert_called_once_with(
+            uuid=existing.uuid, properties={"content": "new"}
+        )
+        mock_collection.query.fetch_object_by_id.assert_called_once()
+        assert entry.content == "new"
+        assert entry.user_id == "user_1"
+        assert entry.extracted_skills == ["Python"]
+        assert entry.id == str(existing.uuid)
+
+    @pytest.mark.asyncio
+    async def test_update_log_entry_with_prior_skips_fetch(
+        self, worklog_manager, mock_client, mock_collection
+    ):
+        """Test that passing the prior entry avoids any read round-trip."""
+        prior = WorkLogEntry(content="old", user_id="user_1", entry_id=str(uuid4()))
+        mock_collection.query.fetch_object_by_id = AsyncMock()
+        mock_collection.data.update = AsyncMock()
+
+        entry = await worklog_manager.update_log_entry(
+            mock_client, prior.id, extracted_skills=["Go"], prior=prior
+        )
+
+        mock_collection.query.fetch_object_by_id.assert_not_called()
+        assert entry.content == "old"
+        assert entry.extracted_skills == ["Go"]
+
+    @pytest.mark.asyncio
+    async def test_get_log_entries_resumes_from_cursor(
+        self, worklog_manager, mock_client, mock_collection
+    ):
+        """Test that a cursor seeks past the last row instead of using offset."""
+        objects = [make_weaviate_object(content=f"entry {i}") for i in range(2)]
+        cursor = next_keyset_cursor(
+            [(datetime(2024, 1, 1, tzinfo=timezone.utc), str(uuid4()))]
+        )
+        response = MagicMock()
+        response.objects = objects
+        mock_collection.query.fetch_objects = AsyncMock(return_value=response)
+
+        entries = await worklog_manager.get_log_entries(
+            mock_client, limit=2, offset=40, cursor=cursor
+        )
+
+        assert [entry.content for entry in entries] == ["entry 0", "entry 1"]
+        kwargs = mock_collection.query.fetch_objects.call_args.kwargs
+        assert kwargs["limit"] == 2
+        assert kwargs["offset"] == 0
+        assert kwargs["filters"] is not None
+
+    def test_next_cursor_keeps_only_the_last_row(self):
+        """Test that the cursor is a single (timestamp, id) pair however many rows tie."""
+        timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        cursor = next_keyset_cursor([(timestamp, "a"), (timestamp, "b")])
+
+        assert decode_keyset_cursor(cursor) == (timestamp, "b")
+        assert next_keyset_cursor([]) is None
+
+    @pytest.mark.asyncio
+    async def test_update_log_entry_not_found(
+        self, worklog_manager, mock_client, mock_collection
+    ):
+        """Test that updating a missing entry raises a not found error."""
+        mock_collection.query.fetch_object_by_id = AsyncMock(return_value=None)
+
+        with pytest.raises(WorkLogNotFoundError, match="not found"):
+            await worklog_manager.update_log_entry(
+                mock_client, str(uuid4()), content="new"
+            )
+
+
+class TestWorkLogEntry:
+    """Test suite for WorkLogEntry dataclass."""
+
+    def test_entry_uses_slots_and_defaults(self):
+        """Test that entries are slotted and fill in their defaults."""
+        entry = WorkLogEntry(content="Reviewed PRs", user_id="user_1")
+
+        assert not hasattr(entry, "__dict__")
+        assert entry.id
+        assert entry.extracted_skills == []
+        assert entry.metadata == {"created_via": "api"}
@@ -10,6 +10,7 @@ import asyncio
 
 from copy import deepcopy
 import hashlib
+import secrets
 
 from goldenverba.server.helpers import LoggerManager
 from weaviate.client import WeaviateAsyncClient
@@ -29,11 +30,14 @@ from goldenverba.components.managers import (
     RetrieverManager,
     GeneratorManager,
     WeaviateManager,
+    WEAVIATE_POOL_CONNECTIONS,
+    WEAVIATE_POOL_MAXSIZE,
 )
 from goldenverba.components.schema_extensions import SchemaExtensions
 from goldenverba.components.worklog_manager import WorkLogManager
 from goldenverba.components.skills_extractor import SkillsExtractor
 from goldenverba.components.resume_generator import ResumeGenerator
+from goldenverba.components.conversation_manager import create_session_store
 from goldenverba.components.resume_tracker import ResumeTracker
 
 load_dotenv()
@@ -54,7 +58,8 @@ class VerbaManager:
         # Initialize new resume-specific managers
         self.worklog_manager = WorkLogManager()
         self.skills_extractor = SkillsExtractor()
-        self.resume_generator = ResumeGenerator()
+        self.session_store = create_session_store()
+        self.resume_generator = ResumeGenerator(session_store=self.session_store)
         self.resume_tracker = ResumeTracker()
         
         self.rag_config_uuid = "e0adcc12-9bad-4588-8a1e-bab0af6ed485"
@@ -998,11 +1003,65 @@ class VerbaManager:
             # Don't fail the entire import if skill extraction fails
             pass
     
+    async def _extract_document_skills(
+        self,
+        client: WeaviateAsyncClient,
+        doc_data: dict,
+        generator_config: dict
+    ) -> dict | None:
+        """
+        Extract and categorize skills from one document's chunks.
+        
+        Returns:
+            dict | None: Skills grouped by category, or None if the document
+            was skipped for having too little text
+        """
+        doc_uuid = doc_data.get("uuid", "")
+        doc_title = doc_data.get("title", "Unknown")
+        
+        msg.info(f"Processing document: {doc_title}")
+        
+        # Get chunks for this document to extract text
+        chunks_data = await self.weaviate_manager.get_chunks(
+            client=client,
+            uuid=doc_uuid,
+            page=1,  # 1-indexed
+            pageSize=50  # Get first 50 chunks
+        )
+        
+        if not chunks_data or len(chunks_data) == 0:
+            msg.info(f"Skipping {doc_title} - no chunks found")
+            return None
+        
+        msg.info(f"Found {len(chunks_data)} chunks for {doc_title}")
+        
+        # Combine chunk texts (chunks use 'content' field, not 'text')
+        doc_text = " ".join([
+            chunk.get("content", "") 
+            for chunk in chunks_data 
+            if chunk.get("content")
+        ])
+        
+        if not doc_text or len(doc_text) < 50:
+            msg.info(f"Skipping {doc_title} - insufficient text (length: {len(doc_text)})")
+            return None
+        
+        # Extract skills
+        skills = await self.skills_extractor.extract_skills(
+            client=client,
+            text=doc_text[:5000],  # Limit to avoid token limits
+            generator_config=generator_config,
+            use_cache=True
+        )
+        
+        return self.skills_extractor.categorize_skills(skills) if skills else {}
+    
     async def extract_skills_from_all_documents(
         self,
         client: WeaviateAsyncClient,
         generator_config: dict,
-        limit: int = 100
+        limit: int = 100,
+        max_concurrency: int = 8
     ) -> dict:
         """
         Extract skills from all existing documents in the database.
@@ -1011,6 +1070,7 @@ class VerbaManager:
             client: Weaviate async client
             generator_config: Configuration for the LLM generator
             limit: Maximum number of documents to process
+            max_concurrency: Maximum number of documents extracted at once
             
         Returns:
             dict: Summary of extraction results
@@ -1045,72 +1105,53 @@ class VerbaManager:
                     "message": "No documents found"
                 }
             
+            # Chunk fetches and LLM calls are I/O bound, so run several
+            # documents at once; the semaphore caps load on the LLM provider
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def extract_with_limit(doc_data: dict):
+                async with semaphore:
+                    return await self._extract_document_skills(
+                        client, doc_data, generator_config
+                    )
+            
+            results = await asyncio.gather(
+                *[extract_with_limit(doc_data) for doc_data in documents],
+                return_exceptions=True
+            )
+            
             total_skills = 0
             processed_docs = 0
             failed_docs = []
             
-            for doc_data in documents:
-                try:
-                    doc_uuid = doc_data.get("uuid", "")
-                    doc_title = doc_data.get("title", "Unknown")
-                    
-                    msg.info(f"Processing document: {doc_title}")
-                    
-                    # Get chunks for this document to extract text
-                    chunks_data = await self.weaviate_manager.get_chunks(
-                        client=client,
-                        uuid=doc_uuid,
-                        page=1,  # 1-indexed
-                        pageSize=50  # Get first 50 chunks
-                    )
-                    
-                    if not chunks_data or len(chunks_data) == 0:
-                        msg.info(f"Skipping {doc_title} - no chunks found")
-                        continue
-                    
-                    msg.info(f"Found {len(chunks_data)} chunks for {doc_title}")
-                    
-                    # Combine chunk texts (chunks use 'content' field, not 'text')
-                    doc_text = " ".join([
-                        chunk.get("content", "") 
-                        for chunk in chunks_data 
-                        if chunk.get("content")
-                    ])
-                    
-                    if not doc_text or len(doc_text) < 50:
-                        msg.info(f"Skipping {doc_title} - insufficient text (length: {len(doc_text)})")
-                        continue
-                    
-                    # Extract skills
-                    skills = await self.skills_extractor.extract_skills(
-                        client=client,
-                        text=doc_text[:5000],  # Limit to avoid token limits
-                        generator_config=generator_config,
-                        use_cache=True
-                    )
-                    
-                    if skills:
-                        # Categorize and store skills
-                        categorized_skills = self.skills_extractor.categorize_skills(skills)
-                        
-                        for category, skill_names in categorized_skills.items():
-                            for skill_name in skill_names:
-                                try:
-                                    await self.skills_extractor.store_or_update_skill(
-                                        client=client,
-                                        skill_name=skill_name,
-                                        category=category,
-                                        source_document_id=doc_uuid
-                                    )
-                                    total_skills += 1
-                                except Exception as e:
-                                    msg.warn(f"Failed to store skill {skill_name}: {str(e)}")
-                    
-                    processed_docs += 1
-                    
-                except Exception as e:
-                    msg.warn(f"Failed to process document {doc_title}: {str(e)}")
+            # Store skills one document at a time, since store_or_update_skill
+            # is a read-modify-write and documents often share skills
+            for doc_data, categorized_skills in zip(documents, results):
+                doc_uuid = doc_data.get("uuid", "")
+                doc_title = doc_data.get("title", "Unknown")
+                
+                if isinstance(categorized_skills, Exception):
+                    msg.warn(f"Failed to process document {doc_title}: {str(categorized_skills)}")
                     failed_docs.append(doc_title)
+                    continue
+                
+                if categorized_skills is None:
+                    continue
+                
+                for category, skill_names in categorized_skills.items():
+                    for skill_name in skill_names:
+                        try:
+                            await self.skills_extractor.store_or_update_skill(
+                                client=client,
+                                skill_name=skill_name,
+                                category=category,
+                                source_document_id=doc_uuid
+                            )
+                            total_skills += 1
+                        except Exception as e:
+                            msg.warn(f"Failed to store skill {skill_name}: {str(e)}")
+                
+                processed_docs += 1
             
             result = {
                 "success": True,
@@ -1139,6 +1180,9 @@ class ClientManager:
         self.manager: VerbaManager = VerbaManager()
         self.max_time: int = 10
         self.locks: dict[str, asyncio.Lock] = {}
+        # session_id -> (cred_hash, credentials, port). Sessions live in this
+        # process only, so they need a single worker or sticky routing
+        self.sessions: dict[str, tuple[str, Credentials, str]] = {}
 
     def hash_credentials(self, credentials: Credentials) -> str:
         cred_string = f"{credentials.deployment}:{credentials.url}:{credentials.key}"
@@ -1154,14 +1198,44 @@ class ClientManager:
         for cred_hash, client in self.clients.items():
             msg.info(f"Client {cred_hash} connected at {client['timestamp']}")
 
-    async def get_client(self) -> WeaviateAsyncClient:
-        """Get or create a client with default credentials"""
-        default_credentials = Credentials(
+    def stats(self) -> dict:
+        """Summarize cached clients and their connection pool limits."""
+        now = datetime.now()
+        return {
+            "clients": len(self.clients),
+            "connected": sum(
+                1 for cached in self.clients.values() if cached["client"].is_connected()
+            ),
+            "sessions": len(self.sessions),
+            "max_idle_seconds": max(
+                [(now - cached["timestamp"]).total_seconds() for cached in self.clients.values()],
+                default=0,
+            ),
+            "idle_timeout_minutes": self.max_time,
+            "pool_connections": WEAVIATE_POOL_CONNECTIONS,
+            "pool_maxsize": WEAVIATE_POOL_MAXSIZE,
+        }
+
+    def default_credentials(self) -> Credentials:
+        """Credentials used by endpoints that don't receive any"""
+        return Credentials(
             url=os.environ.get("WEAVIATE_URL_VERBA", ""),
             key=os.environ.get("WEAVIATE_API_KEY_VERBA", ""),
             deployment="Local"
         )
-        return await self.connect(default_credentials)
+
+    async def get_client(self) -> WeaviateAsyncClient:
+        """Get or create a client with default credentials"""
+        return await self.connect(self.default_credentials())
+
+    def get_live_client(self, cred_hash: str) -> WeaviateAsyncClient | None:
+        """Return the cached client for cred_hash if it is still connected."""
+        cached = self.clients.get(cred_hash)
+        # is_connected() is a local check, so reuse costs no round-trip
+        if cached is None or not cached["client"].is_connected():
+            return None
+        cached["timestamp"] = datetime.now()
+        return cached["client"]
 
     async def connect(
         self, credentials: Credentials, port: str = "8080"
@@ -1175,30 +1249,73 @@ class ClientManager:
 
         cred_hash = self.hash_credentials(_credentials)
 
+        # One client multiplexes concurrent requests over its own HTTP/gRPC
+        # pool, so a live cached client is returned without taking the lock;
+        # only (re)connecting is serialized per credentials
+        client = self.get_live_client(cred_hash)
+        if client is not None:
+            return client
+
         lock = self.get_or_create_lock(cred_hash)
         async with lock:
+            # Another request may have connected while this one waited
+            client = self.get_live_client(cred_hash)
+            if client is not None:
+                return client
             if cred_hash in self.clients:
-                msg.info("Found existing Client")
-                return self.clients[cred_hash]["client"]
-            else:
-                msg.warn("Connecting new Client")
-                try:
-                    client = await self.manager.connect(_credentials, port)
-                    if client:
-                        self.clients[cred_hash] = {
-                            "client": client,
-                            "timestamp": datetime.now(),
-                        }
-                        return client
-                    else:
-                        raise Exception("Client not created")
-                except Exception as e:
-                    raise e
+                cached = self.clients[cred_hash]
+                msg.warn("Cached Client disconnected, reconnecting")
+                await self.manager.disconnect(cached["client"])
+                del self.clients[cred_hash]
+
+            msg.warn("Connecting new Client")
+            try:
+                client = await self.manager.connect(_credentials, port)
+                if client:
+                    self.clients[cred_hash] = {
+                        "client": client,
+                        "timestamp": datetime.now(),
+                    }
+                    return client
+                else:
+                    raise Exception("Client not created")
+            except Exception as e:
+                raise e
+
+    async def create_session(
+        self, credentials: Credentials, port: str = "8080"
+    ) -> str:
+        """Connect once and return an opaque session id for later requests."""
+        await self.connect(credentials, port)
+        session_id = secrets.token_urlsafe(32)
+        self.sessions[session_id] = (
+            self.hash_credentials(credentials),
+            credentials,
+            port,
+        )
+        return session_id
+
+    async def connect_session(self, session_id: str) -> WeaviateAsyncClient:
+        """Resolve a session id to its client without re-hashing credentials."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise Exception("Unknown session")
+        cred_hash, credentials, port = session
+        client = self.get_live_client(cred_hash)
+        if client is not None:
+            return client
+        # Client was evicted or dropped, reconnect with the stored credentials
+        return await self.connect(credentials, port)
+
+    def delete_session(self, session_id: str) -> bool:
+        """Forget a session id. Returns False if it was unknown."""
+        return self.sessions.pop(session_id, None) is not None
 
     async def disconnect(self):
         msg.warn("Disconnecting Clients!")
         for cred_hash, client in self.clients.items():
             await self.manager.disconnect(client["client"])
+        self.clients.clear()
 
     async def clean_up(self):
         msg.info("Cleaning Clients Cache")
@@ -1209,6 +1326,7 @@ class ClientManager:
             time_difference = current_time - client_data["timestamp"]
             if time_difference.total_seconds() / 60 > self.max_time:
                 clients_to_remove.append(cred_hash)
+                continue
             client: WeaviateAsyncClient = client_data["client"]
             if not await client.is_ready():
                 clients_to_remove.append(cred_hash)
@@ -1218,5 +1336,17 @@ class ClientManager:
             del self.clients[cred_hash]
             msg.warn(f"Removed client: {cred_hash}")
 
-        msg.info(f"Cleaned up {len(clients_to_remove)} clients")
+        # Sessions expire with their client instead of reconnecting it
+        sessions_to_remove = [
+            session_id
+            for session_id, (cred_hash, _, _) in self.sessions.items()
+            if cred_hash not in self.clients
+        ]
+        for session_id in sessions_to_remove:
+            del self.sessions[session_id]
+
+        msg.info(
+            f"Cleaned up {len(clients_to_remove)} clients and "
+            f"{len(sessions_to_remove)} sessions"
+        )
         self.heartbeat()
@@ -29,6 +29,7 @@ setup(
         "openpyxl==3.1.5",
         "wasabi==1.1.2",
         "fastapi==0.111.1",
+        "orjson==3.10.6",
         "uvicorn[standard]==0.29.0",
         "gunicorn==22.0.0",
         "click==8.1.7",
@@ -51,12 +52,22 @@ setup(
         "markdown==3.5.2",
     ],
     extras_require={
-        "dev": ["pytest", "wheel", "twine", "black>=23.7.0", "setuptools"],
+        "dev": [
+            "pytest",
+            "wheel",
+            "twine",
+            "black>=23.7.0",
+            "setuptools",
+            "pyinstrument>=4.6.0",
+        ],
         "google": [
             "vertexai==1.46.0",
         ],
         "huggingface": [
             "sentence-transformers==3.0.1",
         ],
+        "redis": [
+            "redis>=5.0.0",
+        ],
     },
 )